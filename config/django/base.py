@@ -143,6 +143,12 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = "users.User"
 
+# ModelBackend stays listed, so sessions logged in with it still work
+AUTHENTICATION_BACKENDS = [
+    "src.authentication.backends.CachedModelBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.0/topics/i18n/
@@ -194,6 +200,7 @@ FE_EMAIL_ACTIVATE_URL = env("FE_EMAIL_ACTIVATE_URL", default="email-activation")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+from config.settings.cache import *  # noqa
 from config.settings.celery import *  # noqa
 from config.settings.cors import *  # noqa
 from config.settings.email_sending import *  # noqa
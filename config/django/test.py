@@ -14,3 +14,7 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     }
 }
+
+# The tests run in a single process, its memory cache is shared by every request
+AUTH_USER_CACHE_TIMEOUT = 60
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
@@ -0,0 +1,26 @@
+from config.env import env
+
+# Any Redis compatible store, e.g. redis://localhost:6379/0, without it every process has its own memory cache
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Entries are never stale, see src/api/response_cache.py, the timeout only evicts those of old versions
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=60 * 60)
+
+# Users of authenticated requests, deleted from the cache on every save, e.g. logouts and password changes.
+# 0 reads them from the database instead, the default without Redis: a process memory cache is only invalidated
+# in the process saving the user, the others would keep accepting revoked tokens and sessions
+AUTH_USER_CACHE_TIMEOUT = env.int("AUTH_USER_CACHE_TIMEOUT", default=60 if REDIS_URL else 0)
@@ -1,4 +1,5 @@
 from config.env import env
+from config.settings.cache import REDIS_URL
 
 """
 Do read:
@@ -6,6 +7,12 @@ Do read:
     1. https://docs.djangoproject.com/en/3.1/ref/settings/#sessions
     2. https://developer.mozilla.org/en-US/docs/Web/HTTP/Cookies
 """
+# With Redis sessions are read from the cache, the database is the fallback of evicted ones.
+# Not from a process memory cache, logouts would only end the session in the process handling them
+SESSION_ENGINE = env(
+    "SESSION_ENGINE",
+    default="django.contrib.sessions.backends.cached_db" if REDIS_URL else "django.contrib.sessions.backends.db",
+)
 SESSION_COOKIE_AGE = env.int("SESSION_COOKIE_AGE", default=1209600)  # Default - 2 weeks in seconds
 SESSION_COOKIE_HTTPONLY = env.bool("SESSION_COOKIE_HTTPONLY", default=True)
 SESSION_COOKIE_NAME = env("SESSION_COOKIE_NAME", default="sessionid")
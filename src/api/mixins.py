@@ -3,10 +3,13 @@ from typing import TYPE_CHECKING, Sequence, Type
 
 from django.conf import settings
 from django.contrib import auth
+from rest_framework import exceptions
 from rest_framework.authentication import BaseAuthentication, SessionAuthentication
 from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from src.users.selectors import user_get_cached
+
 
 def get_auth_header(headers):
     value = headers.get("Authorization")
@@ -60,6 +63,22 @@ class CsrfExemptedSessionAuthentication(SessionAuthentication):
         return
 
 
+class CachedJSONWebTokenAuthentication(JSONWebTokenAuthentication):
+    """
+    Reads the user of the token from the cache, see user_get_cached, the secret key of the token comes from
+    the cached user as well, see auth_jwt_decode_token.
+    """
+
+    def authenticate_credentials(self, payload):
+        user = user_get_cached(user_id=payload.get("user_id"))
+        if user is None or user.get_username() != self.jwt_get_username_from_payload(payload):
+            raise exceptions.AuthenticationFailed("Invalid token.")
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed("User account is disabled.")
+
+        return user
+
+
 if TYPE_CHECKING:
     # This is going to be resolved in the stub library
     # https://github.com/typeddjango/djangorestframework-stubs/
@@ -74,6 +93,6 @@ class ApiAuthMixin:
     authentication_classes: Sequence[Type[BaseAuthentication]] = [
         CsrfExemptedSessionAuthentication,
         SessionAsHeaderAuthentication,
-        JSONWebTokenAuthentication,
+        CachedJSONWebTokenAuthentication,
     ]
     permission_classes: PermissionClassesType = (IsAuthenticated,)
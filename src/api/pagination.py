@@ -1,7 +1,18 @@
+import base64
+import json
 from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional
 
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
+from rest_framework.pagination import _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
@@ -51,3 +62,140 @@ class LimitOffsetPagination(_LimitOffsetPagination):
                 ]
             )
         )
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination, pages continue after the last row of the previous page instead of an offset,
+    so deep pages cost the same as the first one and rows inserted meanwhile don't shift pages.
+
+    `ordering` must end with a unique field, the opaque cursor holds the ordering values of the last row.
+    values() querysets have to include the ordering fields.
+    Only forward pagination is supported.
+    """
+
+    page_size = 10
+    max_page_size = 50
+    page_size_query_param = "limit"
+    cursor_query_param = "cursor"
+    ordering: tuple[str, ...] = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None) -> Optional[list]:
+        return self.paginate_querysets([queryset], request, view=view)
+
+    def paginate_querysets(self, querysets: list[QuerySet], request, view=None) -> list:
+        """
+        Pages the union of disjoint querysets of the same model. The cursor, ordering and limit are applied
+        to each queryset, so each one reads at most a page through its own index,
+        the pages are then merged and limited again.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request, model=querysets[0].model)
+
+        rows: list = []
+        for queryset in querysets:
+            queryset = queryset.order_by(*self.ordering)
+            if cursor is not None:
+                queryset = queryset.filter(self._after_cursor_filter(cursor))
+            # One extra row tells whether there is a next page
+            rows += queryset[: self.page_size + 1]
+        if len(querysets) > 1:
+            self._sort_rows(rows)
+
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def decode_cursor(self, request, *, model: type[models.Model]) -> Optional[list[Any]]:
+        """
+        :return: ordering values of the cursor, checked against the type of their model field
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(cursor, list) or len(cursor) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            return [
+                self._decode_cursor_value(model._meta.get_field(field.lstrip("-")), value)
+                for field, value in zip(self.ordering, cursor)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _decode_cursor_value(field, value) -> Any:
+        """
+        Inverse of the encoding of encode_cursor, anything else is rejected instead of reaching the query.
+        """
+        if isinstance(field, models.DateTimeField):
+            if not isinstance(value, str):
+                raise TypeError(value)
+            return datetime.fromisoformat(value)
+        if isinstance(field, models.IntegerField):
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(value)
+            return value
+        return field.to_python(value)
+
+    def encode_cursor(self, row) -> str:
+        values = [self._row_value(row, field.lstrip("-")) for field in self.ordering]
+        values = [value.isoformat() if hasattr(value, "isoformat") else value for value in values]
+        return base64.urlsafe_b64encode(json.dumps(values).encode("ascii")).decode("ascii")
+
+    @staticmethod
+    def _row_value(row, name: str) -> Any:
+        # Rows are model instances or dicts of values() querysets
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+    def _sort_rows(self, rows: list):
+        # Stable sorts from the last ordering field to the first, each one in the direction of its field
+        for field in reversed(self.ordering):
+            rows.sort(key=lambda row: self._row_value(row, field.lstrip("-")), reverse=field.startswith("-"))
+
+    def _after_cursor_filter(self, cursor: list[Any]) -> Q:
+        """
+        Row comparison (a, b) > (x, y) spelled out as a > x OR (a = x AND b > y),
+        with each comparison following the direction of its ordering field.
+        """
+        condition = Q()
+        for position, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = f"{name}__lt" if field.startswith("-") else f"{name}__gt"
+            equal_before = {self.ordering[i].lstrip("-"): cursor[i] for i in range(position)}
+            condition |= Q(**equal_before, **{lookup: cursor[position]})
+        return condition
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("limit", self.page_size),
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
@@ -0,0 +1,52 @@
+"""
+Server side cache of the response data of read endpoints, in the default cache of Django's cache framework.
+
+Keys contain the version of the data, e.g. Team.version, so changes never need an invalidation and nothing stale
+is served. Entries of old versions are left to expire after RESPONSE_CACHE_TIMEOUT.
+"""
+import hashlib
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+
+HITS_KEY = "response_cache:hits"
+MISSES_KEY = "response_cache:misses"
+
+
+def cached_response_data(request: Request, *, version: str, get_data: Callable[[], Any]) -> Any:
+    """
+    :param version: changes whenever the data of the resource changes
+    :param get_data: data of the response, only called on cache misses
+    """
+    query = sorted(request.query_params.lists())
+    key = "response:" + hashlib.md5(f"{request.path}|{query}|{version}".encode()).hexdigest()
+
+    data = cache.get(key)
+    if data is not None:
+        _increment(HITS_KEY)
+        return data
+
+    _increment(MISSES_KEY)
+    data = get_data()
+    cache.set(key, data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+    return data
+
+
+def response_cache_stats() -> dict[str, int]:
+    return {"hits": cache.get(HITS_KEY, 0), "misses": cache.get(MISSES_KEY, 0)}
+
+
+def response_cache_stats_reset():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+def _increment(key: str):
+    # A single incr() in the common case, it's atomic in Redis, so concurrent requests don't lose counts
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Missing, add() only sets it if no concurrent request did meanwhile
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
@@ -0,0 +1,99 @@
+import base64
+import json
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from src.api.pagination import KeysetPagination, get_paginated_response
+from src.users.models import User
+from src.users.services import user_create
+
+
+class ExampleListApi(APIView):
+    class Pagination(KeysetPagination):
+        page_size = 2
+
+    class OutputSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = User
+            fields = ("id", "email")
+
+    def get(self, request):
+        return get_paginated_response(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=User.objects.all(),
+            request=request,
+            view=self,
+        )
+
+
+class ExampleSplitListApi(APIView):
+    def get(self, request):
+        paginator = ExampleListApi.Pagination()
+        users = User.objects.values("id", "created_at")
+        # Disjoint halves paged together, as if the list was their union
+        page = paginator.paginate_querysets([users.filter(is_admin=True), users.filter(is_admin=False)], request)
+        return paginator.get_paginated_response([user["id"] for user in page])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+        # Same created_at for all users, so pages are split by the id tie breaker
+        created_at = timezone.now()
+        self.users = [user_create(email=f"user{i}@hacksoft.io") for i in range(5)]
+        User.objects.update(created_at=created_at)
+
+    def test_pages_follow_ordering_without_gaps(self):
+        listed_ids = []
+        url = "/some/path"
+        while url:
+            response = ExampleListApi.as_view()(self.factory.get(url))
+            self.assertEqual(2, response.data["limit"])
+            listed_ids += [user["id"] for user in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(sorted((user.id for user in self.users), reverse=True), listed_ids)
+
+    def test_disjoint_querysets_are_paged_together(self):
+        User.objects.filter(id__in=[self.users[1].id, self.users[2].id]).update(is_admin=True)
+
+        listed_ids = []
+        url = "/some/path"
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = ExampleSplitListApi.as_view()(self.factory.get(url))
+            # Each queryset reads at most a page and the extra row on its own
+            self.assertEqual(2, len(ctx.captured_queries))
+            self.assertTrue(all("LIMIT 3" in query["sql"] for query in ctx.captured_queries))
+            listed_ids += response.data["results"]
+            url = response.data["next"]
+
+        self.assertEqual(sorted((user.id for user in self.users), reverse=True), listed_ids)
+
+    def test_invalid_cursor(self):
+        response = ExampleListApi.as_view()(self.factory.get("/some/path?cursor=invalid"))
+
+        self.assertEqual(404, response.status_code)
+
+    def test_cursor_values_must_match_ordering_fields(self):
+        invalid_cursors = [
+            [{"a": 1}, 1],
+            ["notadate", "x"],
+            [timezone.now().isoformat(), "1"],
+            [timezone.now().isoformat(), True],
+            [1, 1],
+            [None, 1],
+        ]
+        for cursor in invalid_cursors:
+            encoded = base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+            response = ExampleListApi.as_view()(self.factory.get("/some/path", {"cursor": encoded}))
+
+            self.assertEqual(404, response.status_code, cursor)
@@ -1,4 +1,14 @@
+import hashlib
+from typing import Any, Callable
+
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from src.api.response_cache import cached_response_data
 
 
 def create_serializer_class(name, fields):
@@ -12,3 +22,23 @@ def inline_serializer(*, fields, data=None, **kwargs):
         return serializer_class(data=data, **kwargs)
 
     return serializer_class(**kwargs)
+
+
+def conditional_response(request: Request, *, version: str, get_data: Callable[[], Any]) -> HttpResponseBase:
+    """
+    Conditional GET, answers 304 Not Modified without calling get_data when the client has the current version.
+    Otherwise the data comes from the response cache, which is keyed by the version as well.
+
+    Only the ETag is validated. Last-Modified has a precision of a second, a change within the second of the
+    previous response would be answered with a stale 304.
+    :param version: changes whenever the data of the resource changes, e.g. a version counter of its rows
+    :param get_data: data of the response, only called when it's sent and not cached
+    """
+    # The path with the query string, so filtered lists of the same version have their own ETags
+    etag = quote_etag(hashlib.md5(f"{request.get_full_path()}|{version}".encode()).hexdigest())
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response(cached_response_data(request, version=version, get_data=get_data))
+
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from django.contrib.auth.backends import ModelBackend
+
+from src.users.models import User
+from src.users.selectors import user_get_cached
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend reading the users of sessions from the cache, see user_get_cached.
+    """
+
+    def get_user(self, user_id) -> Optional[User]:
+        user = user_get_cached(user_id=user_id)
+        return user if self.user_can_authenticate(user) else None
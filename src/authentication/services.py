@@ -1,13 +1,17 @@
 import uuid
 
+import jwt
 from django.conf import settings
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 from rest_framework.exceptions import ValidationError
+from rest_framework_jwt.compat import jwt_decode
+from rest_framework_jwt.settings import api_settings
 
 from src.users.models import User
+from src.users.selectors import user_get_cached
 from src.users.serializers import UserOutputSerializer
 from src.users.tokens import account_activation_token
 
@@ -16,6 +20,29 @@ def auth_user_get_jwt_secret_key(user: User) -> str:
     return str(user.jwt_key)
 
 
+def auth_jwt_decode_token(token: str) -> dict:
+    """
+    The default decode handler loads the user to get the secret key of its token, this one uses the cached user.
+    :raises jwt.InvalidTokenError: also when the user doesn't exist
+    """
+    unverified_payload = jwt_decode(token, key=None, verify=False)
+    user = user_get_cached(user_id=unverified_payload.get("user_id"))
+    if user is None:
+        raise jwt.InvalidTokenError("User doesn't exist.")
+
+    algorithms = api_settings.JWT_ALGORITHM
+    return jwt_decode(
+        token,
+        auth_user_get_jwt_secret_key(user),
+        verify=api_settings.JWT_VERIFY,
+        options={"verify_exp": api_settings.JWT_VERIFY_EXPIRATION},
+        leeway=api_settings.JWT_LEEWAY,
+        audience=api_settings.JWT_AUDIENCE,
+        issuer=api_settings.JWT_ISSUER,
+        algorithms=algorithms if isinstance(algorithms, list) else [algorithms],
+    )
+
+
 def auth_jwt_response_payload_handler(token, user=None, request=None, issued_at=None):
     """
     Default implementation. Add whatever suits you here.
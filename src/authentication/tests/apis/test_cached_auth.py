@@ -0,0 +1,83 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.users.models import User
+from src.users.services import user_change_password, user_create
+
+
+def _auth_queries(ctx: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"]
+        for query in ctx.captured_queries
+        if '"users_user"' in query["sql"] or '"django_session"' in query["sql"]
+    ]
+
+
+class CachedAuthTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.credentials = {"email": "test@futsal.io", "password": "password"}
+        self.user = user_create(**self.credentials)
+        self.me_url = reverse("api:authentication:me")
+
+    def _jwt_headers(self) -> dict:
+        response = APIClient().post(reverse("api:authentication:jwt:login"), self.credentials)
+        self.assertEqual(201, response.status_code)
+        token = response.data["token"]
+        return {"HTTP_AUTHORIZATION": f"{settings.JWT_AUTH_HEADER_PREFIX} {token}"}
+
+    def test_jwt_auth_reads_user_once(self):
+        headers = self._jwt_headers()
+
+        with CaptureQueriesContext(connection) as first_ctx:
+            self.assertEqual(200, self.client.get(self.me_url, **headers).status_code)
+        with CaptureQueriesContext(connection) as second_ctx:
+            self.assertEqual(200, self.client.get(self.me_url, **headers).status_code)
+
+        self.assertEqual(1, len(_auth_queries(first_ctx)))
+        self.assertEqual([], _auth_queries(second_ctx))
+
+    def test_session_auth_reads_neither_session_nor_user(self):
+        self.client.post(reverse("api:authentication:session:login"), self.credentials)
+        self.client.get(self.me_url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(200, self.client.get(self.me_url).status_code)
+
+        self.assertEqual([], _auth_queries(ctx))
+
+    def test_jwt_logout_invalidates_cached_key(self):
+        headers = self._jwt_headers()
+        self.assertEqual(200, self.client.get(self.me_url, **headers).status_code)
+
+        self.assertEqual(200, self.client.post(reverse("api:authentication:jwt:logout"), **headers).status_code)
+
+        self.assertEqual(403, APIClient().get(self.me_url, **headers).status_code)
+
+    def test_password_change_invalidates_cached_user(self):
+        self.client.post(reverse("api:authentication:session:login"), self.credentials)
+        self.assertEqual(200, self.client.get(self.me_url).status_code)
+
+        user_change_password(user=self.user, new_password="new-password")
+
+        # The session was authenticated with the old password
+        self.assertEqual(403, self.client.get(self.me_url).status_code)
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=0)
+    def test_jwt_key_is_read_from_database_without_shared_cache(self):
+        headers = self._jwt_headers()
+        self.assertEqual(200, self.client.get(self.me_url, **headers).status_code)
+
+        # Logout handled by another process, which can't delete the user from the memory cache of this one
+        cache.set(User.cache_key(self.user.id), User.objects.get(id=self.user.id))
+        User.objects.filter(id=self.user.id).update(jwt_key=uuid.uuid4())
+
+        self.assertEqual(403, self.client.get(self.me_url, **headers).status_code)
@@ -1,9 +1,83 @@
+from typing import Any, Optional
+
 from django.db import models
 from django.db.models.query import F, Q
 from django.utils import timezone
 
 
-class BaseModel(models.Model):
+class DirtyFieldsMixin(models.Model):
+    """
+    Saves of existing rows only write the fields changed since the instance was loaded or last saved,
+    instead of every column. Passing update_fields explicitly bypasses the tracking.
+
+    Values are compared with !=, so in place changes of mutable values (e.g. a dict of a JSONField) aren't detected.
+    Fields saved with an expression, e.g. F("coins") + 1, stay dirty until refresh_from_db loads their value.
+    """
+
+    _loaded_values: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        # The reloaded fields hold the values of the database again
+        self._store_loaded_values(fields)
+
+    def get_dirty_fields(self) -> list[str]:
+        """
+        :return: names of the concrete fields changed since the instance was loaded, every field of new instances
+        """
+        concrete_fields = [field for field in self._meta.fields if not field.primary_key]
+        if self._loaded_values is None:
+            return [field.name for field in concrete_fields]
+
+        dirty_fields = []
+        for field in concrete_fields:
+            if field.attname in self._loaded_values:
+                if getattr(self, field.attname) != self._loaded_values[field.attname]:
+                    dirty_fields.append(field.name)
+            # Deferred when loaded, but assigned since
+            elif field.attname in self.__dict__:
+                dirty_fields.append(field.name)
+        return dirty_fields
+
+    def save(self, *args, **kwargs):
+        tracked = not args and kwargs.get("update_fields") is None and not kwargs.get("force_insert")
+        if tracked and not self._state.adding and self.pk is not None and self._loaded_values is not None:
+            dirty_fields = self.get_dirty_fields()
+            # auto_now fields are only set when saved, so they would never be dirty
+            auto_now_fields = [field.name for field in self._meta.fields if getattr(field, "auto_now", False)]
+            kwargs["update_fields"] = dirty_fields + auto_now_fields if dirty_fields else []
+
+        super().save(*args, **kwargs)
+        self._store_loaded_values(kwargs.get("update_fields"))
+
+    def _store_loaded_values(self, update_fields: Optional[list[str]]):
+        fields = list(self._meta.fields)
+        if update_fields is not None:
+            fields = [field for field in fields if field.name in update_fields or field.attname in update_fields]
+        deferred_fields = self.get_deferred_fields()
+        loaded_values = dict(self._loaded_values or {})
+        for field in fields:
+            if field.attname in deferred_fields:
+                continue
+            value = getattr(self, field.attname)
+            if hasattr(value, "resolve_expression"):
+                # Only the database knows the value, the field is dirty until refreshed
+                loaded_values.pop(field.attname, None)
+            else:
+                loaded_values[field.attname] = value
+        self._loaded_values = loaded_values
+
+    class Meta:
+        abstract = True
+
+
+class BaseModel(DirtyFieldsMixin, models.Model):
     created_at = models.DateTimeField(db_index=True, default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
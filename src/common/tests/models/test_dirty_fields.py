@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models.functions import Upper
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from src.common.factories import RandomModelFactory, SimpleModelFactory
+from src.common.models import RandomModel, SimpleModel
+
+
+class DirtyFieldsMixinTests(TestCase):
+    def test_loaded_instance_has_no_dirty_fields(self):
+        instance = RandomModel.objects.get(id=RandomModelFactory().id)
+
+        self.assertEqual([], instance.get_dirty_fields())
+
+    def test_save_writes_only_changed_fields(self):
+        instance = RandomModel.objects.get(id=RandomModelFactory().id)
+        instance.end_date += timedelta(days=1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            instance.save()
+
+        self.assertEqual(1, len(ctx.captured_queries))
+        update_sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"end_date"', update_sql)
+        self.assertIn('"updated_at"', update_sql)
+        self.assertNotIn('"start_date"', update_sql)
+        self.assertNotIn('"created_at"', update_sql)
+        instance.refresh_from_db()
+        self.assertEqual([], instance.get_dirty_fields())
+
+    def test_save_without_changes_skips_query(self):
+        instance = SimpleModel.objects.get(id=SimpleModelFactory().id)
+
+        with self.assertNumQueries(0):
+            instance.save()
+
+    def test_saved_values_are_clean(self):
+        instance = SimpleModelFactory()
+        instance.name = "First"
+        instance.save()
+
+        self.assertEqual([], instance.get_dirty_fields())
+        instance.name = "Second"
+        self.assertEqual(["name"], instance.get_dirty_fields())
+
+    def test_assigned_deferred_field_is_dirty(self):
+        instance = SimpleModel.objects.only("id").get(id=SimpleModelFactory().id)
+        instance.name = "Changed"
+
+        instance.save()
+
+        self.assertEqual("Changed", SimpleModel.objects.get(id=instance.id).name)
+
+    def test_refresh_from_db_reloads_loaded_values(self):
+        instance = SimpleModel.objects.get(id=SimpleModelFactory(name="A").id)
+        SimpleModel.objects.filter(id=instance.id).update(name="B")
+
+        instance.refresh_from_db()
+        instance.name = "A"
+        instance.save()
+
+        self.assertEqual("A", SimpleModel.objects.get(id=instance.id).name)
+
+    def test_refresh_from_db_of_some_fields(self):
+        instance = RandomModel.objects.get(id=RandomModelFactory().id)
+        RandomModel.objects.filter(id=instance.id).update(end_date=instance.end_date + timedelta(days=1))
+
+        instance.refresh_from_db(fields=["end_date"])
+
+        self.assertEqual([], instance.get_dirty_fields())
+
+    def test_expression_values_are_not_stored_as_loaded(self):
+        instance = SimpleModel.objects.get(id=SimpleModelFactory(name="lower").id)
+        instance.name = Upper("name")
+        instance.save()
+
+        # Only the database knows the saved value
+        self.assertEqual(["name"], instance.get_dirty_fields())
+        instance.refresh_from_db()
+        self.assertEqual("LOWER", instance.name)
+        self.assertEqual([], instance.get_dirty_fields())
@@ -0,0 +1,50 @@
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from src.api.mixins import ApiAuthMixin
+from src.api.pagination import KeysetPagination, get_paginated_response
+from src.futsal_sim.models import RankingMetric
+from src.futsal_sim.serializers import TeamRankingOutputSerializer
+from src.futsal_sim.services.ranking_service import leaderboard_list, team_rankings
+from src.futsal_sim.services.team_service import TeamCRUDService
+
+
+class LeaderboardApi(ApiAuthMixin, APIView):
+    class Pagination(KeysetPagination):
+        ordering = ("rank",)
+
+    class FilterSerializer(serializers.Serializer):
+        metric = serializers.ChoiceField(choices=RankingMetric.choices, default=RankingMetric.WINS)
+
+    def get(self, request: Request):
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        rankings = leaderboard_list(metric=filters_serializer.validated_data["metric"])
+        return get_paginated_response(
+            pagination_class=self.Pagination,
+            serializer_class=TeamRankingOutputSerializer,
+            queryset=rankings,
+            request=request,
+            view=self,
+        )
+
+
+# View is nested in team/<pk> resource
+class TeamRankApi(ApiAuthMixin, APIView):
+    class OutputSerializer(serializers.Serializer):
+        rank = serializers.IntegerField()
+        value = serializers.FloatField()
+
+    def get(self, request: Request, team_id: int):
+        team = TeamCRUDService(user=request.user).team_retrieve(team_id=team_id)
+        rankings = team_rankings(team)
+
+        return Response(
+            {
+                metric: self.OutputSerializer(rankings[metric]).data if metric in rankings else None
+                for metric in RankingMetric.values
+            }
+        )
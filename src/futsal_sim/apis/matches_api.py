@@ -1,16 +1,34 @@
 from rest_framework import serializers, status
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
 
 from src.api.mixins import ApiAuthMixin
+from src.api.pagination import KeysetPagination
+from src.futsal_sim.constants import MAX_BATCH_MATCH_AMOUNT
 from src.futsal_sim.models import TeamSheet
+from src.futsal_sim.row_serializers import (
+    match_result_short_representation,
+    match_result_short_values,
+)
 from src.futsal_sim.serializers import (
+    MatchJobOutputSerializer,
+    MatchResultNormalizedOutputSerializer,
     MatchResultOutputSerializer,
-    MatchResultShortOutputSerializer,
+    team_skills_context,
+)
+from src.futsal_sim.services.match_job_service import (
+    match_job_create,
+    match_job_retrieve,
 )
 from src.futsal_sim.services.match_result_service import MatchResultReadService
-from src.futsal_sim.services.match_service import play_match_against_cpu
+from src.futsal_sim.services.match_service import (
+    play_match_against_cpu,
+    play_matches_against_cpu,
+    summarize_matches,
+)
 from src.futsal_sim.services.team_service import TeamCRUDService
 from src.futsal_sim.services.teamsheet_service import (
     TeamSheetCRUDService,
@@ -21,10 +39,15 @@ from src.futsal_sim.services.teamsheet_service import (
 
 
 class MatchApi(ApiAuthMixin, ViewSet):
+    class Pagination(KeysetPagination):
+        ordering = ("-date", "-id")
+
     def create(self, request: Request, team_pk: str):
         class InputSerializer(serializers.Serializer):
             difficulty_rating = serializers.IntegerField(min_value=1, max_value=10)
             team_sheet = serializers.PrimaryKeyRelatedField(queryset=TeamSheet.objects.filter(team_id=team_pk))
+            # Plays the match in a celery worker, the response is the job to poll, see MatchJobApi
+            run_async = serializers.BooleanField(required=False, default=False)
 
         serializer = InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -32,20 +55,83 @@ class MatchApi(ApiAuthMixin, ViewSet):
         team_sheet = TeamSheetCRUDService(team=team).teamsheet_retrieve(teamsheet_id=serializer.data["team_sheet"])
 
         validate_teamsheet_can_play_match(team_sheet)
+        if serializer.data["run_async"]:
+            job = match_job_create(team_sheet=team_sheet, difficulty_rating=serializer.data["difficulty_rating"])
+            return Response(MatchJobOutputSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
         match_result = play_match_against_cpu(
             player_team_sheet=team_sheet, difficulty_rating=serializer.data["difficulty_rating"]
         )
-        output_serializer = MatchResultOutputSerializer(match_result)
+        # Fetched again with the whole graph the serializer walks
+        match_result = MatchResultReadService(team=team, user=request.user).match_retrieve(match_id=match_result.id)
+        output_serializer = MatchResultOutputSerializer(
+            match_result, context=team_skills_context(match_result.player_team, match_result.cpu_team)
+        )
+        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request: Request, team_pk: str):
+        class InputSerializer(serializers.Serializer):
+            difficulty_rating = serializers.IntegerField(min_value=1, max_value=10)
+            team_sheet = serializers.PrimaryKeyRelatedField(queryset=TeamSheet.objects.filter(team_id=team_pk))
+            match_amount = serializers.IntegerField(min_value=1, max_value=MAX_BATCH_MATCH_AMOUNT)
+
+        class OutputSerializer(serializers.Serializer):
+            match_ids = serializers.ListField(child=serializers.IntegerField())
+            wins = serializers.IntegerField()
+            draws = serializers.IntegerField()
+            loses = serializers.IntegerField()
+            goals_for = serializers.IntegerField()
+            goals_against = serializers.IntegerField()
+            coins_earned = serializers.IntegerField()
+
+        serializer = InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
+        team_sheet = TeamSheetCRUDService(team=team).teamsheet_retrieve(teamsheet_id=serializer.data["team_sheet"])
+
+        validate_teamsheet_can_play_match(team_sheet)
+        match_results = play_matches_against_cpu(
+            player_team_sheet=team_sheet,
+            difficulty_rating=serializer.data["difficulty_rating"],
+            match_amount=serializer.data["match_amount"],
+        )
+        output_serializer = OutputSerializer(summarize_matches(match_results))
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
     def list(self, request: Request, team_pk: str):
         team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
         matches = MatchResultReadService(team=team, user=request.user).match_list()
-        serializer = MatchResultShortOutputSerializer(matches, many=True)
-        return Response(serializer.data)
+
+        # Same output as MatchResultShortOutputSerializer, built from values() rows
+        paginator = self.Pagination()
+        page = paginator.paginate_querysets(
+            [match_result_short_values(branch) for branch in matches], request, view=self
+        )
+        return paginator.get_paginated_response([match_result_short_representation(row) for row in page])
 
     def retrieve(self, request: Request, team_pk: str, pk: str):
+        class FilterSerializer(serializers.Serializer):
+            # Lists the teams and players once and references them by id
+            normalized = serializers.BooleanField(required=False, default=False)
+
+        filters_serializer = FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
         team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
         match = MatchResultReadService(team=team, user=request.user).match_retrieve(match_id=int(pk))
-        serializer = MatchResultOutputSerializer(match)
+        serializer_class = (
+            MatchResultNormalizedOutputSerializer
+            if filters_serializer.validated_data["normalized"]
+            else MatchResultOutputSerializer
+        )
+        serializer = serializer_class(match, context=team_skills_context(match.player_team, match.cpu_team))
         return Response(serializer.data)
+
+
+# View is nested in team/<pk> resource
+class MatchJobApi(ApiAuthMixin, APIView):
+    def get(self, request: Request, team_id: int, job_id: int):
+        team = TeamCRUDService(user=request.user).team_retrieve(team_id=team_id)
+        job = match_job_retrieve(team=team, job_id=job_id)
+        return Response(MatchJobOutputSerializer(job).data)
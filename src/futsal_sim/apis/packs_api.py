@@ -4,9 +4,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from src.api.mixins import ApiAuthMixin
-from src.futsal_sim.serializers import PlayerOutputSerializer
+from src.futsal_sim.serializers import PlayerOutputSerializer, team_skills_context
 from src.futsal_sim.services import pack_service
-from src.futsal_sim.services.team_service import TeamCRUDService, calc_average_skill
+from src.futsal_sim.services.team_service import TeamCRUDService
 
 
 # View is nested in team/<pk> resource
@@ -20,6 +20,5 @@ class TeamBuyPackApi(ApiAuthMixin, APIView):
         serializer.is_valid(raise_exception=True)
 
         players = pack_service.buy_pack(team=team, pack_type=serializer.data["pack_type"])
-        output_serializer = PlayerOutputSerializer(players, many=True)
-        average_skill = calc_average_skill(team)
-        return Response({"average_skill": average_skill, "players": output_serializer.data})
+        output_serializer = PlayerOutputSerializer(players, many=True, context=team_skills_context(team))
+        return Response({"average_skill": team.average_skill, "players": output_serializer.data})
@@ -1,17 +1,13 @@
 from rest_framework import serializers
 from rest_framework.request import Request
-from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
 from src.api.mixins import ApiAuthMixin
+from src.api.utils import conditional_response
 from src.futsal_sim.constants import TEAM_SKILL_CALC_PLAYER_AMOUNT
-from src.futsal_sim.serializers import PlayerOutputSerializer
+from src.futsal_sim.row_serializers import player_list_rows
 from src.futsal_sim.services.player_service import PlayerReadService
-from src.futsal_sim.services.team_service import (
-    TeamCRUDService,
-    calc_average_skill,
-    calc_team_skill,
-)
+from src.futsal_sim.services.team_service import TeamCRUDService
 
 # View is nested in teams resource
 
@@ -28,14 +24,15 @@ class PlayerListApi(ApiAuthMixin, ViewSet):
         team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
         service = PlayerReadService(user=request.user, team=team)
         queryset = service.player_list(filters=filters_serializer.validated_data)
-        serializer = PlayerOutputSerializer(queryset, many=True)
-        average_skill = calc_average_skill(team)
-        team_skill = calc_team_skill(team)
-        return Response(
-            {
-                "team_skill": team_skill,
-                "average_skill": average_skill,
+
+        return conditional_response(
+            request,
+            version=team.data_version,
+            # Same output as PlayerOutputSerializer, built from values() rows for large squads
+            get_data=lambda: {
+                "team_skill": team.team_skill,
+                "average_skill": team.average_skill,
                 "player_amount_considered": TEAM_SKILL_CALC_PLAYER_AMOUNT,
-                "players": serializer.data,
-            }
+                "players": player_list_rows(queryset),
+            },
         )
@@ -0,0 +1,21 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from src.api.mixins import ApiAuthMixin
+from src.futsal_sim.serializers import (
+    PlayerSeasonStatsOutputSerializer,
+    TeamStatsOutputSerializer,
+)
+from src.futsal_sim.services.stats_service import team_stats_retrieve, top_scorers_list
+from src.futsal_sim.services.team_service import TeamCRUDService
+
+
+# View is nested in team/<pk> resource
+class TeamStatsApi(ApiAuthMixin, APIView):
+    def get(self, request: Request, team_id: int):
+        team = TeamCRUDService(user=request.user).team_retrieve(team_id=team_id)
+
+        stats_serializer = TeamStatsOutputSerializer(team_stats_retrieve(team))
+        top_scorers_serializer = PlayerSeasonStatsOutputSerializer(top_scorers_list(team), many=True)
+        return Response({**stats_serializer.data, "top_scorers": top_scorers_serializer.data})
@@ -6,6 +6,7 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
 
 from src.api.mixins import ApiAuthMixin
+from src.api.utils import conditional_response
 from src.futsal_sim.models import Player
 from src.futsal_sim.serializers import TeamOutputSerializer, TeamShortOutputSerializer
 from src.futsal_sim.services.team_service import TeamCRUDService, team_sell_players
@@ -22,9 +23,12 @@ class TeamApi(ApiAuthMixin, ViewSet):
     def retrieve(self, request: Request, pk: str):
         service = TeamCRUDService(user=request.user)
         team = service.team_retrieve(team_id=int(pk))
-        serializer = TeamOutputSerializer(team)
 
-        return Response(data=serializer.data)
+        return conditional_response(
+            request,
+            version=team.data_version,
+            get_data=lambda: TeamOutputSerializer(team).data,
+        )
 
     def list(self, request: Request):
         filters_serializer = self.FilterSerializer(data=request.query_params)
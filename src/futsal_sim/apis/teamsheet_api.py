@@ -6,8 +6,10 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
 from src.api.mixins import ApiAuthMixin
+from src.api.utils import conditional_response
 from src.futsal_sim.models import Player
-from src.futsal_sim.serializers import TeamSheetOutputSerializer
+from src.futsal_sim.row_serializers import teamsheet_list_rows
+from src.futsal_sim.serializers import TeamSheetOutputSerializer, team_skills_context
 from src.futsal_sim.services.team_service import TeamCRUDService
 from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
 
@@ -40,10 +42,15 @@ class TeamSheetCRUDApi(ApiAuthMixin, ViewSet):
 
     def retrieve(self, request: Request, pk: str, team_pk: str):
         team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
-        team_sheet = TeamSheetCRUDService(team=team).teamsheet_retrieve(teamsheet_id=int(pk))
-        output_serializer = TeamSheetOutputSerializer(team_sheet)
 
-        return Response(data=output_serializer.data)
+        return conditional_response(
+            request,
+            version=team.data_version,
+            get_data=lambda: TeamSheetOutputSerializer(
+                TeamSheetCRUDService(team=team).teamsheet_retrieve(teamsheet_id=int(pk)),
+                context=team_skills_context(team),
+            ).data,
+        )
 
     def list(self, request: Request, team_pk: str):
         filters_serializer = self.FilterSerializer(data=request.query_params)
@@ -51,9 +58,13 @@ class TeamSheetCRUDApi(ApiAuthMixin, ViewSet):
 
         team = TeamCRUDService(user=request.user).team_retrieve(team_id=int(team_pk))
         queryset = TeamSheetCRUDService(team=team).teamsheet_list()
-        serializer = TeamSheetOutputSerializer(queryset, many=True)
 
-        return Response(data=serializer.data)
+        return conditional_response(
+            request,
+            version=team.data_version,
+            # Same output as TeamSheetOutputSerializer, built from values() rows
+            get_data=lambda: teamsheet_list_rows(queryset),
+        )
 
     def update(self, request: Request, pk: str, team_pk: str):
         serializer = self._create_input_serializer(data=request.data, team_pk=team_pk)
@@ -70,7 +81,7 @@ class TeamSheetCRUDApi(ApiAuthMixin, ViewSet):
             goalkeeper=serializer.data["goalkeeper"],
         )
 
-        serializer_output = TeamSheetOutputSerializer(teamsheet)
+        serializer_output = TeamSheetOutputSerializer(teamsheet, context=team_skills_context(team))
 
         return Response(data=serializer_output.data)
 
@@ -88,7 +99,7 @@ class TeamSheetCRUDApi(ApiAuthMixin, ViewSet):
             goalkeeper=serializer.data["goalkeeper"],
         )
 
-        serializer_output = TeamSheetOutputSerializer(teamsheet)
+        serializer_output = TeamSheetOutputSerializer(teamsheet, context=team_skills_context(team))
 
         return Response(data=serializer_output.data, status=status.HTTP_201_CREATED)
 
@@ -27,6 +27,9 @@ MIN_CPU_DIFFICULTY_RATING = 0
 
 MAX_CPU_DIFFICULTY_RATING = 10
 
+# Matches played in a single batch request
+MAX_BATCH_MATCH_AMOUNT = 20
+
 BASE_COINS_MATCH_WIN = 200
 MULTIPLIER_COIN_DRAW = 0.6
 MULTIPLIER_SKILL_DIFFERENCE = 5
@@ -82,6 +85,12 @@ SILVER_UPPER_BOUND = 4
 BRONZE_LOWER_BOUND = -10
 BRONZE_UPPER_BOUND = 0
 
+# ---------------------------------------------
+# Team statistics
+# Results of the last x matches shown as form
+TEAM_FORM_MATCH_AMOUNT = 5
+TOP_SCORERS_AMOUNT = 5
+
 # Player generation used in packs, and during team creation
 GK_GENERATION_PERC_CHANCE = 20
 DEF_GENERATION_PERC_CHANCE = 40
@@ -111,3 +120,15 @@ CPU_DEFENDER_UPPER_CONTRIBUTION_MULTIPLIER = 2.0
 
 CPU_GK_LOWER_CONTRIBUTION_MULTIPLIER = 0.0
 CPU_GK_UPPER_CONTRIBUTION_MULTIPLIER = 0.1
+
+# CPU opponent pool, teams pre-generated for every cpu team skill, so matches don't generate opponents
+CPU_POOL_MIN_SKILL = MIN_PLAYER_SKILL
+CPU_POOL_MAX_SKILL = 100
+CPU_POOL_TEAMS_PER_SKILL = 3
+# Skills with fewer pooled teams than this are refilled up to CPU_POOL_TEAMS_PER_SKILL
+CPU_POOL_REFILL_THRESHOLD = 2
+# Seconds after which a process reloads its pool index, picking up teams generated by other processes
+CPU_POOL_INDEX_TTL = 300
+
+# Seconds after which a running match job is failed, its worker is considered dead
+MATCH_JOB_RUNNING_TIMEOUT = 600
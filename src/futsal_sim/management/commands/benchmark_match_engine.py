@@ -0,0 +1,110 @@
+import random
+import time
+from collections import Counter
+from typing import Callable, Optional
+
+from django.core.management.base import BaseCommand
+
+from src.futsal_sim.constants import (
+    ASSIST_PERC,
+    ATTACKER_ASSIST_PERC,
+    ATTACKER_GOAL_PERC,
+    DEFENDER_ASSIST_PERC,
+    DEFENDER_GOAL_PERC,
+    MATCH_MAX_MINUTE,
+)
+from src.futsal_sim.services.business_models import TeamSheetPosition
+from src.futsal_sim.services.factories import PositionFactory
+from src.futsal_sim.services.match_engine import generate_goal_minutes
+
+GoalSampler = Callable[[int, random.Random], list[tuple[int, Optional[TeamSheetPosition]]]]
+
+
+def _legacy_position(*, attacker_perc: int, defender_perc: int, rng: random.Random) -> TeamSheetPosition:
+    """
+    Threshold roll PositionFactory used before the weight tables were compiled.
+    """
+    seed = rng.randint(1, 100)
+    side_seed = rng.randint(0, 1)
+    if seed < attacker_perc:
+        return PositionFactory.positions[side_seed]
+    elif seed < defender_perc + attacker_perc:
+        return PositionFactory.positions[2 + side_seed]
+    return TeamSheetPosition.GOALKEEPER
+
+
+def _rejection_goals(goal_amount: int, rng: random.Random) -> list[tuple[int, Optional[TeamSheetPosition]]]:
+    """
+    Reference implementation, re-rolls minutes and assisters until they are valid.
+    """
+    goals: list[tuple[int, Optional[TeamSheetPosition]]] = []
+    goal_minutes: list[int] = []
+    for _ in range(goal_amount):
+        minute = rng.randint(1, MATCH_MAX_MINUTE)
+        while minute in goal_minutes:
+            minute = rng.randint(1, MATCH_MAX_MINUTE)
+        goal_minutes.append(minute)
+
+        scorer_pos = _legacy_position(attacker_perc=ATTACKER_GOAL_PERC, defender_perc=DEFENDER_GOAL_PERC, rng=rng)
+        assister_pos = None
+        if rng.randint(1, 100) <= ASSIST_PERC:
+            assister_pos = scorer_pos
+            while assister_pos == scorer_pos:
+                assister_pos = _legacy_position(
+                    attacker_perc=ATTACKER_ASSIST_PERC, defender_perc=DEFENDER_ASSIST_PERC, rng=rng
+                )
+        goals.append((minute, assister_pos))
+    return goals
+
+
+def _sampled_goals(goal_amount: int, rng: random.Random) -> list[tuple[int, Optional[TeamSheetPosition]]]:
+    minutes = generate_goal_minutes(goal_amount, rng)
+    scorer_positions = PositionFactory.generate_goal_scorer_positions(goal_amount, rng=rng)
+    return list(zip(minutes, PositionFactory.generate_assist_maker_positions(scorer_positions, rng=rng)))
+
+
+class Command(BaseCommand):
+    help = """
+    Micro-benchmark of goal minute and assister generation, rejection sampling against the sampling used by the
+    match engine.
+
+    Reports the cost per goal for each goal amount and the difference between the assister distributions.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--matches", type=int, default=2_000, help="Matches generated per goal amount")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        matches = options["matches"]
+        goal_amounts = sorted({1, 5, 10, 20, 30, MATCH_MAX_MINUTE})
+
+        self.stdout.write(f"{'goals':>5} {'rejection us/goal':>18} {'sampled us/goal':>16}")
+        for goal_amount in goal_amounts:
+            rejection = self._time_per_goal(_rejection_goals, goal_amount, matches, options["seed"])
+            sampled = self._time_per_goal(_sampled_goals, goal_amount, matches, options["seed"])
+            self.stdout.write(f"{goal_amount:>5} {rejection:>18.2f} {sampled:>16.2f}")
+
+        rejection_assisters = self._assister_frequencies(_rejection_goals, matches, options["seed"])
+        sampled_assisters = self._assister_frequencies(_sampled_goals, matches, options["seed"])
+        distance = sum(
+            abs(rejection_assisters[pos] - sampled_assisters[pos]) for pos in [*PositionFactory.positions, None]
+        )
+        self.stdout.write(f"\nAssister distribution total variation distance: {distance / 2:.4f}")
+
+    @staticmethod
+    def _time_per_goal(sampler: GoalSampler, goal_amount: int, matches: int, seed: int) -> float:
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        for _ in range(matches):
+            sampler(goal_amount, rng)
+        return (time.perf_counter() - start) / (matches * goal_amount) * 1_000_000
+
+    @staticmethod
+    def _assister_frequencies(
+        sampler: GoalSampler, matches: int, seed: int
+    ) -> dict[Optional[TeamSheetPosition], float]:
+        rng = random.Random(seed)
+        goals = [goal for _ in range(matches) for goal in sampler(MATCH_MAX_MINUTE, rng)]
+        counts = Counter(assister_pos for _, assister_pos in goals)
+        return {pos: counts[pos] / len(goals) for pos in [*PositionFactory.positions, None]}
@@ -0,0 +1,62 @@
+import random
+import time
+from typing import Callable
+
+import faker
+import names
+from django.core.management.base import BaseCommand
+
+from src.futsal_sim.constants import PLAYER_AMOUNT_TEAM_SHEET
+from src.futsal_sim.services.name_service import (
+    TEAM_NAME_ABBREVIATIONS,
+    generate_player_names,
+    generate_team_names,
+)
+
+
+def _legacy_team_names(teams: int, rng: random.Random) -> list[str]:
+    """
+    Reference implementation, builds a Faker instance for every city and reads the name files for every name.
+    """
+    generated = []
+    for _ in range(teams):
+        abbr = rng.choice(TEAM_NAME_ABBREVIATIONS)
+        if rng.randint(0, 1) == 0:
+            generated.append(abbr + " " + faker.Faker().city())
+        else:
+            generated.append(faker.Faker().city() + " " + abbr)
+        generated.extend(names.get_full_name(gender="male") for _ in range(PLAYER_AMOUNT_TEAM_SHEET))
+    return generated
+
+
+def _cached_team_names(teams: int, rng: random.Random) -> list[str]:
+    return generate_team_names(teams, rng=rng) + generate_player_names(teams * PLAYER_AMOUNT_TEAM_SHEET, rng=rng)
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark of the names generated with cpu teams, one team name and a name for each lineup player.
+
+    Compares a fresh Faker instance and names.get_full_name for every name against the cached name corpora.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=200, help="Amount of cpu teams named")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        teams = options["teams"]
+        # Loads the corpora, so only generation is measured
+        _cached_team_names(1, random.Random(options["seed"]))
+
+        self.stdout.write(f"{'implementation':>14} {'teams/s':>10}")
+        for name, generator in (("legacy", _legacy_team_names), ("cached", _cached_team_names)):
+            throughput = self._teams_per_second(generator, teams, options["seed"])
+            self.stdout.write(f"{name:>14} {throughput:>10.1f}")
+
+    @staticmethod
+    def _teams_per_second(generator: Callable[[int, random.Random], list[str]], teams: int, seed: int) -> float:
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        generator(teams, rng)
+        return teams / (time.perf_counter() - start)
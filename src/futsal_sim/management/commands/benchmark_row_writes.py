@@ -0,0 +1,88 @@
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+from django.test.utils import CaptureQueriesContext
+
+from src.futsal_sim.models import Player, Team, TeamSheet
+from src.futsal_sim.services.match_service import play_match_against_cpu
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+def _write_queries(ctx: CaptureQueriesContext) -> list[str]:
+    return [query["sql"] for query in ctx.captured_queries if query["sql"].startswith(("INSERT", "UPDATE"))]
+
+
+def _all_field_names(instance: models.Model) -> list[str]:
+    return [field.name for field in instance._meta.fields if not field.primary_key]
+
+
+class Command(BaseCommand):
+    help = """
+    Measures the rows written by played matches, in statements and SQL bytes per match, and compares saving
+    changed players and teams as full rows against the dirty field saves of BaseModel.
+
+    Everything runs in a transaction which is rolled back at the end.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--matches", type=int, default=20)
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        matches = options["matches"]
+        team_sheet = self._create_team_sheet()
+        # First match generates the cpu opponent
+        play_match_against_cpu(player_team_sheet=team_sheet, difficulty_rating=5)
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(matches):
+                play_match_against_cpu(player_team_sheet=team_sheet, difficulty_rating=5)
+        writes = _write_queries(ctx)
+        self.stdout.write(
+            f"Matches: {len(writes) / matches:.1f} write statements, "
+            f"{sum(len(sql) for sql in writes) / matches:.0f} SQL bytes per match"
+        )
+
+        self._compare_saves("Player", list(Player.objects.filter(team=team_sheet.team)), "stamina_left")
+        self._compare_saves("Team", [Team.objects.get(id=team_sheet.team_id)], "coins")
+        transaction.set_rollback(True)
+
+    def _compare_saves(self, label: str, instances: list, changed_field: str):
+        for instance in instances:
+            setattr(instance, changed_field, getattr(instance, changed_field) - 1)
+        with CaptureQueriesContext(connection) as full_ctx:
+            for instance in instances:
+                instance.save(update_fields=_all_field_names(instance))
+
+        for instance in instances:
+            setattr(instance, changed_field, getattr(instance, changed_field) - 1)
+        # The changed field and updated_at
+        dirty_columns = len(instances[0].get_dirty_fields()) + 1
+        with CaptureQueriesContext(connection) as dirty_ctx:
+            for instance in instances:
+                instance.save()
+
+        full_bytes = sum(len(sql) for sql in _write_queries(full_ctx)) / len(instances)
+        dirty_bytes = sum(len(sql) for sql in _write_queries(dirty_ctx)) / len(instances)
+        self.stdout.write(
+            f"{label} with changed {changed_field}: full row {len(_all_field_names(instances[0]))} columns, "
+            f"{full_bytes:.0f} SQL bytes, dirty fields {dirty_columns} columns, "
+            f"{dirty_bytes:.0f} SQL bytes per row"
+        )
+
+    @staticmethod
+    def _create_team_sheet() -> TeamSheet:
+        user = user_create(email=f"benchmark-{uuid.uuid4().hex}@futsal.io", password=uuid.uuid4().hex)
+        team = TeamCRUDService(user=user).team_create(name="Benchmark FC")
+        players = list(team.players.order_by("id"))
+        return TeamSheetCRUDService(team=team).teamsheet_create(
+            name="Benchmark",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
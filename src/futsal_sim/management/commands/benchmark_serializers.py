@@ -0,0 +1,100 @@
+import time
+import uuid
+from typing import Callable
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from src.futsal_sim.models import Team
+from src.futsal_sim.row_serializers import player_list_rows, teamsheet_list_rows
+from src.futsal_sim.serializers import (
+    PlayerOutputSerializer,
+    TeamSheetOutputSerializer,
+    team_skills_context,
+)
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.player_service import PlayerReadService
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+def _best_time(func: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = """
+    Compares the serializers of the player and team sheet lists against the values() row serializers
+    on squads of different sizes, best of --repeats runs including the queries and JSON rendering.
+
+    Everything runs in a transaction which is rolled back at the end.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--squad-sizes", type=int, nargs="+", default=[10, 100, 1000])
+        parser.add_argument("--repeats", type=int, default=5)
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        user = user_create(email=f"benchmark-{uuid.uuid4().hex}@futsal.io", password=uuid.uuid4().hex)
+        for squad_size in options["squad_sizes"]:
+            team = self._create_team(user=user, squad_size=squad_size)
+            players = PlayerReadService(team=team, user=user).player_list()
+            sheets = TeamSheetCRUDService(team=team).teamsheet_list()
+            context = team_skills_context(team)
+            renderer = JSONRenderer()
+
+            # Both sides run their queries each time, .all() skips the result cache of the querysets
+            self._compare(
+                f"Players ({squad_size})",
+                serializer=lambda: renderer.render(
+                    PlayerOutputSerializer(players.all(), many=True, context=context).data
+                ),
+                rows=lambda: renderer.render(player_list_rows(players.all())),
+                repeats=options["repeats"],
+            )
+            self._compare(
+                f"Team sheets ({squad_size // 5})",
+                serializer=lambda: renderer.render(
+                    TeamSheetOutputSerializer(sheets.all(), many=True, context=context).data
+                ),
+                rows=lambda: renderer.render(teamsheet_list_rows(sheets.all())),
+                repeats=options["repeats"],
+            )
+        transaction.set_rollback(True)
+
+    def _compare(self, label: str, *, serializer: Callable[[], bytes], rows: Callable[[], bytes], repeats: int):
+        if serializer() != rows():
+            self.stderr.write(f"{label}: outputs differ!")
+        serializer_time = _best_time(serializer, repeats)
+        rows_time = _best_time(rows, repeats)
+        self.stdout.write(
+            f"{label}: serializer {serializer_time * 1000:.1f} ms, rows {rows_time * 1000:.1f} ms, "
+            f"{serializer_time / rows_time:.1f}x"
+        )
+
+    @staticmethod
+    def _create_team(*, user, squad_size: int) -> Team:
+        team = TeamCRUDService(user=user).team_create(name=f"Benchmark {squad_size}")
+        missing_players = squad_size - team.players.count()
+        if missing_players > 0:
+            PlayerFactory(team=team, lower_b=10, upper_b=30).create_players(missing_players)
+
+        players = list(team.players.order_by("id")[: squad_size - squad_size % 5])
+        for i in range(0, len(players), 5):
+            TeamSheetCRUDService(team=team).teamsheet_create(
+                name=f"Sheet {i // 5}",
+                right_attacker=players[i].id,
+                left_attacker=players[i + 1].id,
+                right_defender=players[i + 2].id,
+                left_defender=players[i + 3].id,
+                goalkeeper=players[i + 4].id,
+            )
+        return team
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from src.futsal_sim.models import Team
+from src.futsal_sim.services.team_service import calc_average_skill, calc_team_skill
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = """
+    Recomputes team_skill and average_skill of every team with aggregate queries and reports the teams
+    whose stored values differ, e.g. after players were edited in the admin.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true", help="Store the recomputed values")
+
+    def handle(self, *args, **options):
+        mismatched_teams = []
+        for team in Team.objects.order_by("id").iterator(chunk_size=BATCH_SIZE):
+            team_skill = calc_team_skill(team)
+            average_skill = calc_average_skill(team)
+            if (team.team_skill, team.average_skill) == (team_skill, average_skill):
+                continue
+
+            self.stdout.write(
+                f"Team {team.id}: team_skill {team.team_skill} -> {team_skill}, "
+                f"average_skill {team.average_skill} -> {average_skill}"
+            )
+            team.team_skill = team_skill
+            team.average_skill = average_skill
+            mismatched_teams.append(team)
+
+        if options["fix"]:
+            Team.objects.bulk_update(mismatched_teams, fields=["team_skill", "average_skill"], batch_size=BATCH_SIZE)
+            Team.objects.filter(id__in=[team.id for team in mismatched_teams]).update(**Team.version_bump())
+        self.stdout.write(f"{len(mismatched_teams)} team(s) with stale skills{', fixed' if options['fix'] else ''}")
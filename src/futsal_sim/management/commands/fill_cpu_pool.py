@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.futsal_sim.constants import CPU_POOL_REFILL_THRESHOLD, CPU_POOL_TEAMS_PER_SKILL
+from src.futsal_sim.services.cpu_pool_service import (
+    CPUPoolStats,
+    cpu_pool_stats,
+    refill_cpu_pool,
+)
+
+
+class Command(BaseCommand):
+    help = """
+    Fills the cpu opponent pool, generating teams for every skill with fewer teams than the refill threshold.
+
+    Same as the periodic refill_cpu_pool task, run it after deploys which change the pool constants.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams-per-skill", type=int, default=CPU_POOL_TEAMS_PER_SKILL)
+        parser.add_argument("--refill-threshold", type=int, default=CPU_POOL_REFILL_THRESHOLD)
+        parser.add_argument("--stats-only", action="store_true", help="Only report pool size")
+
+    def handle(self, *args, **options):
+        if options["refill_threshold"] > options["teams_per_skill"]:
+            raise CommandError("--refill-threshold can't be greater than --teams-per-skill!")
+
+        if options["stats_only"]:
+            stats = cpu_pool_stats(refill_threshold=options["refill_threshold"])
+        else:
+            stats = refill_cpu_pool(
+                teams_per_skill=options["teams_per_skill"], refill_threshold=options["refill_threshold"]
+            )
+        self._write_stats(stats)
+
+    def _write_stats(self, stats: CPUPoolStats):
+        self.stdout.write(f"Pooled teams: {stats.total_teams}")
+        self.stdout.write(f"Skills covered: {stats.skills_covered}")
+        self.stdout.write(f"Min teams per skill: {stats.min_teams_per_skill}")
+        self.stdout.write(f"Skills below refill threshold: {len(stats.skills_below_threshold)}")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from src.futsal_sim.services.stats_service import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = """
+    Recomputes TeamStats and PlayerSeasonStats from the match history, e.g. after the stats were added to an
+    existing database. Matches and goals are streamed in chunks, the rebuild runs in a single transaction.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows fetched and inserted per query")
+
+    def handle(self, *args, **options):
+        team_stats_amount, player_stats_amount = rebuild_stats(chunk_size=options["chunk_size"])
+        self.stdout.write(f"Rebuilt stats of {team_stats_amount} team(s) and {player_stats_amount} player(s)")
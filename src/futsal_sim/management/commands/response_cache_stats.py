@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from src.api.response_cache import response_cache_stats, response_cache_stats_reset
+
+
+class Command(BaseCommand):
+    help = """
+    Reports the hits and misses of the response cache, counted in the default cache,
+    so with a Redis cache they cover every process.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Start counting from zero again")
+
+    def handle(self, *args, **options):
+        stats = response_cache_stats()
+        requests = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / requests if requests else 0
+        self.stdout.write(f"Hits: {stats['hits']}, misses: {stats['misses']}, hit rate: {hit_rate:.1%}")
+
+        if options["reset"]:
+            response_cache_stats_reset()
@@ -0,0 +1,55 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from src.futsal_sim.constants import SKILL_LOWER_BOUND_CREATED_TEAM
+from src.futsal_sim.models import PlayerPosition
+from src.futsal_sim.services.balance_simulation import simulate_balance
+
+
+class Command(BaseCommand):
+    help = """
+    Monte Carlo simulation of the match model, used when tuning futsal_sim/constants.py.
+
+    Reports win/draw/loss rates, coin rewards and scorer position shares for each difficulty rating.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=1_000_000, help="Amount of simulated matches")
+        parser.add_argument("--min-skill", type=int, default=SKILL_LOWER_BOUND_CREATED_TEAM)
+        parser.add_argument("--max-skill", type=int, default=60)
+        parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible reports")
+
+    def handle(self, *args, **options):
+        if options["min_skill"] > options["max_skill"]:
+            raise CommandError("--min-skill can't be greater than --max-skill!")
+
+        start = time.perf_counter()
+        try:
+            reports = simulate_balance(
+                samples=options["samples"],
+                min_skill=options["min_skill"],
+                max_skill=options["max_skill"],
+                rng=np.random.default_rng(options["seed"]),
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{'diff':>4} {'samples':>9} {'win':>6} {'draw':>6} {'loss':>6} {'goals':>11} "
+            f"{'coins avg':>9} {'p10/p50/p90':>15} {'att':>6} {'def':>6} {'gk':>6}"
+        )
+        for report in reports:
+            p10, p50, p90 = report.coins_percentiles
+            shares = report.scorer_shares
+            self.stdout.write(
+                f"{report.difficulty_rating:>4} {report.samples:>9} "
+                f"{report.win_rate:>6.1%} {report.draw_rate:>6.1%} {report.loss_rate:>6.1%} "
+                f"{report.avg_player_goals:>5.2f}:{report.avg_cpu_goals:<5.2f} "
+                f"{report.avg_coins:>9.1f} {f'{p10:.0f}/{p50:.0f}/{p90:.0f}':>15} "
+                f"{shares[PlayerPosition.ATTACKER]:>6.1%} {shares[PlayerPosition.DEFENDER]:>6.1%} "
+                f"{shares[PlayerPosition.GOALKEEPER]:>6.1%}"
+            )
+        self.stdout.write(f"\nSimulated {options['samples']} matches in {elapsed:.2f}s")
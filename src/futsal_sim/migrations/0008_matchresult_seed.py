@@ -0,0 +1,18 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0007_matchgoal_team'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='matchresult',
+            name='seed',
+            field=models.BigIntegerField(blank=True, default=None, null=True),
+        ),
+    ]
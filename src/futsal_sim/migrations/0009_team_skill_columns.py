@@ -0,0 +1,48 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:27
+
+from django.db import migrations, models
+
+from src.futsal_sim.constants import TEAM_SKILL_CALC_PLAYER_AMOUNT
+
+BATCH_SIZE = 500
+
+
+def fill_team_skills(apps, schema_editor):
+    Team = apps.get_model("futsal_sim", "Team")
+    Player = apps.get_model("futsal_sim", "Player")
+
+    team_ids = list(Team.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(team_ids), BATCH_SIZE):
+        batch_ids = team_ids[start:start + BATCH_SIZE]
+        skills_by_team = {team_id: [] for team_id in batch_ids}
+        for team_id, skill in Player.objects.filter(team_id__in=batch_ids).values_list("team_id", "skill"):
+            skills_by_team[team_id].append(skill)
+
+        teams = list(Team.objects.filter(id__in=batch_ids))
+        for team in teams:
+            skills = skills_by_team[team.id]
+            best_skills = sorted(skills, reverse=True)[:TEAM_SKILL_CALC_PLAYER_AMOUNT]
+            team.team_skill = round(sum(best_skills) / len(best_skills)) if best_skills else 0
+            team.average_skill = round(sum(skills) / len(skills)) if skills else 0
+        Team.objects.bulk_update(teams, fields=["team_skill", "average_skill"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0008_matchresult_seed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='average_skill',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='team_skill',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_team_skills, migrations.RunPython.noop),
+    ]
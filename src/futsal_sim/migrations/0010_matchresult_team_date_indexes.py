@@ -0,0 +1,21 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0009_team_skill_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='matchresult',
+            index=models.Index(fields=['player_team', '-date'], name='matchresult_player_team_date'),
+        ),
+        migrations.AddIndex(
+            model_name='matchresult',
+            index=models.Index(fields=['cpu_team', '-date'], name='matchresult_cpu_team_date'),
+        ),
+    ]
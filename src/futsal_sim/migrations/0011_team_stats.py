@@ -0,0 +1,58 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:35
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0010_matchresult_team_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeamStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('matches_played', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('wins', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('draws', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('loses', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('goals_for', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('goals_against', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('clean_sheets', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('coins_earned', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('form', models.CharField(blank=True, default='', max_length=5)),
+                ('team', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='futsal_sim.team')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PlayerSeasonStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('matches_played', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('goals', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('assists', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_stats', to='futsal_sim.player')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='player_season_stats', to='futsal_sim.team')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='playerseasonstats',
+            index=models.Index(fields=['team', '-goals'], name='playerseasonstats_top_scorers'),
+        ),
+        migrations.AddConstraint(
+            model_name='playerseasonstats',
+            constraint=models.UniqueConstraint(fields=('team', 'player'), name='futsal_sim_playerseasonstats_unique_team_player'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:37
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0011_team_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeamRanking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metric', models.CharField(choices=[('wins', 'Wins'), ('win_rate', 'Win Rate'), ('coins', 'Coins'), ('team_skill', 'Team Skill')], max_length=32)),
+                ('rank', models.IntegerField(validators=[django.core.validators.MinValueValidator(1)])),
+                ('value', models.FloatField()),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='futsal_sim.team')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='teamranking',
+            constraint=models.UniqueConstraint(fields=('metric', 'rank'), name='futsal_sim_teamranking_unique_metric_rank'),
+        ),
+        migrations.AddConstraint(
+            model_name='teamranking',
+            constraint=models.UniqueConstraint(fields=('metric', 'team'), name='futsal_sim_teamranking_unique_metric_team'),
+        ),
+    ]
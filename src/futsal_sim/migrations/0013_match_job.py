@@ -0,0 +1,33 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:42
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0012_team_ranking'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('difficulty_rating', models.IntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)])),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=32)),
+                ('error', models.CharField(blank=True, default='', max_length=256)),
+                ('match_result', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='futsal_sim.matchresult')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_jobs', to='futsal_sim.team')),
+                ('team_sheet', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='match_jobs', to='futsal_sim.teamsheet')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
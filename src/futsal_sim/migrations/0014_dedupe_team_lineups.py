@@ -0,0 +1,63 @@
+# Generated by Django 4.1.3 on 2026-10-18 14:02
+
+from django.db import migrations
+from django.db.models import Case, Count, Value, When
+
+BATCH_SIZE = 500
+
+LINEUP_KEY = ['team_id', 'right_attacker_id', 'left_attacker_id', 'right_defender_id', 'left_defender_id',
+              'goalkeeper_id']
+
+
+def _merge_duplicates(MatchResult, TeamLineup, kept_ids):
+    """
+    :param kept_ids: lineup id kept for each duplicate lineup id
+    """
+    for field in ('player_lineup', 'cpu_lineup'):
+        MatchResult.objects.filter(**{f'{field}_id__in': kept_ids}).update(
+            **{f'{field}_id': Case(*[When(**{f'{field}_id': dup_id}, then=Value(kept_id))
+                                     for dup_id, kept_id in kept_ids.items()])}
+        )
+    TeamLineup.objects.filter(id__in=kept_ids).delete()
+
+
+def dedupe_team_lineups(apps, schema_editor):
+    """
+    Lineups of a team with the same players are merged into the oldest one, a team at a time.
+    """
+    TeamLineup = apps.get_model('futsal_sim', 'TeamLineup')
+    MatchResult = apps.get_model('futsal_sim', 'MatchResult')
+
+    team_ids = list(
+        TeamLineup.objects.values('team_id').annotate(lineups=Count('id')).filter(lineups__gt=1)
+        .order_by('team_id').values_list('team_id', flat=True)
+    )
+    kept_ids = {}
+    for team_id in team_ids:
+        first_id_by_key = {}
+        for lineup_id, *key in TeamLineup.objects.filter(team_id=team_id).order_by('id').values_list('id', *LINEUP_KEY):
+            # Lineups missing a deleted player aren't unique in the database either
+            if None in key:
+                continue
+            kept_id = first_id_by_key.setdefault(tuple(key), lineup_id)
+            if kept_id != lineup_id:
+                kept_ids[lineup_id] = kept_id
+
+            # Flushed within the team as well, a single team can have any amount of duplicates
+            if len(kept_ids) >= BATCH_SIZE:
+                _merge_duplicates(MatchResult, TeamLineup, kept_ids)
+                kept_ids = {}
+
+    if kept_ids:
+        _merge_duplicates(MatchResult, TeamLineup, kept_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0013_match_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_team_lineups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0014_dedupe_team_lineups'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='teamlineup',
+            constraint=models.UniqueConstraint(fields=('team', 'right_attacker', 'left_attacker', 'right_defender', 'left_defender', 'goalkeeper'), name='futsal_sim_teamlineup_unique_players'),
+        ),
+    ]
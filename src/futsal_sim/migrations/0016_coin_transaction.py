@@ -0,0 +1,30 @@
+# Generated by Django 4.1.3 on 2026-10-18 09:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0015_teamlineup_unique_players'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoinTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('amount', models.IntegerField()),
+                ('reason', models.CharField(choices=[('pack_purchase', 'Pack Purchase'), ('player_sale', 'Player Sale'), ('match_reward', 'Match Reward')], max_length=32)),
+                ('match_result', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='futsal_sim.matchresult')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='coin_transactions', to='futsal_sim.team')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.3 on 2026-10-18 10:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('futsal_sim', '0016_coin_transaction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from django.core.exceptions import ValidationError
 from django.core.validators import (
@@ -8,10 +8,16 @@ from django.core.validators import (
     MinValueValidator,
 )
 from django.db import models
+from django.utils import timezone
 
 from ..common.models import BaseModel
 from ..users.models import User
-from .constants import BASE_PRICE_FOR_AVERAGE_PLAYER, MIN_PLAYER_SKILL
+from .constants import (
+    BASE_PRICE_FOR_AVERAGE_PLAYER,
+    MIN_PLAYER_SKILL,
+    TEAM_FORM_MATCH_AMOUNT,
+    TEAM_SKILL_CALC_PLAYER_AMOUNT,
+)
 
 
 class PlayerPosition(models.TextChoices):
@@ -30,6 +36,11 @@ class Team(BaseModel):
     draws = models.IntegerField(default=0, validators=[MinValueValidator(0)])
     loses = models.IntegerField(default=0, validators=[MinValueValidator(0)])
     coins = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    # Denormalized from the squad, kept up to date by the services changing squads, see calc_skills
+    team_skill = models.IntegerField(default=0)
+    average_skill = models.IntegerField(default=0)
+    # Bumped by every change of the team, its squad or its sheets, the ETag of their resources, see version_bump
+    version = models.PositiveIntegerField(default=0)
 
     @property
     def matches_played(self) -> int:
@@ -39,6 +50,33 @@ class Team(BaseModel):
     def is_cpu(self) -> bool:
         return self.owner is None
 
+    @staticmethod
+    def calc_skills(player_skills: list[int]) -> Tuple[int, int]:
+        """
+        Team skill is the average of the TEAM_SKILL_CALC_PLAYER_AMOUNT most skillful players.
+        :param player_skills: skills of all squad players
+        :return: team_skill and average_skill
+        """
+        best_skills = sorted(player_skills, reverse=True)[:TEAM_SKILL_CALC_PLAYER_AMOUNT]
+        team_skill = round(sum(best_skills) / len(best_skills)) if best_skills else 0
+        average_skill = round(sum(player_skills) / len(player_skills)) if player_skills else 0
+        return team_skill, average_skill
+
+    @property
+    def data_version(self) -> str:
+        """
+        Version of the team, its squad and its sheets, for ETags and cache keys of their resources.
+        Contains the creation time as well, as SQLite reuses the ids of deleted rows.
+        """
+        return f"{self.created_at.timestamp()}-{self.version}"
+
+    @staticmethod
+    def version_bump() -> dict[str, Any]:
+        """
+        Fields for Team.objects.update() calls changing teams, their squads or their sheets.
+        """
+        return {"version": models.F("version") + 1, "updated_at": timezone.now()}
+
     def __str__(self):
         if self.is_cpu:
             return self.name + " (CPU)"
@@ -67,8 +105,15 @@ class Player(BaseModel):
         return self.preferred_position == TeamSheet.goalkeeper
 
     def calc_sell_price(self, team_avg: float) -> int:
-        sell_price = BASE_PRICE_FOR_AVERAGE_PLAYER + (self.skill - team_avg) * 2
-        sell_price *= self.stamina_left / 100
+        return Player.sell_price(skill=self.skill, stamina_left=self.stamina_left, team_avg=team_avg)
+
+    @staticmethod
+    def sell_price(*, skill: int, stamina_left: int, team_avg: float) -> int:
+        """
+        calc_sell_price without an instance, for rows read with values().
+        """
+        sell_price = BASE_PRICE_FOR_AVERAGE_PLAYER + (skill - team_avg) * 2
+        sell_price *= stamina_left / 100
         return max(round(sell_price), 10)
 
     class Meta:
@@ -132,7 +177,18 @@ class TeamSheet(TeamPlayersInPositions):
 
 
 class TeamLineup(TeamPlayersInPositions):
-    pass
+    """
+    Players a team played a match with, shared by all matches played with the same players,
+    see create_lineup_from_sheet.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "right_attacker", "left_attacker", "right_defender", "left_defender", "goalkeeper"],
+                name="%(app_label)s_%(class)s_unique_players",
+            )
+        ]
 
 
 class MatchResult(BaseModel):
@@ -144,6 +200,15 @@ class MatchResult(BaseModel):
     player_goals = models.IntegerField(validators=[MinValueValidator(0)])
     cpu_goals = models.IntegerField(validators=[MinValueValidator(0)])
     coins_reward = models.IntegerField(validators=[MinValueValidator(0)])
+    # Seed of the match engine RNG, null for matches played before it was stored
+    seed = models.BigIntegerField(null=True, blank=True, default=None)
+
+    class Meta:
+        # Match history of a team, newest first, see MatchResultReadService
+        indexes = [
+            models.Index(fields=["player_team", "-date"], name="matchresult_player_team_date"),
+            models.Index(fields=["cpu_team", "-date"], name="matchresult_cpu_team_date"),
+        ]
 
 
 class MatchGoal(BaseModel):
@@ -155,3 +220,104 @@ class MatchGoal(BaseModel):
 
     class Meta:
         ordering = ["minute"]
+
+
+class TeamStats(BaseModel):
+    """
+    Aggregates of all matches played by a team, maintained with every match, see stats_service.
+    """
+
+    team = models.OneToOneField(Team, related_name="stats", on_delete=models.CASCADE)
+    matches_played = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    wins = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    draws = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    loses = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    goals_for = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    goals_against = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    clean_sheets = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    coins_earned = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    # Results of the last matches, newest first, e.g. "WDLWW"
+    form = models.CharField(max_length=TEAM_FORM_MATCH_AMOUNT, blank=True, default="")
+
+
+class PlayerSeasonStats(BaseModel):
+    """
+    Contributions of a player in matches played for a team, maintained with every match, see stats_service.
+    Unlike Player.goals_scored, doesn't include generated history of cpu players.
+    """
+
+    team = models.ForeignKey(Team, related_name="player_season_stats", on_delete=models.CASCADE)
+    player = models.ForeignKey(Player, related_name="season_stats", on_delete=models.CASCADE)
+    matches_played = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    goals = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    assists = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["team", "player"], name="%(app_label)s_%(class)s_unique_team_player")
+        ]
+        indexes = [models.Index(fields=["team", "-goals"], name="playerseasonstats_top_scorers")]
+
+
+class RankingMetric(models.TextChoices):
+    WINS = "wins"
+    WIN_RATE = "win_rate"
+    COINS = "coins"
+    TEAM_SKILL = "team_skill"
+
+
+class TeamRanking(BaseModel):
+    """
+    Position of a player team in the leaderboard of a metric, ties are broken by team id.
+    The table is rebuilt periodically by the refresh_leaderboard task, see ranking_service.
+    """
+
+    metric = models.CharField(choices=RankingMetric.choices, max_length=32)
+    rank = models.IntegerField(validators=[MinValueValidator(1)])
+    team = models.ForeignKey(Team, related_name="rankings", on_delete=models.CASCADE)
+    value = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # Leaderboard pages seek by rank, "my rank" looks up a team
+            models.UniqueConstraint(fields=["metric", "rank"], name="%(app_label)s_%(class)s_unique_metric_rank"),
+            models.UniqueConstraint(fields=["metric", "team"], name="%(app_label)s_%(class)s_unique_metric_team"),
+        ]
+
+
+class MatchJobStatus(models.TextChoices):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class MatchJob(BaseModel):
+    """
+    Match played asynchronously by the play_match_job task, polled by the client until done or failed.
+    """
+
+    team = models.ForeignKey(Team, related_name="match_jobs", on_delete=models.CASCADE)
+    team_sheet = models.ForeignKey(TeamSheet, related_name="match_jobs", null=True, on_delete=models.SET_NULL)
+    difficulty_rating = models.IntegerField(validators=[MinValueValidator(1), MaxValueValidator(10)])
+    status = models.CharField(choices=MatchJobStatus.choices, max_length=32, default=MatchJobStatus.PENDING)
+    match_result = models.ForeignKey(MatchResult, related_name="+", null=True, blank=True, on_delete=models.SET_NULL)
+    error = models.CharField(max_length=256, blank=True, default="")
+
+
+class CoinTransactionReason(models.TextChoices):
+    PACK_PURCHASE = "pack_purchase"
+    PLAYER_SALE = "player_sale"
+    MATCH_REWARD = "match_reward"
+
+
+class CoinTransaction(BaseModel):
+    """
+    Append-only ledger of coin changes of a team, written by coin_service together with the change.
+    """
+
+    team = models.ForeignKey(Team, related_name="coin_transactions", on_delete=models.CASCADE)
+    # Negative when coins are spent
+    amount = models.IntegerField()
+    reason = models.CharField(choices=CoinTransactionReason.choices, max_length=32)
+    match_result = models.ForeignKey(MatchResult, related_name="+", null=True, blank=True, on_delete=models.SET_NULL)
@@ -0,0 +1,112 @@
+"""
+Read only serialization of the hot list endpoints from values() rows.
+
+Produces the same output as the matching serializers of serializers.py, without the field introspection
+and model instantiation of ModelSerializer. The serializers stay the documented schema, see
+tests/serializers/test_row_serializers.py for the parity contract.
+"""
+from typing import Any, Optional
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+from src.futsal_sim.models import MatchResult, Player, TeamSheet
+from src.futsal_sim.services.business_models import TeamSheetPosition
+
+TEAM_SHORT_VALUES = ("id", "name", "owner")
+PLAYER_VALUES = (
+    "id",
+    "name",
+    "preferred_position",
+    "skill",
+    "stamina_left",
+    "matches_played",
+    "goals_scored",
+    "assists_made",
+    "team__team_skill",
+    *[f"team__{field}" for field in TEAM_SHORT_VALUES],
+)
+MATCH_RESULT_SHORT_VALUES = (
+    "id",
+    "date",
+    "player_goals",
+    "cpu_goals",
+    *[f"{team}__{field}" for team in ("player_team", "cpu_team") for field in TEAM_SHORT_VALUES],
+)
+
+# Same formatting and timezone handling as the date of the match serializers
+_match_date_field = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
+
+
+def _team_short_representation(row: dict[str, Any], prefix: str) -> Optional[dict[str, Any]]:
+    if row[f"{prefix}id"] is None:
+        return None
+    return {"id": row[f"{prefix}id"], "name": row[f"{prefix}name"], "owner": row[f"{prefix}owner"]}
+
+
+def player_representation(row: dict[str, Any], prefix: str = "") -> Optional[dict[str, Any]]:
+    """
+    PlayerOutputSerializer of a row with the PLAYER_VALUES fields.
+    :param prefix: lookup of the player in the row, e.g. "goalkeeper__"
+    """
+    if row[f"{prefix}id"] is None:
+        return None
+
+    team_skill = row[f"{prefix}team__team_skill"]
+    return {
+        "id": row[f"{prefix}id"],
+        "name": row[f"{prefix}name"],
+        "preferred_position": row[f"{prefix}preferred_position"],
+        "skill": row[f"{prefix}skill"],
+        "stamina_left": row[f"{prefix}stamina_left"],
+        "matches_played": row[f"{prefix}matches_played"],
+        "goals_scored": row[f"{prefix}goals_scored"],
+        "assists_made": row[f"{prefix}assists_made"],
+        "sell_price": 0
+        if team_skill is None
+        else Player.sell_price(
+            skill=row[f"{prefix}skill"], stamina_left=row[f"{prefix}stamina_left"], team_avg=team_skill
+        ),
+        "team": _team_short_representation(row, f"{prefix}team__"),
+    }
+
+
+def player_list_rows(queryset: QuerySet[Player]) -> list:
+    return [player_representation(row) for row in queryset.values(*PLAYER_VALUES)]
+
+
+def teamsheet_list_rows(queryset: QuerySet[TeamSheet]) -> list[dict[str, Any]]:
+    """
+    TeamSheetOutputSerializer of the sheets, the players of every position are joined into the same row.
+    """
+    positions = [position.value for position in TeamSheetPosition]
+    rows = queryset.values("id", "name", *[f"{position}__{field}" for position in positions for field in PLAYER_VALUES])
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            **{position: player_representation(row, f"{position}__") for position in positions},
+        }
+        for row in rows
+    ]
+
+
+def match_result_short_values(queryset: QuerySet[MatchResult]) -> QuerySet:
+    """
+    Rows for match_result_short_representation, still a queryset so it can be paginated.
+    """
+    return queryset.values(*MATCH_RESULT_SHORT_VALUES)
+
+
+def match_result_short_representation(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    MatchResultShortOutputSerializer of a match_result_short_values row.
+    """
+    return {
+        "id": row["id"],
+        "date": _match_date_field.to_representation(row["date"]),
+        "player_goals": row["player_goals"],
+        "cpu_goals": row["cpu_goals"],
+        "player_team": _team_short_representation(row, "player_team__"),
+        "cpu_team": _team_short_representation(row, "cpu_team__"),
+    }
@@ -2,13 +2,38 @@ from rest_framework import serializers
 
 from src.futsal_sim.models import (
     MatchGoal,
+    MatchJob,
     MatchResult,
     Player,
+    PlayerSeasonStats,
     Team,
     TeamLineup,
+    TeamRanking,
     TeamSheet,
+    TeamStats,
 )
-from src.futsal_sim.services.team_service import calc_team_skill
+
+
+def team_skills_context(*teams: Team) -> dict[str, dict[int, int]]:
+    """
+    Serializer context with the skills of the teams whose players are serialized,
+    so PlayerOutputSerializer doesn't fetch the team of every player.
+    """
+    return {"team_skills": {team.id: team.team_skill for team in teams}}
+
+
+class IdentityMapSerializerMixin:
+    """
+    Serializes each instance once per response, nested occurrences reuse the same dict.
+    The map lives in the context, which nested serializers share with the root serializer.
+    """
+
+    def to_representation(self, instance):
+        identity_map = self.context.setdefault("identity_map", {})  # type: ignore[attr-defined]
+        key = (type(self), instance.pk)
+        if key not in identity_map:
+            identity_map[key] = super().to_representation(instance)  # type: ignore[misc]
+        return identity_map[key]
 
 
 class TeamOutputSerializer(serializers.ModelSerializer):
@@ -22,21 +47,23 @@ class TeamOutputSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "wins", "draws", "loses", "coins", "player_amount")
 
 
-class TeamShortOutputSerializer(serializers.ModelSerializer):
+class TeamShortOutputSerializer(IdentityMapSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
         fields = ("id", "name", "owner")
 
 
-class PlayerOutputSerializer(serializers.ModelSerializer):
+class PlayerOutputSerializer(IdentityMapSerializerMixin, serializers.ModelSerializer):
     sell_price = serializers.SerializerMethodField()
     team = TeamShortOutputSerializer()
 
     def get_sell_price(self, obj: Player) -> int:
+        team_skills = self.context.get("team_skills", {})
+        if obj.team_id in team_skills:
+            return obj.calc_sell_price(team_skills[obj.team_id])
         if not obj.team:
             return 0
-        team_skill = calc_team_skill(obj.team)
-        return obj.calc_sell_price(team_skill)
+        return obj.calc_sell_price(obj.team.team_skill)
 
     class Meta:
         model = Player
@@ -112,6 +139,67 @@ class MatchResultOutputSerializer(serializers.ModelSerializer):
         )
 
 
+class PlayerNormalizedOutputSerializer(PlayerOutputSerializer):
+    team = serializers.PrimaryKeyRelatedField(read_only=True)  # type: ignore[assignment]
+
+
+class TeamLineupNormalizedOutputSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TeamLineup
+        fields = ("right_attacker", "left_attacker", "right_defender", "left_defender", "goalkeeper")
+
+
+class MatchMomentNormalizedOutputSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MatchGoal
+        fields = ("minute", "goal_scorer", "assister", "team")
+
+
+class MatchResultNormalizedOutputSerializer(serializers.ModelSerializer):
+    """
+    MatchResultOutputSerializer with the teams and players listed once, referenced by id everywhere else.
+    """
+
+    date = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
+    player_lineup = TeamLineupNormalizedOutputSerializer()
+    cpu_lineup = TeamLineupNormalizedOutputSerializer()
+    goal_moments = MatchMomentNormalizedOutputSerializer(many=True)
+    teams = serializers.SerializerMethodField()
+    players = serializers.SerializerMethodField()
+
+    @staticmethod
+    def _players(obj: MatchResult) -> list[Player]:
+        players = [*obj.player_lineup.players, *obj.cpu_lineup.players]
+        for goal in obj.goal_moments.all():
+            players += [goal.goal_scorer, goal.assister]
+        return list({player.id: player for player in players if player is not None}.values())
+
+    def get_teams(self, obj: MatchResult) -> list:
+        teams = [obj.player_team, obj.cpu_team, *[player.team for player in self._players(obj)]]
+        unique_teams = {team.id: team for team in teams if team is not None}.values()
+        return list(TeamShortOutputSerializer(unique_teams, many=True, context=self.context).data)
+
+    def get_players(self, obj: MatchResult) -> list:
+        return list(PlayerNormalizedOutputSerializer(self._players(obj), many=True, context=self.context).data)
+
+    class Meta:
+        model = MatchResult
+        fields = (
+            "id",
+            "date",
+            "player_goals",
+            "cpu_goals",
+            "player_team",
+            "cpu_team",
+            "player_lineup",
+            "cpu_lineup",
+            "coins_reward",
+            "goal_moments",
+            "teams",
+            "players",
+        )
+
+
 class MatchResultShortOutputSerializer(serializers.ModelSerializer):
     date = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
     player_team = TeamShortOutputSerializer()
@@ -127,3 +215,43 @@ class MatchResultShortOutputSerializer(serializers.ModelSerializer):
             "player_team",
             "cpu_team",
         )
+
+
+class TeamStatsOutputSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TeamStats
+        fields = (
+            "matches_played",
+            "wins",
+            "draws",
+            "loses",
+            "goals_for",
+            "goals_against",
+            "clean_sheets",
+            "coins_earned",
+            "form",
+        )
+
+
+class PlayerSeasonStatsOutputSerializer(serializers.ModelSerializer):
+    player_id = serializers.IntegerField()
+    name = serializers.CharField(source="player.name")
+    preferred_position = serializers.CharField(source="player.preferred_position")
+
+    class Meta:
+        model = PlayerSeasonStats
+        fields = ("player_id", "name", "preferred_position", "matches_played", "goals", "assists")
+
+
+class TeamRankingOutputSerializer(serializers.ModelSerializer):
+    team = TeamShortOutputSerializer()
+
+    class Meta:
+        model = TeamRanking
+        fields = ("rank", "value", "team")
+
+
+class MatchJobOutputSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MatchJob
+        fields = ("id", "status", "match_result", "error")
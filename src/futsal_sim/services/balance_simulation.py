@@ -0,0 +1,173 @@
+"""
+Vectorized version of the match model, used for tuning constants.py offline.
+Formulas are taken from match_engine and the factories, so the numbers match production.
+"""
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+from src.futsal_sim.constants import (
+    ATTACKER_GOAL_PERC,
+    BASE_COINS_MATCH_WIN,
+    DEFENDER_GOAL_PERC,
+    GK_GOAL_PERC,
+    GOAL_AMOUNT_MU,
+    GOAL_AMOUNT_SIGMA,
+    GOAL_DIFF_MULTIPLIER,
+    MAX_CPU_DIFFICULTY_RATING,
+    MAX_GOAL_AMOUNT,
+    MIN_GOAL_AMOUNT,
+    MIN_PLAYER_SKILL,
+    MULTIPLIER_COIN_DRAW,
+    MULTIPLIER_COIN_LOSS,
+    MULTIPLIER_SKILL_DIFFERENCE,
+    PLAYER_AMOUNT_TEAM_SHEET,
+)
+from src.futsal_sim.models import PlayerPosition
+
+from .factories import PositionFactory, TeamOpponentFactory
+from .match_engine import calc_player_goal_chance
+
+# Same range MatchApi accepts
+DIFFICULTY_RATINGS = range(1, MAX_CPU_DIFFICULTY_RATING + 1)
+
+# Preferred position of each slot, in PositionFactory.positions order
+SLOT_POSITIONS = [
+    PlayerPosition.ATTACKER,
+    PlayerPosition.ATTACKER,
+    PlayerPosition.DEFENDER,
+    PlayerPosition.DEFENDER,
+    PlayerPosition.GOALKEEPER,
+]
+
+
+@dataclass(frozen=True)
+class DifficultyBalanceReport:
+    difficulty_rating: int
+    samples: int
+    win_rate: float
+    draw_rate: float
+    loss_rate: float
+    avg_player_goals: float
+    avg_cpu_goals: float
+    avg_coins: float
+    # 10th, 50th and 90th percentile
+    coins_percentiles: tuple[float, float, float]
+    scorer_shares: dict[PlayerPosition, float]
+
+
+def calc_coins_reward_vectorized(
+    *, player_skill: np.ndarray, cpu_skill: np.ndarray, player_goals: np.ndarray, cpu_goals: np.ndarray
+) -> np.ndarray:
+    """
+    Array version of match_engine.calc_coins_reward.
+    """
+    added_coins_for_win = BASE_COINS_MATCH_WIN + MULTIPLIER_SKILL_DIFFERENCE * (cpu_skill - player_skill)
+    goal_diff_effect = GOAL_DIFF_MULTIPLIER * (player_goals - cpu_goals)
+    added_coins = np.select(
+        [player_goals > cpu_goals, player_goals == cpu_goals],
+        [added_coins_for_win + goal_diff_effect, np.round(added_coins_for_win * MULTIPLIER_COIN_DRAW)],
+        default=np.round(added_coins_for_win * MULTIPLIER_COIN_LOSS) + goal_diff_effect,
+    )
+    return np.maximum(added_coins, 0)
+
+
+def _apply_scalar_formula(func: Callable[..., Any], *arrays: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the scalar production formula once for every point of the integer grid spanned
+    by the inputs, then looks each sample up. Skills are small integers, so this is exact and cheap.
+    """
+    lowest = [int(array.min()) for array in arrays]
+    offsets = tuple(array - low for array, low in zip(arrays, lowest))
+    shape = tuple(int(offset.max()) + 1 for offset in offsets)
+
+    grid = itertools.product(*(range(size) for size in shape))
+    table: Any = np.array([func(*(i + low for i, low in zip(index, lowest))) for index in grid])
+    table = table.reshape(shape + table.shape[1:])
+    return table[offsets]
+
+
+def _simulate_cpu_lineup_skill(player_skill: np.ndarray, difficulty: np.ndarray, rng: np.random.Generator) -> Any:
+    """
+    Generated cpu lineups play in their preferred positions with full stamina,
+    so their lineup skill is the rounded average of the generated player skills.
+    """
+    cpu_team_skill = _apply_scalar_formula(
+        lambda skill, rating: TeamOpponentFactory.calc_cpu_skill(player_skill=skill, difficulty_rating=rating),
+        player_skill,
+        difficulty,
+    )
+    bounds = _apply_scalar_formula(TeamOpponentFactory.calc_cpu_player_skill_bounds, cpu_team_skill)
+    # Mirrors random.randint(lower_b, upper_b), both ends inclusive
+    skills = rng.integers(bounds[:, :1], bounds[:, 1:] + 1, size=(len(player_skill), PLAYER_AMOUNT_TEAM_SHEET))
+    skills = np.maximum(skills, MIN_PLAYER_SKILL)
+    return np.round(skills.sum(axis=1) / PLAYER_AMOUNT_TEAM_SHEET)
+
+
+def simulate_balance(
+    *, samples: int, min_skill: int, max_skill: int, rng: np.random.Generator
+) -> list[DifficultyBalanceReport]:
+    """
+    Plays `samples` matches, with player lineup skill and difficulty rating drawn uniformly.
+    Player lineups are assumed fresh and in their preferred positions, so lineup skill equals team skill.
+    """
+    lowest_cpu_skill = TeamOpponentFactory.calc_cpu_skill(
+        player_skill=min_skill, difficulty_rating=DIFFICULTY_RATINGS[0]
+    )
+    if lowest_cpu_skill < MIN_PLAYER_SKILL:
+        raise ValueError(f"Min skill {min_skill} would generate cpu teams with skill below {MIN_PLAYER_SKILL}!")
+
+    difficulty = rng.integers(DIFFICULTY_RATINGS[0], DIFFICULTY_RATINGS[-1] + 1, size=samples)
+    player_skill: Any = rng.integers(min_skill, max_skill + 1, size=samples)
+    cpu_skill = _simulate_cpu_lineup_skill(player_skill, difficulty, rng)
+
+    # round(gauss + 0.5) clamped, same as match_engine.generate_goal_amount
+    goal_amount = np.round(rng.normal(GOAL_AMOUNT_MU, GOAL_AMOUNT_SIGMA, size=samples) + 0.5)
+    goal_amount = np.clip(goal_amount, MIN_GOAL_AMOUNT, MAX_GOAL_AMOUNT).astype(np.int64)
+
+    # A goal is the player's when a 1-100 roll is strictly lower than the goal chance
+    goal_chance: Any = calc_player_goal_chance(player_skill=player_skill, cpu_skill=cpu_skill)
+    player_goals = rng.binomial(goal_amount, np.clip(goal_chance - 1, 0, 100) / 100)
+    cpu_goals = goal_amount - player_goals
+
+    coins = calc_coins_reward_vectorized(
+        player_skill=player_skill, cpu_skill=cpu_skill, player_goals=player_goals, cpu_goals=cpu_goals
+    )
+
+    reports = []
+    for difficulty_rating in DIFFICULTY_RATINGS:
+        mask = difficulty == difficulty_rating
+        reports.append(
+            DifficultyBalanceReport(
+                difficulty_rating=difficulty_rating,
+                samples=int(mask.sum()),
+                win_rate=float(np.mean(player_goals[mask] > cpu_goals[mask])),
+                draw_rate=float(np.mean(player_goals[mask] == cpu_goals[mask])),
+                loss_rate=float(np.mean(player_goals[mask] < cpu_goals[mask])),
+                avg_player_goals=float(player_goals[mask].mean()),
+                avg_cpu_goals=float(cpu_goals[mask].mean()),
+                avg_coins=float(coins[mask].mean()),
+                coins_percentiles=(
+                    float(np.percentile(coins[mask], 10)),
+                    float(np.percentile(coins[mask], 50)),
+                    float(np.percentile(coins[mask], 90)),
+                ),
+                scorer_shares=_simulate_scorer_shares(int(goal_amount[mask].sum()), rng),
+            )
+        )
+    return reports
+
+
+def _simulate_scorer_shares(total_goals: int, rng: np.random.Generator) -> dict[PlayerPosition, float]:
+    # Scorer positions are drawn independently of skill, so all goals are split between slots in one draw
+    scorer_probs = PositionFactory.position_probabilities(
+        attacker_perc=ATTACKER_GOAL_PERC, defender_perc=DEFENDER_GOAL_PERC, goalkeeper_perc=GK_GOAL_PERC
+    )
+    slot_goals = rng.multinomial(total_goals, scorer_probs)
+
+    position_goals = {position: 0 for position in PlayerPosition}
+    for goals, position in zip(slot_goals, SLOT_POSITIONS):
+        position_goals[position] += int(goals)
+    return {position: goals / max(total_goals, 1) for position, goals in position_goals.items()}
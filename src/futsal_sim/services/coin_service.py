@@ -0,0 +1,41 @@
+"""
+Coin changes of teams, each applied with a single UPDATE and recorded in the CoinTransaction ledger.
+
+Balances are never read and written back, so concurrent requests of the same team can't overwrite each other.
+The coins of the passed team instance are adjusted in memory, other requests may have changed them meanwhile.
+"""
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+
+from src.futsal_sim.models import CoinTransaction, CoinTransactionReason, Team
+
+
+@transaction.atomic
+def spend_coins(*, team: Team, amount: int, reason: CoinTransactionReason, error_message: str = "Not enough coins!"):
+    """
+    :raises ValidationError: with error_message when the team has fewer than amount coins, nothing is changed then
+    """
+    # The balance check and the subtraction are one statement, so two purchases can't both pass the check
+    updated = Team.objects.filter(id=team.id, coins__gte=amount).update(
+        coins=F("coins") - amount, **Team.version_bump()
+    )
+    if not updated:
+        raise ValidationError(error_message)
+
+    CoinTransaction.objects.create(team=team, amount=-amount, reason=reason)
+    team.coins -= amount
+
+
+@transaction.atomic
+def add_coins(*, team: Team, amount: int, reason: CoinTransactionReason):
+    Team.objects.filter(id=team.id).update(coins=F("coins") + amount, **Team.version_bump())
+    CoinTransaction.objects.create(team=team, amount=amount, reason=reason)
+    team.coins += amount
+
+
+def record_coin_transactions(coin_transactions: list[CoinTransaction]):
+    """
+    Records coin changes applied by the caller, e.g. together with other counters of the team.
+    """
+    CoinTransaction.objects.bulk_create(coin_transactions)
@@ -0,0 +1,179 @@
+"""
+Pool of pre-generated cpu teams, so matches pick an existing opponent instead of generating one.
+
+Every process keeps an index of pooled lineup ids keyed by cpu team skill, lookups only fetch the picked lineup.
+The pool is filled by the refill_cpu_pool task and the fill_cpu_pool command.
+"""
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count
+
+from src.futsal_sim.constants import (
+    CPU_POOL_INDEX_TTL,
+    CPU_POOL_MAX_SKILL,
+    CPU_POOL_MIN_SKILL,
+    CPU_POOL_REFILL_THRESHOLD,
+    CPU_POOL_TEAMS_PER_SKILL,
+    MAX_CPU_DIFFICULTY_RATING,
+)
+from src.futsal_sim.models import CPUTeam, Team, TeamLineup
+
+from .business_models import TeamSheetPosition
+from .factories import TeamOpponentFactory
+
+CPU_POOL_SKILLS = range(CPU_POOL_MIN_SKILL, CPU_POOL_MAX_SKILL + 1)
+
+
+class CPUTeamPoolIndex:
+    """
+    In-process index of cpu lineup ids by cpu team skill, loaded with a single query and reloaded after
+    CPU_POOL_INDEX_TTL seconds. Hit and miss counters are per process.
+    """
+
+    def __init__(self):
+        self._lineup_ids: dict[int, list[int]] = {}
+        self._loaded_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+
+    def lineup_ids(self, skill: int) -> list[int]:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > CPU_POOL_INDEX_TTL:
+            self._load()
+        return self._lineup_ids.get(skill, [])
+
+    def add(self, skill: int, lineup_id: int):
+        self._lineup_ids.setdefault(skill, []).append(lineup_id)
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def _load(self):
+        lineup_ids: dict[int, list[int]] = {}
+        cpu_lineups = TeamLineup.objects.filter(team__cputeam__isnull=False).values_list("team__cputeam__skill", "id")
+        for skill, lineup_id in cpu_lineups:
+            lineup_ids.setdefault(skill, []).append(lineup_id)
+        self._lineup_ids = lineup_ids
+        self._loaded_at = time.monotonic()
+
+
+cpu_pool_index = CPUTeamPoolIndex()
+
+
+@dataclass(frozen=True)
+class CPUPoolStats:
+    total_teams: int
+    skills_covered: int
+    min_teams_per_skill: int
+    # Skills of CPU_POOL_SKILLS with fewer teams than the refill threshold
+    skills_below_threshold: list[int]
+    index_hits: int
+    index_misses: int
+
+
+def get_cpu_opponent(*, player_skill: int, difficulty_rating: int) -> Tuple[Team, TeamLineup]:
+    """
+    Picks a random pooled cpu team of the wanted skill, a team is only generated when the pool has none.
+    """
+    opponent_factory = TeamOpponentFactory(player_skill=player_skill, difficulty_rating=difficulty_rating)
+    cpu_team_skill = opponent_factory.cpu_team_skill
+
+    pooled_lineup = _find_pooled_lineup(cpu_team_skill)
+    if pooled_lineup:
+        cpu_pool_index.hits += 1
+        return pooled_lineup.team, pooled_lineup
+
+    cpu_pool_index.misses += 1
+    team, lineup = opponent_factory.create_cpu_team()
+    cpu_pool_index.add(cpu_team_skill, lineup.pk)
+    return team, lineup
+
+
+def get_cpu_opponents(*, player_skill: int, difficulty_rating: int, amount: int) -> list[Tuple[Team, TeamLineup]]:
+    """
+    Picks amount random pooled cpu teams of the wanted skill with a single query, a team can be picked repeatedly.
+    """
+    cpu_team_skill = TeamOpponentFactory.calc_cpu_skill(player_skill=player_skill, difficulty_rating=difficulty_rating)
+    lineup_ids = cpu_pool_index.lineup_ids(cpu_team_skill)
+    if not lineup_ids:
+        return [get_cpu_opponent(player_skill=player_skill, difficulty_rating=difficulty_rating)] * amount
+
+    picked_ids = random.choices(lineup_ids, k=amount)
+    qs = TeamLineup.objects.select_related("team", *[position.value for position in TeamSheetPosition])
+    lineups = qs.in_bulk(set(picked_ids))
+    cpu_pool_index.hits += sum(1 for lineup_id in picked_ids if lineup_id in lineups)
+
+    opponents = []
+    for lineup_id in picked_ids:
+        lineup = lineups.get(lineup_id)
+        if lineup is None:
+            # Index is stale, see _find_pooled_lineup
+            opponents.append(get_cpu_opponent(player_skill=player_skill, difficulty_rating=difficulty_rating))
+        else:
+            opponents.append((lineup.team, lineup))
+    return opponents
+
+
+def _find_pooled_lineup(cpu_team_skill: int, *, retry_if_stale: bool = True) -> Optional[TeamLineup]:
+    lineup_ids = cpu_pool_index.lineup_ids(cpu_team_skill)
+    if not lineup_ids:
+        return None
+
+    qs = TeamLineup.objects.select_related("team", *[position.value for position in TeamSheetPosition])
+    lineup = qs.filter(id=random.choice(lineup_ids)).first()
+    if lineup is None and retry_if_stale:
+        # Index is stale, e.g. the team was generated in a rolled back transaction
+        cpu_pool_index.invalidate()
+        return _find_pooled_lineup(cpu_team_skill, retry_if_stale=False)
+    return lineup
+
+
+def refill_cpu_pool(
+    *,
+    skills: range = CPU_POOL_SKILLS,
+    teams_per_skill: int = CPU_POOL_TEAMS_PER_SKILL,
+    refill_threshold: int = CPU_POOL_REFILL_THRESHOLD,
+) -> CPUPoolStats:
+    """
+    Generates teams for skills with fewer than refill_threshold pooled teams, up to teams_per_skill.
+    Each team is committed on its own, so an interrupted refill keeps its progress.
+    """
+    teams_by_skill = _count_pooled_teams(skills)
+    for skill in skills:
+        pooled_teams = teams_by_skill.get(skill, 0)
+        if pooled_teams >= refill_threshold:
+            continue
+
+        for _ in range(teams_per_skill - pooled_teams):
+            # Pooled teams are shared by all difficulties, the rating only affects their fake match history
+            difficulty_rating = random.randint(1, MAX_CPU_DIFFICULTY_RATING)
+            with transaction.atomic():
+                TeamOpponentFactory.for_cpu_skill(
+                    cpu_team_skill=skill, difficulty_rating=difficulty_rating
+                ).create_cpu_team()
+
+    cpu_pool_index.invalidate()
+    return cpu_pool_stats(skills=skills, refill_threshold=refill_threshold)
+
+
+def cpu_pool_stats(
+    *, skills: range = CPU_POOL_SKILLS, refill_threshold: int = CPU_POOL_REFILL_THRESHOLD
+) -> CPUPoolStats:
+    teams_by_skill = _count_pooled_teams(skills)
+    team_counts = [teams_by_skill.get(skill, 0) for skill in skills]
+    return CPUPoolStats(
+        total_teams=sum(team_counts),
+        skills_covered=sum(1 for count in team_counts if count),
+        min_teams_per_skill=min(team_counts, default=0),
+        skills_below_threshold=[skill for skill, count in zip(skills, team_counts) if count < refill_threshold],
+        index_hits=cpu_pool_index.hits,
+        index_misses=cpu_pool_index.misses,
+    )
+
+
+def _count_pooled_teams(skills: range) -> dict[int, int]:
+    qs = CPUTeam.objects.filter(skill__gte=skills.start, skill__lt=skills.stop)
+    return {row["skill"]: row["teams"] for row in qs.values("skill").annotate(teams=Count("id"))}
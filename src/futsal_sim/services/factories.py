@@ -1,10 +1,7 @@
+import itertools
 import random
 from typing import List, Optional, Tuple
 
-import faker
-import names
-
-from src.common.utils import get_object
 from src.futsal_sim.constants import (
     ASSIST_PERC,
     ATT_GENERATION_PERC_CHANCE,
@@ -30,64 +27,133 @@ from src.futsal_sim.constants import (
 )
 from src.futsal_sim.models import CPUTeam, Player, PlayerPosition, Team, TeamLineup
 from src.futsal_sim.services.business_models import TeamSheetPosition
+from src.futsal_sim.services.name_service import (
+    generate_player_names,
+    generate_team_names,
+)
+
+# Slot weights are integers out of this total, see _slot_weights
+SLOT_WEIGHTS_TOTAL = 200
+
+
+def _slot_weights(*, attacker_perc: int, defender_perc: int, goalkeeper_perc: int) -> list[int]:
+    """
+    Weight of each slot in TeamSheetPosition order, out of SLOT_WEIGHTS_TOTAL.
+    Positions used to be picked by comparing a 1-100 roll strictly against the percentage thresholds,
+    so attackers lose a percent to the goalkeeper.
+    """
+    if attacker_perc + defender_perc + goalkeeper_perc != 100:
+        raise ValueError("Percentages don't add up to 100!")
+
+    # Attackers and defenders are split evenly between both sides
+    return [attacker_perc - 1, attacker_perc - 1, defender_perc, defender_perc, 2 * (goalkeeper_perc + 1)]
+
+
+def _assister_cum_weights_by_scorer(weights: list[int]) -> dict[TeamSheetPosition, tuple[int, ...]]:
+    """
+    Assister tables conditioned on the scorer, the same as re-rolling assisters until they differ from the scorer.
+    """
+    return {
+        scorer_pos: tuple(
+            itertools.accumulate(
+                0 if position == scorer_pos else weight for position, weight in zip(TeamSheetPosition, weights)
+            )
+        )
+        for scorer_pos in TeamSheetPosition
+    }
 
 
 class PositionFactory:
     positions: List[TeamSheetPosition] = [position for position in TeamSheetPosition]
 
-    @staticmethod
-    def generate_goal_scorer_position() -> TeamSheetPosition:
-        return PositionFactory._generate_position(
-            attacker_perc=ATTACKER_GOAL_PERC, defender_perc=DEFENDER_GOAL_PERC, goalkeeper_perc=GK_GOAL_PERC
+    # Compiled once at import, percentages are validated here instead of on every goal
+    _scorer_cum_weights = tuple(
+        itertools.accumulate(
+            _slot_weights(
+                attacker_perc=ATTACKER_GOAL_PERC, defender_perc=DEFENDER_GOAL_PERC, goalkeeper_perc=GK_GOAL_PERC
+            )
         )
+    )
+    _assister_cum_weights = _assister_cum_weights_by_scorer(
+        _slot_weights(
+            attacker_perc=ATTACKER_ASSIST_PERC, defender_perc=DEFENDER_ASSIST_PERC, goalkeeper_perc=GK_ASSIST_PERC
+        )
+    )
 
     @staticmethod
-    def generate_assist_maker_position(scorer_pos: TeamSheetPosition) -> Optional[TeamSheetPosition]:
-        seed = random.randint(1, 100)
-        if seed > ASSIST_PERC:
-            return None
+    def generate_goal_scorer_position(*, rng: random.Random) -> TeamSheetPosition:
+        return PositionFactory.generate_goal_scorer_positions(1, rng=rng)[0]
 
-        new_pos = scorer_pos
-        while new_pos == scorer_pos:
-            new_pos = PositionFactory._generate_position(
-                attacker_perc=ATTACKER_ASSIST_PERC, defender_perc=DEFENDER_ASSIST_PERC, goalkeeper_perc=GK_ASSIST_PERC
-            )
+    @staticmethod
+    def generate_goal_scorer_positions(amount: int, *, rng: random.Random) -> list[TeamSheetPosition]:
+        return rng.choices(PositionFactory.positions, cum_weights=PositionFactory._scorer_cum_weights, k=amount)
 
-        return new_pos
+    @staticmethod
+    def generate_assist_maker_position(
+        scorer_pos: TeamSheetPosition, *, rng: random.Random
+    ) -> Optional[TeamSheetPosition]:
+        return PositionFactory.generate_assist_maker_positions([scorer_pos], rng=rng)[0]
 
     @staticmethod
-    def _generate_position(*, attacker_perc: int, defender_perc: int, goalkeeper_perc: int) -> TeamSheetPosition:
-        if attacker_perc + defender_perc + goalkeeper_perc != 100:
-            raise ValueError("Percentages don't add up to 100!")
+    def generate_assist_maker_positions(
+        scorer_positions: list[TeamSheetPosition], *, rng: random.Random
+    ) -> list[Optional[TeamSheetPosition]]:
+        """
+        :return: assister position for each of the scorers, None for goals without an assist
+        """
+        assist_chance = ASSIST_PERC / 100
+        positions = PositionFactory.positions
+        return [
+            rng.choices(positions, cum_weights=PositionFactory._assister_cum_weights[scorer_pos])[0]
+            if rng.random() < assist_chance
+            else None
+            for scorer_pos in scorer_positions
+        ]
 
-        seed = random.randint(1, 100)
-        side_seed = random.randint(0, 1)
-        if seed < attacker_perc:
-            return PositionFactory.positions[side_seed]
-        elif seed < defender_perc + attacker_perc:
-            # First two positions are attackers
-            return PositionFactory.positions[2 + side_seed]
-        else:
-            return TeamSheetPosition.GOALKEEPER
+    @staticmethod
+    def position_probabilities(*, attacker_perc: int, defender_perc: int, goalkeeper_perc: int) -> list[float]:
+        """
+        :return: probability of each slot being picked, in the same order as positions
+        """
+        weights = _slot_weights(
+            attacker_perc=attacker_perc, defender_perc=defender_perc, goalkeeper_perc=goalkeeper_perc
+        )
+        return [weight / SLOT_WEIGHTS_TOTAL for weight in weights]
 
 
 class TeamOpponentFactory:
-    def __init__(self, *, player_skill: int, difficulty_rating: int):
+    def __init__(self, *, player_skill: int, difficulty_rating: int, cpu_team_skill: Optional[int] = None):
+        """
+        :param cpu_team_skill: skill of the generated team, by default the one matching player_skill and
+        difficulty_rating, see calc_cpu_skill
+        """
         self.player_team_skill = player_skill
         self.difficulty_rating = difficulty_rating
-        self.cpu_team_skill = self._calc_cpu_skill()
+        if cpu_team_skill is None:
+            cpu_team_skill = self.calc_cpu_skill(player_skill=player_skill, difficulty_rating=difficulty_rating)
+        self.cpu_team_skill = cpu_team_skill
+
+    @classmethod
+    def for_cpu_skill(cls, *, cpu_team_skill: int, difficulty_rating: int) -> "TeamOpponentFactory":
+        """
+        Factory generating a cpu team of the given skill, used when filling the cpu opponent pool.
+        """
+        return cls(player_skill=cpu_team_skill, difficulty_rating=difficulty_rating, cpu_team_skill=cpu_team_skill)
 
-    def _calc_cpu_skill(self) -> int:
-        cpu_average = round(self.player_team_skill - 15 + (self.difficulty_rating * 2))
+    @staticmethod
+    def calc_cpu_skill(*, player_skill: int, difficulty_rating: int) -> int:
+        cpu_average = round(player_skill - 15 + (difficulty_rating * 2))
         return cpu_average
 
+    @staticmethod
+    def calc_cpu_player_skill_bounds(cpu_team_skill: int) -> Tuple[int, int]:
+        lower_b = round(cpu_team_skill - CPU_PLAYER_SKILL_VARIANCE_MULTIPLIER * cpu_team_skill)
+        upper_b = round(cpu_team_skill + CPU_PLAYER_SKILL_VARIANCE_MULTIPLIER * cpu_team_skill)
+        return lower_b, upper_b
+
     @staticmethod
     def _generate_random_team_name() -> str:
-        abbr = random.choice(["SC", "FC", "FK", "SK"])
-        seed = random.randint(0, 1)
-        if seed == 0:
-            return abbr + " " + faker.Faker().city()
-        return faker.Faker().city() + " " + abbr
+        return generate_team_names(1)[0]
 
     def _generate_match_stats_for_team(self, team: Team):
         matches_played = random.randint(CPU_MATCHES_PLAYED_LOWER_BOUND, CPU_MATCHES_PLAYED_UPPER_BOUND)
@@ -97,36 +163,25 @@ class TeamOpponentFactory:
         team.loses = max(0, round(matches_played * (0.33 - 0.06 * difficulty_diff)))
 
     def create_cpu_team(self) -> Tuple[Team, TeamLineup]:
-        team, lineup = self._find_existing_cpu_by_skill()
-        if team and lineup:
-            return team, lineup
-        return self._generate_cpu_team()
-
-    def _generate_cpu_team(self) -> Tuple[Team, TeamLineup]:
+        """
+        Generates a new cpu team with its lineup, existing teams are looked up in cpu_pool_service.
+        """
         name = self._generate_random_team_name()
         team = CPUTeam(name=name, skill=self.cpu_team_skill)
         self._generate_match_stats_for_team(team)
-        team.save()
-        lineup = self._generate_lineup(team)
-        return team, lineup
-
-    def _find_existing_cpu_by_skill(self) -> Tuple[Optional[Team], Optional[TeamLineup]]:
-        cpu_team = get_object(CPUTeam, skill=self.cpu_team_skill)
-        if cpu_team:
-            return cpu_team, cpu_team.teamlineup_set.all()[0]
 
-        return None, None
+        lower_b, upper_b = self.calc_cpu_player_skill_bounds(self.cpu_team_skill)
+        player_generator = PlayerFactory(team=team, lower_b=lower_b, upper_b=upper_b)
+        players_each_pos = player_generator.build_players_for_each_pos()
+        team.team_skill, team.average_skill = Team.calc_skills([player.skill for player in players_each_pos])
+        team.save()
+        player_generator.save_players(players_each_pos)
 
-    def _generate_lineup(self, team: Team) -> TeamLineup:
-        lower_b = round(self.cpu_team_skill - CPU_PLAYER_SKILL_VARIANCE_MULTIPLIER * self.cpu_team_skill)
-        upper_b = round(self.cpu_team_skill + CPU_PLAYER_SKILL_VARIANCE_MULTIPLIER * self.cpu_team_skill)
-        player_generator = PlayerFactory(
-            team=team,
-            lower_b=lower_b,
-            upper_b=upper_b,
-        )
-        players_each_pos = player_generator.create_players_for_each_pos()
+        lineup = self._generate_lineup(team, players_each_pos)
+        return team, lineup
 
+    @staticmethod
+    def _generate_lineup(team: Team, players_each_pos: List[Player]) -> TeamLineup:
         lineup = TeamLineup(
             team=team,
             right_attacker=players_each_pos[0],
@@ -146,55 +201,66 @@ class PlayerFactory:
         self.skill_upper_b = upper_b
 
     def create_players(self, amount: int) -> list[Player]:
-        players = []
-        for _ in range(amount):
-            player = self.create_player()
-            players.append(player)
-        return players
+        return self.save_players(self.build_players(amount))
 
     def create_players_for_each_pos(self) -> List[Player]:
         """
         :return: [right_attacker, left_attacker, right_defender, left_defender, goalkeeper]
         """
-        player_generator = PlayerFactory(
-            team=self.team,
-            lower_b=self.skill_lower_b,
-            upper_b=self.skill_upper_b,
-        )
-        right_attacker = player_generator.create_player(
-            player_position=PlayerPosition.ATTACKER, generate_with_history=True
-        )
-        left_attacker = player_generator.create_player(
-            player_position=PlayerPosition.ATTACKER, generate_with_history=True
-        )
-        right_defender = player_generator.create_player(
-            player_position=PlayerPosition.DEFENDER, generate_with_history=True
-        )
-        left_defender = player_generator.create_player(
-            player_position=PlayerPosition.DEFENDER, generate_with_history=True
-        )
-        goalkeeper = player_generator.create_player(
-            player_position=PlayerPosition.GOALKEEPER, generate_with_history=True
-        )
-        return [right_attacker, left_attacker, right_defender, left_defender, goalkeeper]
+        return self.save_players(self.build_players_for_each_pos())
 
     def create_player(self, *, generate_with_history: bool = False, player_position: Optional[PlayerPosition] = None):
-        player_name = self.generate_random_name()
-        player_position = player_position if player_position else self._generate_random_pos()
-        player_skill = self._generate_random_skill()
-        player = Player(
-            name=player_name,
-            preferred_position=player_position,
-            team=self.team,
-            skill=player_skill,
-        )
-        if generate_with_history:
-            self._generate_history_for_player(player)
-
+        positions = [player_position] if player_position else None
+        player = self.build_players(1, positions=positions, generate_with_history=generate_with_history)[0]
         player.save()
-
         return player
 
+    def build_players_for_each_pos(self) -> List[Player]:
+        """
+        Same as create_players_for_each_pos, without saving the players.
+        """
+        positions = [
+            PlayerPosition.ATTACKER,
+            PlayerPosition.ATTACKER,
+            PlayerPosition.DEFENDER,
+            PlayerPosition.DEFENDER,
+            PlayerPosition.GOALKEEPER,
+        ]
+        return self.build_players(len(positions), positions=positions, generate_with_history=True)
+
+    def build_players(
+        self,
+        amount: int,
+        *,
+        positions: Optional[List[PlayerPosition]] = None,
+        generate_with_history: bool = False,
+    ) -> list[Player]:
+        """
+        Generates players in memory only, see save_players.
+        :param positions: preferred position of each player, random if not passed
+        """
+        positions = positions or [self._generate_random_pos() for _ in range(amount)]
+        players = []
+        for player_name, player_position in zip(generate_player_names(amount), positions):
+            player = Player(
+                name=player_name,
+                preferred_position=player_position,
+                team=self.team,
+                skill=self._generate_random_skill(),
+            )
+            if generate_with_history:
+                self._generate_history_for_player(player)
+            players.append(player)
+        return players
+
+    @staticmethod
+    def save_players(players: list[Player]) -> list[Player]:
+        """
+        Saves the players with a single insert. Primary keys are set on the passed players,
+        which relies on the database returning rows from bulk inserts (Postgres, SQLite 3.35+).
+        """
+        return Player.objects.bulk_create(players)
+
     @staticmethod
     def _generate_bounds_for_contributions_multiplier(position: str) -> Tuple[float, float]:
         """
@@ -236,7 +302,3 @@ class PlayerFactory:
         if seed <= DEF_GENERATION_PERC_CHANCE + GK_GENERATION_PERC_CHANCE:
             return PlayerPosition.DEFENDER
         return PlayerPosition.ATTACKER
-
-    @staticmethod
-    def generate_random_name() -> str:
-        return names.get_full_name(gender="male")
@@ -0,0 +1,137 @@
+"""
+Stochastic match model, free of any ORM access.
+
+Everything random is drawn from the passed `random.Random`, so a match is reproducible
+from its seed and the engine can be run or benchmarked without a database.
+Slots are indices into TeamSheetPosition: right attacker, left attacker, right defender, left defender, goalkeeper.
+"""
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from src.futsal_sim.constants import (
+    BASE_COINS_MATCH_WIN,
+    GOAL_AMOUNT_MU,
+    GOAL_AMOUNT_SIGMA,
+    GOAL_DIFF_MULTIPLIER,
+    GOAL_SKILL_DIFF_PERC_MULTIPLIER,
+    MATCH_MAX_MINUTE,
+    MAX_GOAL_AMOUNT,
+    MIN_GOAL_AMOUNT,
+    MULTIPLIER_COIN_DRAW,
+    MULTIPLIER_COIN_LOSS,
+    MULTIPLIER_SKILL_DIFFERENCE,
+)
+
+from .business_models import TeamSheetPosition
+from .factories import PositionFactory
+
+GOALKEEPER_SLOT = PositionFactory.positions.index(TeamSheetPosition.GOALKEEPER)
+
+
+@dataclass(frozen=True)
+class SimulatedGoal:
+    minute: int
+    by_player_team: bool
+    scorer_slot: int
+    assister_slot: Optional[int]
+
+
+@dataclass(frozen=True)
+class SimulatedMatch:
+    player_goals: int
+    cpu_goals: int
+    coins_reward: int
+    goals: tuple[SimulatedGoal, ...]
+    # Indexed by slot, only the player team's lineup gets tired
+    lineup_stamina_drain: tuple[int, ...]
+    # One value per bench player of the player team
+    bench_stamina_regen: tuple[int, ...]
+
+
+def simulate_match(*, player_skill: int, cpu_skill: int, bench_size: int, rng: random.Random) -> SimulatedMatch:
+    """
+    :param player_skill: average skill of the player lineup
+    :param cpu_skill: average skill of the cpu lineup
+    :param bench_size: amount of player team players not in the lineup
+    """
+    goal_amount = generate_goal_amount(rng)
+    player_goal_chance = calc_player_goal_chance(player_skill=player_skill, cpu_skill=cpu_skill)
+    player_goals = sum(1 for _ in range(goal_amount) if rng.randint(1, 100) < player_goal_chance)
+    cpu_goals = goal_amount - player_goals
+
+    goals = _simulate_goals(player_goals=player_goals, cpu_goals=cpu_goals, rng=rng)
+
+    return SimulatedMatch(
+        player_goals=player_goals,
+        cpu_goals=cpu_goals,
+        coins_reward=calc_coins_reward(
+            player_skill=player_skill, cpu_skill=cpu_skill, player_goals=player_goals, cpu_goals=cpu_goals
+        ),
+        goals=goals,
+        lineup_stamina_drain=tuple(
+            _generate_stamina_drain(slot, rng) for slot in range(len(PositionFactory.positions))
+        ),
+        bench_stamina_regen=tuple(rng.randint(30, 40) for _ in range(bench_size)),
+    )
+
+
+def generate_goal_amount(rng: random.Random) -> int:
+    goal_gen = round(rng.gauss(GOAL_AMOUNT_MU, GOAL_AMOUNT_SIGMA) + 0.5)
+    return sorted((MIN_GOAL_AMOUNT, goal_gen, MAX_GOAL_AMOUNT))[1]
+
+
+def calc_player_goal_chance(*, player_skill: int, cpu_skill: int) -> int:
+    """
+    :return: player team scores a goal when a roll of 1-100 is strictly lower than this
+    """
+    return 50 + GOAL_SKILL_DIFF_PERC_MULTIPLIER * (player_skill - cpu_skill)
+
+
+def calc_coins_reward(*, player_skill: int, cpu_skill: int, player_goals: int, cpu_goals: int) -> int:
+    added_coins_for_win = BASE_COINS_MATCH_WIN + MULTIPLIER_SKILL_DIFFERENCE * (cpu_skill - player_skill)
+    goal_diff_effect = GOAL_DIFF_MULTIPLIER * (player_goals - cpu_goals)
+    if player_goals > cpu_goals:
+        added_coins = added_coins_for_win + goal_diff_effect
+    elif player_goals == cpu_goals:
+        added_coins = round(added_coins_for_win * MULTIPLIER_COIN_DRAW)
+    else:
+        added_coins = round(added_coins_for_win * MULTIPLIER_COIN_LOSS)
+        added_coins += goal_diff_effect
+
+    return max(added_coins, 0)
+
+
+def generate_goal_minutes(goal_amount: int, rng: random.Random) -> list[int]:
+    """
+    :return: distinct minutes in random order, at most one goal is scored in a minute
+    """
+    return rng.sample(range(1, MATCH_MAX_MINUTE + 1), goal_amount)
+
+
+def _simulate_goals(*, player_goals: int, cpu_goals: int, rng: random.Random) -> tuple[SimulatedGoal, ...]:
+    goal_amount = player_goals + cpu_goals
+    minutes = generate_goal_minutes(goal_amount, rng)
+    scorer_positions = PositionFactory.generate_goal_scorer_positions(goal_amount, rng=rng)
+    assister_positions = PositionFactory.generate_assist_maker_positions(scorer_positions, rng=rng)
+
+    slots = {position: slot for slot, position in enumerate(PositionFactory.positions)}
+    return tuple(
+        SimulatedGoal(
+            minute=minute,
+            by_player_team=by_player_team,
+            scorer_slot=slots[scorer_pos],
+            assister_slot=slots[assister_pos] if assister_pos else None,
+        )
+        for minute, by_player_team, scorer_pos, assister_pos in zip(
+            minutes, [True] * player_goals + [False] * cpu_goals, scorer_positions, assister_positions
+        )
+    )
+
+
+def _generate_stamina_drain(slot: int, rng: random.Random) -> int:
+    stamina_drained = rng.randint(10, 20)
+    if slot == GOALKEEPER_SLOT:
+        # Goalkeepers aren't as tired as other positions
+        stamina_drained = round(0.5 * stamina_drained)
+    return stamina_drained
@@ -0,0 +1,90 @@
+"""
+Matches played by a celery worker instead of the web worker handling the request.
+
+The request only stores a MatchJob, the play_match_job task is enqueued once the job is committed
+and the client polls the job until it's done or failed.
+Jobs left running by a worker that died are failed by the fail_stale_match_jobs task.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from src.common.utils import find_or_fail
+from src.futsal_sim.constants import MATCH_JOB_RUNNING_TIMEOUT
+from src.futsal_sim.models import MatchJob, MatchJobStatus, Team, TeamSheet
+
+from .business_models import TeamSheetPosition
+from .match_service import play_match_against_cpu
+from .teamsheet_service import validate_teamsheet_can_play_match
+
+logger = logging.getLogger(__name__)
+
+MATCH_JOB_ERROR = "Match could not be played, please try again."
+MATCH_JOB_TIMEOUT_ERROR = "Match timed out, please try again."
+
+
+def match_job_create(*, team_sheet: TeamSheet, difficulty_rating: int) -> MatchJob:
+    # Imported here, the tasks module imports the services
+    from src.tasks.tasks import play_match_job
+
+    job = MatchJob.objects.create(team=team_sheet.team, team_sheet=team_sheet, difficulty_rating=difficulty_rating)
+    transaction.on_commit(lambda: play_match_job.delay(job.id))
+    return job
+
+
+def match_job_retrieve(*, team: Team, job_id: int) -> MatchJob:
+    return find_or_fail(
+        MatchJob.objects.filter(team=team), error_message=f"Match job with id={job_id} not found!", id=job_id
+    )
+
+
+def match_job_run(*, job_id: int) -> MatchJob:
+    """
+    Plays the match of a pending job, jobs already picked up by another worker are left as they are.
+    """
+    # Claiming the job with a conditional update, so a redelivered task doesn't play the match twice
+    # updated_at tells since when it's running, see match_job_fail_stale
+    claimed = MatchJob.objects.filter(id=job_id, status=MatchJobStatus.PENDING).update(
+        status=MatchJobStatus.RUNNING, updated_at=timezone.now()
+    )
+    qs = MatchJob.objects.select_related(
+        "team_sheet__team", *[f"team_sheet__{position.value}" for position in TeamSheetPosition]
+    )
+    job = qs.get(id=job_id)
+    if not claimed:
+        return job
+
+    try:
+        if job.team_sheet is None:
+            raise ValidationError("Team sheet was deleted!")
+        validate_teamsheet_can_play_match(job.team_sheet)
+        job.match_result = play_match_against_cpu(
+            player_team_sheet=job.team_sheet, difficulty_rating=job.difficulty_rating
+        )
+        job.status = MatchJobStatus.DONE
+    except ValidationError as e:
+        job.status = MatchJobStatus.FAILED
+        job.error = "; ".join(str(detail) for detail in e.detail)[:256]
+    except Exception:
+        # Anything else is a bug or an outage, the job still has to end, its details stay in the logs
+        logger.exception("Match job %s failed", job_id)
+        job.status = MatchJobStatus.FAILED
+        job.error = MATCH_JOB_ERROR
+
+    job.save(update_fields=["status", "match_result", "error", "updated_at"])
+    return job
+
+
+def match_job_fail_stale(*, timeout: int = MATCH_JOB_RUNNING_TIMEOUT) -> int:
+    """
+    Fails jobs running for longer than timeout seconds, their worker died or was killed while playing the match.
+    :return: amount of failed jobs
+    """
+    now = timezone.now()
+    running_since = now - timedelta(seconds=timeout)
+    return MatchJob.objects.filter(status=MatchJobStatus.RUNNING, updated_at__lt=running_since).update(
+        status=MatchJobStatus.FAILED, error=MATCH_JOB_TIMEOUT_ERROR, updated_at=now
+    )
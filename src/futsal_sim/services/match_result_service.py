@@ -1,9 +1,11 @@
-from django.db.models import Q, QuerySet
+from django.db.models import Prefetch, Q, QuerySet
 
 from src.common.utils import find_or_fail
-from src.futsal_sim.models import MatchResult, Team
+from src.futsal_sim.models import MatchGoal, MatchResult, Team
 from src.users.models import User
 
+from .business_models import TeamSheetPosition
+
 
 class MatchResultReadService:
     def __init__(self, team: Team, user: User):
@@ -13,15 +15,46 @@ class MatchResultReadService:
     def query_set(self) -> QuerySet[MatchResult]:
         """
         User can only view matches for teams they own.
+        Meant for lookups by id, lists are paged over the parts of match_list instead.
         :return:
         """
         return MatchResult.objects.filter(
             Q(player_team=self.team) | Q(cpu_team=self.team, player_team__owner=self.user)
         )
 
-    def match_list(self) -> QuerySet[MatchResult]:
-        return self.query_set()
+    def _query_set_branches(self) -> list[QuerySet[MatchResult]]:
+        """
+        Disjoint parts of query_set, instead of an OR, so each one can page through its (team, date) index.
+        """
+        return [
+            MatchResult.objects.filter(player_team=self.team),
+            MatchResult.objects.filter(cpu_team=self.team, player_team__owner=self.user),
+        ]
+
+    def match_list(self) -> list[QuerySet[MatchResult]]:
+        """
+        :return: disjoint querysets of the matches, to be paged together with KeysetPagination.paginate_querysets
+        """
+        return [branch.select_related("player_team", "cpu_team") for branch in self._query_set_branches()]
 
-    def match_retrieve(self, match_id: int) -> QuerySet[MatchResult]:
-        self.query_set()
-        return find_or_fail(self.query_set(), error_message=f"Match result with id={match_id} not found!", id=match_id)
+    def detail_query_set(self) -> QuerySet[MatchResult]:
+        """
+        Everything MatchResultOutputSerializer walks, teams, lineup players with their teams
+        and goal moments, fetched in two queries.
+        """
+        lineup_players = [
+            f"{lineup}__{position.value}__team"
+            for lineup in ("player_lineup", "cpu_lineup")
+            for position in TeamSheetPosition
+        ]
+        goal_moments = MatchGoal.objects.select_related("team", "goal_scorer__team", "assister__team")
+        return (
+            self.query_set()
+            .select_related("player_team", "cpu_team", *lineup_players)
+            .prefetch_related(Prefetch("goal_moments", queryset=goal_moments))
+        )
+
+    def match_retrieve(self, match_id: int) -> MatchResult:
+        return find_or_fail(
+            self.detail_query_set(), error_message=f"Match result with id={match_id} not found!", id=match_id
+        )
@@ -1,202 +1,222 @@
-import dataclasses
 import random
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional, Tuple
-
-from src.futsal_sim.constants import (
-    BASE_COINS_MATCH_WIN,
-    GOAL_AMOUNT_MU,
-    GOAL_AMOUNT_SIGMA,
-    GOAL_DIFF_MULTIPLIER,
-    GOAL_SKILL_DIFF_PERC_MULTIPLIER,
-    MATCH_MAX_MINUTE,
-    MAX_GOAL_AMOUNT,
-    MIN_GOAL_AMOUNT,
-    MULTIPLIER_COIN_DRAW,
-    MULTIPLIER_COIN_LOSS,
-    MULTIPLIER_SKILL_DIFFERENCE,
-)
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
 from src.futsal_sim.models import (
+    CoinTransaction,
+    CoinTransactionReason,
     MatchGoal,
     MatchResult,
     Player,
-    PlayerPosition,
     Team,
     TeamLineup,
     TeamSheet,
 )
 
-from .business_models import TeamSheetPosition
-from .factories import PositionFactory, TeamOpponentFactory
-from .team_service import calc_team_skill
+from .coin_service import record_coin_transactions
+from .cpu_pool_service import get_cpu_opponent, get_cpu_opponents
+from .match_engine import SimulatedMatch, simulate_match
+from .stats_service import record_match_stats
 from .teamsheet_service import calc_sheet_lineup_average_skill, create_lineup_from_sheet
 
+# Seeds are stored on MatchResult, which is a signed bigint column
+MATCH_SEED_BITS = 63
 
-@dataclass
-class PlayerMatchMomentCreator:
-    match_result: MatchResult
-    goal_minutes: list[int] = dataclasses.field(default_factory=lambda: [])
-
-    def create_moments(self, *, goal_amount: int, lineup: TeamLineup):
-        """
-        :param goal_amount: how many goal moments should be created for passed lineup
-        :param lineup: set of players for which goal moment will be created for
-        """
-        for _ in range(goal_amount):
-            self._create_moment(lineup)
-        return self.goal_minutes
-
-    def _create_moment(self, lineup: TeamLineup):
-        scorer, scorer_pos = self._generate_scorer(lineup)
-        assister = self._generate_assister(lineup, scorer_pos)
-
-        minute = self._generate_random_minute()
-        MatchGoal(
-            minute=minute, team=lineup.team, goal_scorer=scorer, assister=assister, match=self.match_result
-        ).save()
-
-    def _generate_random_minute(self) -> int:
-        random_minute = random.randint(1, MATCH_MAX_MINUTE)
-        while random_minute in self.goal_minutes:
-            random_minute = random.randint(1, MATCH_MAX_MINUTE)
-
-        self.goal_minutes.append(random_minute)
-        return random_minute
-
-    @staticmethod
-    def _generate_scorer(lineup: TeamLineup) -> Tuple[Player, TeamSheetPosition]:
-        """
-        :return: Scorer of goal
-        """
-        position = PositionFactory.generate_goal_scorer_position()
-        player = getattr(lineup, position.value)
-        player.goals_scored += 1
-        player.save()
 
-        return player, position
+def _lineup_players(lineup: TeamLineup) -> list[Player]:
+    """
+    Lineups playing a match are complete, see validate_teamsheet_can_play_match.
+    """
+    return [player for player in lineup.players if player is not None]
 
-    @staticmethod
-    def _generate_assister(lineup: TeamLineup, scorer_pos: TeamSheetPosition) -> Optional[Player]:
-        position = PositionFactory.generate_assist_maker_position(scorer_pos)
 
-        player = None
-        if position:
-            player = getattr(lineup, position.value)
-            player.assists_made += 1
-            player.save()
+@dataclass
+class PlayedMatch:
+    """
+    Outcome of a match simulated in memory, not saved yet.
+    """
 
-        return player
+    match_result: MatchResult
+    goal_moments: list[MatchGoal]
+    player_lineup: TeamLineup
+    cpu_lineup: TeamLineup
 
 
 @dataclass
 class MatchInProgress:
+    """
+    ORM adapter around match_engine.simulate_match.
+    The match is first played out in memory, the outcome is then written in bulk,
+    so the amount of queries doesn't grow with the goal amount or squad size.
+    """
+
     player_skill: int
     cpu_skill: int
     player_team: Team
     cpu_team: Team
     player_lineup: TeamLineup
     cpu_lineup: TeamLineup
-    player_goals: int = 0
-    cpu_goals: int = 0
+    seed: int
 
     def play_match(self) -> MatchResult:
-        goal_amount = self._generate_goal_amount()
-
-        for i in range(goal_amount):
-            self._add_goal_to_score()
+        bench = _get_bench(self.player_team, self.player_lineup)
+        played_match = self.simulate(bench)
+        _persist_played_matches([played_match], player_team=self.player_team, bench=bench)
+        return played_match.match_result
 
-        match_result = self._create_match_result()
-        self._create_moments(match_result)
-        return match_result
+    def simulate(self, bench: list[Player]) -> PlayedMatch:
+        """
+        Plays the match in memory only, updating the stamina and stats of the players and the team counters.
+        """
+        simulation = simulate_match(
+            player_skill=self.player_skill,
+            cpu_skill=self.cpu_skill,
+            bench_size=len(bench),
+            rng=random.Random(self.seed),
+        )
 
-    def _create_moments(self, match_result: MatchResult):
-        goal_moment_creator = PlayerMatchMomentCreator(match_result=match_result)
-        goal_moment_creator.create_moments(goal_amount=self.player_goals, lineup=self.player_lineup)
-        goal_moment_creator.create_moments(goal_amount=self.cpu_goals, lineup=self.cpu_lineup)
+        match_result = self._create_match_result(simulation)
+        goal_moments = self._create_moments(match_result, simulation)
+        self._update_teams_with_result(simulation)
+        self._update_players(simulation, bench)
+        return PlayedMatch(
+            match_result=match_result,
+            goal_moments=goal_moments,
+            player_lineup=self.player_lineup,
+            cpu_lineup=self.cpu_lineup,
+        )
 
-    def _create_match_result(self) -> MatchResult:
-        coins = self._update_player_team_with_result()
-        match = MatchResult(
+    def _create_match_result(self, simulation: SimulatedMatch) -> MatchResult:
+        return MatchResult(
             player_team=self.player_team,
             cpu_team=self.cpu_team,
             player_lineup=self.player_lineup,
             cpu_lineup=self.cpu_lineup,
-            player_goals=self.player_goals,
-            cpu_goals=self.cpu_goals,
-            coins_reward=coins,
+            player_goals=simulation.player_goals,
+            cpu_goals=simulation.cpu_goals,
+            coins_reward=simulation.coins_reward,
+            seed=self.seed,
         )
-        match.save()
-        return match
-
-    @staticmethod
-    def _generate_goal_amount() -> int:
-        goal_gen = round(random.gauss(GOAL_AMOUNT_MU, GOAL_AMOUNT_SIGMA) + 0.5)
-        return sorted((MIN_GOAL_AMOUNT, goal_gen, MAX_GOAL_AMOUNT))[1]
-
-    def _add_goal_to_score(self):
-        player_goal_chance = 50 + GOAL_SKILL_DIFF_PERC_MULTIPLIER * (self.player_skill - self.cpu_skill)
 
-        seed = random.randint(1, 100)
-        if seed < player_goal_chance:
-            self.player_goals += 1
-        else:
-            self.cpu_goals += 1
-
-    def _update_player_team_with_result(self) -> int:
+    def _create_moments(self, match_result: MatchResult, simulation: SimulatedMatch) -> list[MatchGoal]:
+        goal_moments = []
+        for goal in simulation.goals:
+            team, lineup = (
+                (self.player_team, self.player_lineup) if goal.by_player_team else (self.cpu_team, self.cpu_lineup)
+            )
+            players = _lineup_players(lineup)
+            scorer = players[goal.scorer_slot]
+            assister = None if goal.assister_slot is None else players[goal.assister_slot]
+            # Counters of cpu players aren't stored, see _persist_played_matches
+            if goal.by_player_team:
+                scorer.goals_scored += 1
+                if assister is not None:
+                    assister.assists_made += 1
+
+            goal_moments.append(
+                MatchGoal(minute=goal.minute, team=team, goal_scorer=scorer, assister=assister, match=match_result)
+            )
+        return goal_moments
+
+    def _update_teams_with_result(self, simulation: SimulatedMatch):
         """
-        :return: coins gained
+        Updates counters of the player team in memory only, see _persist_played_matches.
         """
-        self._update_players()
-        added_coins_for_win = BASE_COINS_MATCH_WIN + MULTIPLIER_SKILL_DIFFERENCE * (self.cpu_skill - self.player_skill)
-        goal_diff_effect = GOAL_DIFF_MULTIPLIER * (self.player_goals - self.cpu_goals)
-        if self.player_goals > self.cpu_goals:
-            self.player_team.wins += 1
-            self.cpu_team.loses += 1
-            added_coins = added_coins_for_win + goal_diff_effect
-        elif self.player_goals == self.cpu_goals:
-            self.player_team.draws += 1
-            self.cpu_team.draws += 1
-            added_coins = round(added_coins_for_win * MULTIPLIER_COIN_DRAW)
-        else:
-            self.player_team.loses += 1
-            self.cpu_team.wins += 1
-            added_coins = round(added_coins_for_win * MULTIPLIER_COIN_LOSS)
-            added_coins += goal_diff_effect
-
-        added_coins = max(added_coins, 0)
-        self.player_team.coins += added_coins
-        self.player_team.save()
-        return added_coins
-
-    def regen_stamina(self):
-        for player in self.player_team.players.all():
-            if player not in self.player_lineup.players:
-                stamina_boost = random.randint(30, 40)
-                player.stamina_left = min(player.stamina_left + stamina_boost, 100)
-                player.save()
-
-    def _update_players(self):
-        self.regen_stamina()
-        for (player, position) in self.player_lineup.players_with_positions:
-            player.matches_played += 1
-            stamina_drained = random.randint(10, 20)
-            if position == PlayerPosition.GOALKEEPER:
-                # Goalkeepers aren't as tired as other positions
-                stamina_drained = round(0.5 * stamina_drained)
+        result_field = _result_field(
+            player_goals=simulation.player_goals, cpu_goals=simulation.cpu_goals, for_player=True
+        )
+        setattr(self.player_team, result_field, getattr(self.player_team, result_field) + 1)
+        self.player_team.coins += simulation.coins_reward
+
+    def _update_players(self, simulation: SimulatedMatch, bench: list[Player]):
+        for player, stamina_boost in zip(bench, simulation.bench_stamina_regen):
+            player.stamina_left = min(player.stamina_left + stamina_boost, 100)
 
+        for player, stamina_drained in zip(_lineup_players(self.player_lineup), simulation.lineup_stamina_drain):
+            player.matches_played += 1
             new_stamina = player.stamina_left - stamina_drained
             new_stamina = min(100, new_stamina)
             player.stamina_left = max(1, new_stamina)
-            player.save()
 
 
+def _result_field(*, player_goals: int, cpu_goals: int, for_player: bool) -> str:
+    """
+    :return: name of the Team counter which the match result increments
+    """
+    if player_goals == cpu_goals:
+        return "draws"
+    player_won = player_goals > cpu_goals
+    return "wins" if player_won == for_player else "loses"
+
+
+def _get_bench(player_team: Team, player_lineup: TeamLineup) -> list[Player]:
+    lineup_ids = [player.id for player in _lineup_players(player_lineup)]
+    return list(player_team.players.exclude(id__in=lineup_ids))
+
+
+def _persist_played_matches(played_matches: list[PlayedMatch], *, player_team: Team, bench: list[Player]):
+    """
+    Writes matches played by player_team in bulk, with one query per table rather than per match.
+    The amount of queries is bounded, not constant: goalless matches skip the goal insert and backends limiting
+    the parameters of a query, e.g. SQLite, split big inserts.
+
+    Only the side of player_team is counted. Pooled cpu teams are drawn by many users at once, updating their
+    counters and stats would lock the same rows in all of those matches and serialize them.
+    """
+    match_results = [played_match.match_result for played_match in played_matches]
+    goal_moments = [goal for played_match in played_matches for goal in played_match.goal_moments]
+    player_lineups = [played_match.player_lineup for played_match in played_matches]
+
+    MatchResult.objects.bulk_create(match_results)
+    MatchGoal.objects.bulk_create(goal_moments)
+
+    # Lineups repeat across matches of a batch, their players are the same instances
+    players = {player.id: player for lineup in player_lineups for player in _lineup_players(lineup)}
+    players.update({player.id: player for player in bench})
+    # bulk_update skips auto_now like update() does, see Team.version_bump
+    now = timezone.now()
+    for player in players.values():
+        player.updated_at = now
+    Player.objects.bulk_update(
+        players.values(), fields=["stamina_left", "matches_played", "goals_scored", "assists_made", "updated_at"]
+    )
+
+    # F() expressions, so concurrent matches of the same team don't overwrite each other's counters
+    player_results = Counter(
+        _result_field(player_goals=match.player_goals, cpu_goals=match.cpu_goals, for_player=True)
+        for match in match_results
+    )
+    Team.objects.filter(id=player_team.id).update(
+        **{field: F(field) + amount for field, amount in player_results.items()},
+        coins=F("coins") + sum(match.coins_reward for match in match_results),
+        **Team.version_bump(),
+    )
+    record_coin_transactions(
+        [
+            CoinTransaction(
+                team=player_team,
+                amount=match.coins_reward,
+                reason=CoinTransactionReason.MATCH_REWARD,
+                match_result=match,
+            )
+            # Rewards of 0 coins too, so every match played has its entry
+            for match in match_results
+        ]
+    )
+
+    record_match_stats(match_results=match_results, lineups=player_lineups, goal_moments=goal_moments)
+
+
+@transaction.atomic
 def play_match_against_cpu(*, player_team_sheet: TeamSheet, difficulty_rating: int) -> MatchResult:
     player_team = player_team_sheet.team
     player_lineup = create_lineup_from_sheet(player_team_sheet)
 
-    team_skill = calc_team_skill(player_team)
-    opponent_factory = TeamOpponentFactory(difficulty_rating=difficulty_rating, player_skill=team_skill)
-    cpu_team, cpu_lineup = opponent_factory.create_cpu_team()
+    cpu_team, cpu_lineup = get_cpu_opponent(player_skill=player_team.team_skill, difficulty_rating=difficulty_rating)
 
     player_lineup_skill = calc_sheet_lineup_average_skill(player_lineup)
     cpu_lineup_skill = calc_sheet_lineup_average_skill(cpu_lineup)
@@ -208,6 +228,69 @@ def play_match_against_cpu(*, player_team_sheet: TeamSheet, difficulty_rating: i
         cpu_team=cpu_team,
         player_lineup=player_lineup,
         cpu_lineup=cpu_lineup,
+        seed=random.getrandbits(MATCH_SEED_BITS),
     )
     match_res = match.play_match()
     return match_res
+
+
+@transaction.atomic
+def play_matches_against_cpu(
+    *, player_team_sheet: TeamSheet, difficulty_rating: int, match_amount: int
+) -> list[MatchResult]:
+    """
+    Plays match_amount matches in a row with a single lineup snapshot of the sheet.
+    Matches are played one after another in memory, so stamina drained in a match affects the next one,
+    all of them are then written together.
+    """
+    player_team = player_team_sheet.team
+    player_lineup = create_lineup_from_sheet(player_team_sheet)
+    bench = _get_bench(player_team, player_lineup)
+
+    opponents = get_cpu_opponents(
+        player_skill=player_team.team_skill, difficulty_rating=difficulty_rating, amount=match_amount
+    )
+
+    played_matches = []
+    for cpu_team, cpu_lineup in opponents:
+        match = MatchInProgress(
+            # Stamina of the lineup changes after every match, so its skill too
+            player_skill=calc_sheet_lineup_average_skill(player_lineup),
+            cpu_skill=calc_sheet_lineup_average_skill(cpu_lineup),
+            player_team=player_team,
+            cpu_team=cpu_team,
+            player_lineup=player_lineup,
+            cpu_lineup=cpu_lineup,
+            seed=random.getrandbits(MATCH_SEED_BITS),
+        )
+        played_matches.append(match.simulate(bench))
+
+    _persist_played_matches(played_matches, player_team=player_team, bench=bench)
+    return [played_match.match_result for played_match in played_matches]
+
+
+@dataclass(frozen=True)
+class MatchBatchSummary:
+    match_ids: list[int]
+    wins: int
+    draws: int
+    loses: int
+    goals_for: int
+    goals_against: int
+    coins_earned: int
+
+
+def summarize_matches(match_results: list[MatchResult]) -> MatchBatchSummary:
+    results = Counter(
+        _result_field(player_goals=match.player_goals, cpu_goals=match.cpu_goals, for_player=True)
+        for match in match_results
+    )
+    return MatchBatchSummary(
+        match_ids=[match.id for match in match_results],
+        wins=results["wins"],
+        draws=results["draws"],
+        loses=results["loses"],
+        goals_for=sum(match.player_goals for match in match_results),
+        goals_against=sum(match.cpu_goals for match in match_results),
+        coins_earned=sum(match.coins_reward for match in match_results),
+    )
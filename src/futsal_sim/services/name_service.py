@@ -0,0 +1,90 @@
+"""
+Name generation for generated players and cpu teams.
+
+The name corpora of the `names` package are loaded once per process, Faker instances once per thread.
+"""
+import bisect
+import functools
+import random
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+import faker
+import names
+
+TEAM_NAME_ABBREVIATIONS = ["SC", "FC", "FK", "SK"]
+
+# Used when no rng is passed, same as the module level functions of random
+_default_rng = random.Random()
+
+
+@dataclass(frozen=True)
+class NameCorpus:
+    names: tuple[str, ...]
+    # Cumulative frequency in percent, same order as names
+    cum_percents: array
+
+    def sample(self, amount: int, rng: random.Random) -> list[str]:
+        """
+        Same distribution as names.get_name, which picks the first name whose cumulative
+        frequency is greater than a uniform roll of 0-90.
+        """
+        last_index = len(self.names) - 1
+        return [
+            self.names[min(bisect.bisect_right(self.cum_percents, rng.random() * 90), last_index)]
+            for _ in range(amount)
+        ]
+
+
+@functools.cache
+def _load_corpus(filename: str) -> NameCorpus:
+    corpus_names = []
+    cum_percents = array("d")
+    with open(filename) as name_file:
+        for line in name_file:
+            name, _, cumulative, _ = line.split()
+            corpus_names.append(name.capitalize())
+            cum_percents.append(float(cumulative))
+    return NameCorpus(names=tuple(corpus_names), cum_percents=cum_percents)
+
+
+_thread_local = threading.local()
+
+
+def _faker() -> faker.Faker:
+    """
+    Faker of the current thread, generate_team_names reseeds it on every call,
+    so threads sharing one would interleave their seeds and generate the same names.
+    """
+    if not hasattr(_thread_local, "faker"):
+        # Loading the providers takes milliseconds, too slow to do on every call
+        _thread_local.faker = faker.Faker()
+    return _thread_local.faker
+
+
+def generate_player_names(amount: int, *, rng: Optional[random.Random] = None) -> list[str]:
+    """
+    :return: male full names, e.g. "James Smith"
+    """
+    rng = rng or _default_rng
+    first_names = _load_corpus(names.FILES["first:male"]).sample(amount, rng)
+    last_names = _load_corpus(names.FILES["last"]).sample(amount, rng)
+    return [f"{first_name} {last_name}" for first_name, last_name in zip(first_names, last_names)]
+
+
+def generate_team_names(amount: int, *, rng: Optional[random.Random] = None) -> list[str]:
+    """
+    :return: city names with a club abbreviation before or after them, e.g. "FC New Jamesville"
+    """
+    rng = rng or _default_rng
+    fake = _faker()
+    fake.seed_instance(rng.getrandbits(64))
+
+    team_names = []
+    for _ in range(amount):
+        abbr = rng.choice(TEAM_NAME_ABBREVIATIONS)
+        city = fake.city()
+        team_names.append(f"{abbr} {city}" if rng.randint(0, 1) == 0 else f"{city} {abbr}")
+    return team_names
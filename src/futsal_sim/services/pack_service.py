@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Tuple
 
-from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from src.futsal_sim.constants import (
     BRONZE_LOWER_BOUND,
@@ -15,9 +15,10 @@ from src.futsal_sim.constants import (
     SILVER_PRICE,
     SILVER_UPPER_BOUND,
 )
-from src.futsal_sim.models import Team
+from src.futsal_sim.models import CoinTransactionReason, Team
+from src.futsal_sim.services.coin_service import spend_coins
 from src.futsal_sim.services.factories import PlayerFactory
-from src.futsal_sim.services.team_service import calc_team_skill
+from src.futsal_sim.services.team_service import calc_squad_skills
 
 
 class PackType(Enum):
@@ -27,7 +28,7 @@ class PackType(Enum):
 
 
 def _get_lower_upper_bounds(team: Team, pack_type: PackType) -> Tuple[int, int]:
-    team_skill = calc_team_skill(team)
+    team_skill = team.team_skill
     match pack_type:
         case PackType.GOLD:
             lower_end = team_skill + GOLD_LOWER_BOUND
@@ -52,19 +53,21 @@ def get_pack_by_pack_type(pack_type: str) -> PackType:
     return pack_types[pack_type]
 
 
-def _validate_team_coins(*, team: Team, pack_type: PackType):
-    if team.coins < pack_type.value:
-        raise ValidationError("Not enough coins to buy this pack!")
-
-
+@transaction.atomic
 def buy_pack(*, team: Team, pack_type: str) -> list:
     pack_type_obj = get_pack_by_pack_type(pack_type)
-    _validate_team_coins(team=team, pack_type=pack_type_obj)
-    team.coins -= pack_type_obj.value
+    spend_coins(
+        team=team,
+        amount=pack_type_obj.value,
+        reason=CoinTransactionReason.PACK_PURCHASE,
+        error_message="Not enough coins to buy this pack!",
+    )
 
     lower_b, upper_b = _get_lower_upper_bounds(team, pack_type_obj)
     generator = PlayerFactory(team=team, lower_b=lower_b, upper_b=upper_b)
     players = generator.create_players(PLAYER_AMOUNT_IN_PACK)
 
-    team.save()  # Save spent coins
+    team.team_skill, team.average_skill = calc_squad_skills(team)
+    # Coins were already spent with a conditional update, saving them here could overwrite a concurrent change
+    team.save(update_fields=["team_skill", "average_skill", "updated_at"])
     return players
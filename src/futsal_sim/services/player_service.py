@@ -21,7 +21,7 @@ class PlayerReadService:
         self.team = team
 
     def query_set(self) -> QuerySet[Player]:
-        return Player.objects.filter(team=self.team)
+        return Player.objects.filter(team=self.team).select_related("team")
 
     def player_list(self, *, filters=None) -> QuerySet[Player]:
         filters = filters or {}
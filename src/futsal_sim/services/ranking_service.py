@@ -0,0 +1,57 @@
+"""
+Leaderboards of player teams, precomputed into TeamRanking so requests never sort all teams.
+
+rebuild_rankings runs periodically in the refresh_leaderboard task, requests read pages by rank
+and the rank of a team through the unique indexes of TeamRanking.
+"""
+from django.db import transaction
+from django.db.models import QuerySet
+
+from src.futsal_sim.models import RankingMetric, Team, TeamRanking
+
+BATCH_SIZE = 2000
+
+
+def _win_rate(*, wins: int, draws: int, loses: int) -> float:
+    matches_played = wins + draws + loses
+    return wins / matches_played if matches_played else 0.0
+
+
+def rebuild_rankings() -> int:
+    """
+    Recomputes the leaderboards of all metrics and replaces the previous ones in a single transaction.
+    :return: amount of ranked teams
+    """
+    values_by_metric: dict[RankingMetric, list[tuple[float, int]]] = {metric: [] for metric in RankingMetric}
+    teams = Team.objects.filter(owner__isnull=False).only("id", "wins", "draws", "loses", "coins", "team_skill")
+    for team in teams.iterator(chunk_size=BATCH_SIZE):
+        win_rate = _win_rate(wins=team.wins, draws=team.draws, loses=team.loses)
+        values_by_metric[RankingMetric.WINS].append((team.wins, team.id))
+        values_by_metric[RankingMetric.WIN_RATE].append((win_rate, team.id))
+        values_by_metric[RankingMetric.COINS].append((team.coins, team.id))
+        values_by_metric[RankingMetric.TEAM_SKILL].append((team.team_skill, team.id))
+
+    rankings = []
+    for metric, values in values_by_metric.items():
+        # Highest value first, older teams first on ties
+        values.sort(key=lambda item: (-item[0], item[1]))
+        rankings += [
+            TeamRanking(metric=metric, rank=rank, team_id=team_id, value=value)
+            for rank, (value, team_id) in enumerate(values, start=1)
+        ]
+
+    with transaction.atomic():
+        TeamRanking.objects.all().delete()
+        TeamRanking.objects.bulk_create(rankings, batch_size=BATCH_SIZE)
+    return len(values_by_metric[RankingMetric.WINS])
+
+
+def leaderboard_list(*, metric: RankingMetric) -> QuerySet[TeamRanking]:
+    return TeamRanking.objects.filter(metric=metric).select_related("team")
+
+
+def team_rankings(team: Team) -> dict[str, TeamRanking]:
+    """
+    :return: ranking of the team by metric, teams created since the last rebuild aren't ranked yet
+    """
+    return {ranking.metric: ranking for ranking in TeamRanking.objects.filter(team=team)}
@@ -0,0 +1,224 @@
+"""
+Incrementally maintained TeamStats and PlayerSeasonStats.
+
+Matches update the aggregates of the player team in the transaction that stores them,
+rebuild_stats recomputes everything from the match history. Pooled cpu teams are shared by every user,
+so they have no stats, see match_service._persist_played_matches.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F, QuerySet
+
+from src.futsal_sim.constants import TEAM_FORM_MATCH_AMOUNT, TOP_SCORERS_AMOUNT
+from src.futsal_sim.models import (
+    MatchGoal,
+    MatchResult,
+    PlayerSeasonStats,
+    Team,
+    TeamLineup,
+    TeamStats,
+)
+
+from .business_models import TeamSheetPosition
+
+TEAM_STATS_FIELDS = [
+    "matches_played",
+    "wins",
+    "draws",
+    "loses",
+    "goals_for",
+    "goals_against",
+    "clean_sheets",
+    "coins_earned",
+    "form",
+]
+PLAYER_STATS_FIELDS = ["matches_played", "goals", "assists"]
+
+
+@dataclass(frozen=True)
+class TeamMatchResult:
+    team_id: int
+    goals_for: int
+    goals_against: int
+    coins_earned: int
+
+
+@dataclass
+class PlayerContribution:
+    matches_played: int = 0
+    goals: int = 0
+    assists: int = 0
+
+
+def team_stats_retrieve(team: Team) -> TeamStats:
+    """
+    :return: stats of the team, not saved empty stats if it hasn't played yet
+    """
+    return TeamStats.objects.filter(team=team).first() or TeamStats(team=team)
+
+
+def top_scorers_list(team: Team) -> QuerySet[PlayerSeasonStats]:
+    return (
+        PlayerSeasonStats.objects.filter(team=team, goals__gt=0)
+        .select_related("player")
+        .order_by("-goals", "-assists")[:TOP_SCORERS_AMOUNT]
+    )
+
+
+def record_match_stats(*, match_results: list[MatchResult], lineups: list[TeamLineup], goal_moments: list[MatchGoal]):
+    """
+    Adds played matches to the stats of their player teams and players,
+    expects to run in the transaction storing the matches.
+    :param match_results: in the order they were played
+    :param lineups: player lineup of every match, a lineup playing several matches is repeated
+    :param goal_moments: goals of the cpu teams are skipped
+    """
+    player_team_ids = {match.player_team_id for match in match_results}
+    contributions: dict[tuple[int, int], PlayerContribution] = defaultdict(PlayerContribution)
+    for lineup in lineups:
+        for player_id in _lineup_player_ids(lineup):
+            contributions[(lineup.team_id, player_id)].matches_played += 1
+    _add_goals(
+        contributions,
+        (
+            (goal.team_id, goal.goal_scorer_id, goal.assister_id)
+            for goal in goal_moments
+            if goal.team_id in player_team_ids
+        ),
+    )
+
+    _apply_team_results([_team_match_result(match) for match in match_results])
+    _apply_player_contributions(contributions)
+
+
+def _lineup_player_ids(lineup: TeamLineup) -> list[int]:
+    player_ids = [getattr(lineup, f"{position.value}_id") for position in TeamSheetPosition]
+    return [player_id for player_id in player_ids if player_id is not None]
+
+
+def _team_match_result(match_result: MatchResult) -> TeamMatchResult:
+    return TeamMatchResult(
+        team_id=match_result.player_team_id,
+        goals_for=match_result.player_goals,
+        goals_against=match_result.cpu_goals,
+        coins_earned=match_result.coins_reward,
+    )
+
+
+def _add_goals(
+    contributions: dict[tuple[int, int], PlayerContribution],
+    goals: Iterable[tuple[int, int, Optional[int]]],
+):
+    """
+    :param goals: team id, scorer id and assister id of each goal
+    """
+    for team_id, scorer_id, assister_id in goals:
+        contributions[(team_id, scorer_id)].goals += 1
+        if assister_id is not None:
+            contributions[(team_id, assister_id)].assists += 1
+
+
+def _add_team_result(stats: TeamStats, result: TeamMatchResult):
+    stats.matches_played += 1
+    stats.goals_for += result.goals_for
+    stats.goals_against += result.goals_against
+    stats.coins_earned += result.coins_earned
+    if result.goals_against == 0:
+        stats.clean_sheets += 1
+
+    if result.goals_for > result.goals_against:
+        stats.wins += 1
+        form_result = "W"
+    elif result.goals_for == result.goals_against:
+        stats.draws += 1
+        form_result = "D"
+    else:
+        stats.loses += 1
+        form_result = "L"
+    stats.form = (form_result + stats.form)[:TEAM_FORM_MATCH_AMOUNT]
+
+
+def _apply_team_results(results: list[TeamMatchResult]):
+    team_ids = sorted({result.team_id for result in results})
+    # Rows are created first, so they can be locked, concurrent matches of a team then update them in turns
+    TeamStats.objects.bulk_create([TeamStats(team_id=team_id) for team_id in team_ids], ignore_conflicts=True)
+    stats_qs = TeamStats.objects.select_for_update().filter(team_id__in=team_ids).order_by("team_id")
+    stats_by_team = {stats.team_id: stats for stats in stats_qs}
+
+    for result in results:
+        _add_team_result(stats_by_team[result.team_id], result)
+    TeamStats.objects.bulk_update(stats_by_team.values(), fields=TEAM_STATS_FIELDS)
+
+
+def _apply_player_contributions(contributions: dict[tuple[int, int], PlayerContribution]):
+    keys = sorted(contributions)
+    PlayerSeasonStats.objects.bulk_create(
+        [PlayerSeasonStats(team_id=team_id, player_id=player_id) for team_id, player_id in keys],
+        ignore_conflicts=True,
+    )
+    stats_qs = (
+        PlayerSeasonStats.objects.select_for_update()
+        .filter(team_id__in={team_id for team_id, _ in keys}, player_id__in={player_id for _, player_id in keys})
+        .order_by("id")
+    )
+
+    updated_stats = []
+    for stats in stats_qs:
+        contribution = contributions.get((stats.team_id, stats.player_id))
+        if contribution is None:
+            continue
+        stats.matches_played += contribution.matches_played
+        stats.goals += contribution.goals
+        stats.assists += contribution.assists
+        updated_stats.append(stats)
+    PlayerSeasonStats.objects.bulk_update(updated_stats, fields=PLAYER_STATS_FIELDS)
+
+
+@transaction.atomic
+def rebuild_stats(*, chunk_size: int = 2000) -> tuple[int, int]:
+    """
+    Recomputes all stats from the match history, streamed in chunks of chunk_size rows.
+    :return: amount of team stats and player stats rows
+    """
+    TeamStats.objects.all().delete()
+    PlayerSeasonStats.objects.all().delete()
+
+    team_stats: dict[int, TeamStats] = {}
+    contributions: dict[tuple[int, int], PlayerContribution] = defaultdict(PlayerContribution)
+
+    lineup_fields = [f"player_lineup__{position.value}_id" for position in TeamSheetPosition]
+    matches = MatchResult.objects.order_by("date", "id").values(
+        "player_team_id", "player_goals", "cpu_goals", "coins_reward", *lineup_fields
+    )
+    for match in matches.iterator(chunk_size=chunk_size):
+        match_result = MatchResult(
+            player_team_id=match["player_team_id"],
+            player_goals=match["player_goals"],
+            cpu_goals=match["cpu_goals"],
+            coins_reward=match["coins_reward"],
+        )
+        stats = team_stats.setdefault(match["player_team_id"], TeamStats(team_id=match["player_team_id"]))
+        _add_team_result(stats, _team_match_result(match_result))
+
+        for position in TeamSheetPosition:
+            player_id = match[f"player_lineup__{position.value}_id"]
+            if player_id is not None:
+                contributions[(match["player_team_id"], player_id)].matches_played += 1
+
+    goals = MatchGoal.objects.filter(team_id=F("match__player_team_id")).values_list(
+        "team_id", "goal_scorer_id", "assister_id"
+    )
+    _add_goals(contributions, goals.iterator(chunk_size=chunk_size))
+
+    TeamStats.objects.bulk_create(team_stats.values(), batch_size=chunk_size)
+    PlayerSeasonStats.objects.bulk_create(
+        (
+            PlayerSeasonStats(team_id=team_id, player_id=player_id, **vars(contribution))
+            for (team_id, player_id), contribution in contributions.items()
+        ),
+        batch_size=chunk_size,
+    )
+    return len(team_stats), len(contributions)
@@ -1,5 +1,9 @@
+from typing import Tuple
+
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
 from django.db.models import Avg, Q, QuerySet
+from django.utils import timezone
 
 from src.common.services import model_update
 from src.common.utils import find_or_fail
@@ -12,7 +16,9 @@ from src.futsal_sim.constants import (
     TEAM_SKILL_CALC_PLAYER_AMOUNT,
 )
 from src.futsal_sim.filters import TeamFilter
-from src.futsal_sim.models import Player, Team, TeamSheet
+from src.futsal_sim.models import CoinTransactionReason, Player, Team, TeamSheet
+from src.futsal_sim.services.business_models import TeamSheetPosition
+from src.futsal_sim.services.coin_service import add_coins
 from src.futsal_sim.services.factories import PlayerFactory
 from src.users.models import User
 
@@ -38,14 +44,15 @@ class TeamCRUDService:
     def team_create(self, *, name: str) -> Team:
         team = Team(name=name, owner=self.user, coins=BASE_COIN_AMOUNT)
         team.full_clean()
-        team.save()
 
         generator = PlayerFactory(
             team=team, lower_b=SKILL_LOWER_BOUND_CREATED_TEAM, upper_b=SKILL_UPPER_BOUND_CREATED_TEAM
         )
-        generator.create_players_for_each_pos()
-
-        generator.create_players(CREATE_TEAM_PLAYER_AMOUNT_ABOVE_MIN)
+        players = generator.build_players_for_each_pos()
+        players += generator.build_players(CREATE_TEAM_PLAYER_AMOUNT_ABOVE_MIN)
+        team.team_skill, team.average_skill = Team.calc_skills([player.skill for player in players])
+        team.save()
+        generator.save_players(players)
 
         if not self.user.active_team:
             # self.user.active_team = team
@@ -57,6 +64,7 @@ class TeamCRUDService:
         team = self.team_retrieve(team_id=team_id)
         validate_owner_of_team_perms(team=team, user=self.user)
         team, _ = model_update(instance=team, fields=["name"], data={"name": name})
+        bump_team_version(team_id=team.id)
         return team
 
     def team_delete(
@@ -82,7 +90,25 @@ def validate_owner_of_team_perms(*, user: User, team: Team):
         raise PermissionDenied("Only team owners can perform this action!")
 
 
+def bump_team_version(*, team_id: int):
+    """
+    Invalidates the ETags of the team, its squad and its sheets, for changes not updating the team row anyway.
+    """
+    Team.objects.filter(id=team_id).update(**Team.version_bump())
+
+
+def calc_squad_skills(team: Team) -> Tuple[int, int]:
+    """
+    Recalculates the denormalized skills of the team after its squad changed.
+    :return: team_skill and average_skill
+    """
+    return Team.calc_skills(list(Player.objects.filter(team=team.id).values_list("skill", flat=True)))
+
+
 def calc_team_skill(team: Team) -> int:
+    """
+    Aggregate query version of Team.team_skill, reads should use the field, see check_team_skills.
+    """
     # Take x most skillful players and calculate their skill average
     team_skill = (
         Player.objects.filter(team=team.id)
@@ -93,10 +119,14 @@ def calc_team_skill(team: Team) -> int:
 
 
 def calc_average_skill(team: Team) -> int:
+    """
+    Aggregate query version of Team.average_skill.
+    """
     average_player_skill = Player.objects.filter(team=team.id).aggregate(Avg("skill"))["skill__avg"]
     return round(average_player_skill) if average_player_skill else 0
 
 
+@transaction.atomic
 def team_sell_players(*, team: Team, player_ids: list[int], user: User) -> Team:
     validate_owner_of_team_perms(team=team, user=user)
     new_squad_size = team.players.count() - len(player_ids)
@@ -105,41 +135,35 @@ def team_sell_players(*, team: Team, player_ids: list[int], user: User) -> Team:
             f"Error selling player(s), you can't have less than {PLAYER_AMOUNT_TEAM_SHEET} players left!"
         )
 
-    player_qs: QuerySet[Player] = Player.objects.filter(pk__in=player_ids)
+    player_qs: QuerySet[Player] = Player.objects.filter(pk__in=player_ids, team=team)
 
     players: list[Player] = list(player_qs.all())
-    team_avg = calc_team_skill(team)
+    team_avg = team.team_skill
     total_sell_price = sum([player.calc_sell_price(team_avg) for player in players])
 
-    player_qs.update(team=None)
-    update_sheets_after_sell(player_qs)
-
-    new_coin_amount = team.coins + total_sell_price
-    team, _ = model_update(instance=team, fields=["coins"], data={"coins": new_coin_amount})
+    # Players sold by a concurrent request are no longer in the team, so they can't be paid for twice
+    if player_qs.update(team=None) != len(set(player_ids)):
+        raise ValidationError("Error selling player(s), some of them aren't in the team anymore!")
+    update_sheets_after_sell(player_ids)
+
+    add_coins(team=team, amount=total_sell_price, reason=CoinTransactionReason.PLAYER_SALE)
+    team_skill, average_skill = calc_squad_skills(team)
+    team, _ = model_update(
+        instance=team,
+        fields=["team_skill", "average_skill"],
+        data={"team_skill": team_skill, "average_skill": average_skill},
+    )
 
     return team
 
 
-def update_sheets_after_sell(player_qs: QuerySet[Player]):
-    # Get all team sheets related to the sold players
-    team_sheets_qs = TeamSheet.objects.filter(
-        Q(right_attacker__in=player_qs)
-        | Q(left_attacker__in=player_qs)
-        | Q(right_defender__in=player_qs)
-        | Q(left_defender__in=player_qs)
-        | Q(goalkeeper__in=player_qs)
-    )
-
-    # Loop through each sheet and set the related position to null
-    for team_sheet in team_sheets_qs:
-        if team_sheet.right_attacker in player_qs:
-            team_sheet.right_attacker = None
-        elif team_sheet.left_attacker in player_qs:
-            team_sheet.left_attacker = None
-        elif team_sheet.right_defender in player_qs:
-            team_sheet.right_defender = None
-        elif team_sheet.left_defender in player_qs:
-            team_sheet.left_defender = None
-        elif team_sheet.goalkeeper in player_qs:
-            team_sheet.goalkeeper = None
-        team_sheet.save()
+def update_sheets_after_sell(player_ids: list[int]):
+    """
+    Empties the slots of the sold players in all team sheets, one update per slot,
+    so the query count doesn't depend on the amount of sheets or sold players.
+    """
+    now = timezone.now()
+    for position in TeamSheetPosition:
+        TeamSheet.objects.filter(**{f"{position.value}_id__in": player_ids}).update(
+            **{position.value: None, "updated_at": now}
+        )
@@ -10,6 +10,7 @@ from src.futsal_sim.models import Team, TeamLineup, TeamPlayersInPositions, Team
 
 from .business_models import TeamSheetPosition
 from .player_service import PlayerSkillCalculator
+from .team_service import bump_team_version
 
 
 class TeamSheetCRUDService:
@@ -17,7 +18,10 @@ class TeamSheetCRUDService:
         self.team = team
 
     def query_set(self) -> QuerySet[TeamSheet]:
-        return TeamSheet.objects.filter(team=self.team)
+        # Players with their teams, which are part of the serialized players
+        return TeamSheet.objects.filter(team=self.team).select_related(
+            "team", *[f"{position.value}__team" for position in TeamSheetPosition]
+        )
 
     def teamsheet_list(self, filters=None) -> QuerySet[TeamSheet]:
         filters = filters or {}
@@ -35,7 +39,7 @@ class TeamSheetCRUDService:
         left_attacker: Optional[int] = None,
         right_defender: Optional[int] = None,
         left_defender: Optional[int] = None,
-        goalkeeper: Optional[int] = None
+        goalkeeper: Optional[int] = None,
     ) -> TeamSheet:
         team_sheet = TeamSheet(
             name=name,
@@ -48,6 +52,7 @@ class TeamSheetCRUDService:
         )
         team_sheet.full_clean()
         team_sheet.save()
+        bump_team_version(team_id=self.team.id)
 
         return team_sheet
 
@@ -60,7 +65,7 @@ class TeamSheetCRUDService:
         left_attacker: int,
         right_defender: int,
         left_defender: int,
-        goalkeeper: int
+        goalkeeper: int,
     ) -> TeamSheet:
 
         teamsheet = self.teamsheet_retrieve(teamsheet_id=teamsheet_id)
@@ -83,11 +88,13 @@ class TeamSheetCRUDService:
                 "goalkeeper_id": goalkeeper,
             },
         )
+        bump_team_version(team_id=self.team.id)
         return teamsheet
 
     def teamsheet_delete(self, teamsheet_id: int):
         teamsheet = self.teamsheet_retrieve(teamsheet_id=teamsheet_id)
         teamsheet.delete()
+        bump_team_version(team_id=self.team.id)
 
 
 def calc_sheet_lineup_average_skill(team_sheet_or_lineup: TeamPlayersInPositions) -> int:
@@ -110,13 +117,14 @@ def validate_teamsheet_can_play_match(team_sheet: TeamSheet):
 
 
 def create_lineup_from_sheet(team_sheet: TeamSheet) -> TeamLineup:
-    lineup = TeamLineup(
-        team=team_sheet.team,
-        right_attacker=team_sheet.right_attacker,
-        left_attacker=team_sheet.left_attacker,
-        right_defender=team_sheet.right_defender,
-        left_defender=team_sheet.left_defender,
-        goalkeeper=team_sheet.goalkeeper,
-    )
-    lineup.save()
+    """
+    Lineups are shared by all matches played with the same players, a new one is only stored
+    the first time the players play together.
+    """
+    players = {position.value: getattr(team_sheet, position.value) for position in TeamSheetPosition}
+    lineup, _ = TeamLineup.objects.get_or_create(team=team_sheet.team, **players)
+    # Same instances as the sheet, so the players aren't fetched again and changes made during the match are shared
+    lineup.team = team_sheet.team
+    for position, player in players.items():
+        setattr(lineup, position, player)
     return lineup
@@ -0,0 +1,168 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.api.response_cache import response_cache_stats
+from src.futsal_sim.models import Team
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.match_service import play_match_against_cpu
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class ConditionalGetTests(APITestCase):
+    # Savepoints of the atomic request and the team, the session and the user come from the cache
+    NOT_MODIFIED_QUERIES = 3
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Etag FC")
+        self.players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=self.players[0].id,
+            left_attacker=self.players[1].id,
+            right_defender=self.players[2].id,
+            left_defender=self.players[3].id,
+            goalkeeper=self.players[4].id,
+        )
+        self.client.force_login(self.user)
+
+        self.urls = [
+            reverse("api:futsal_sim:teams-detail", kwargs={"pk": self.team.id}),
+            reverse("api:futsal_sim:team-players-list", kwargs={"team_pk": self.team.id}),
+            reverse("api:futsal_sim:team-sheets-list", kwargs={"team_pk": self.team.id}),
+            reverse("api:futsal_sim:team-sheets-detail", kwargs={"team_pk": self.team.id, "pk": self.team_sheet.id}),
+        ]
+
+    def _etags(self) -> list[str]:
+        return [self.client.get(url)["ETag"] for url in self.urls]
+
+    def _assert_all_modified(self, etags: list[str]):
+        for url, etag in zip(self.urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(200, response.status_code, url)
+
+    def test_unchanged_resources_are_not_serialized_again(self):
+        for url, etag in zip(self.urls, self._etags()):
+            with self.assertNumQueries(self.NOT_MODIFIED_QUERIES):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(304, response.status_code, url)
+            self.assertEqual(etag, response["ETag"])
+            self.assertEqual(b"", response.content)
+
+    def test_if_modified_since_is_ignored(self):
+        response = self.client.get(self.urls[0])
+        self.assertNotIn("Last-Modified", response)
+
+        # Validating dates, a change within the same second would be answered with a stale 304
+        response = self.client.get(self.urls[0], HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+
+        self.assertEqual(200, response.status_code)
+
+    def test_filters_have_their_own_etags(self):
+        etag = self.client.get(self.urls[1])["ETag"]
+
+        response = self.client.get(self.urls[1], {"name": self.players[0].name}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response["ETag"])
+
+    def test_match_changes_etags(self):
+        etags = self._etags()
+        play_match_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5)
+        self._assert_all_modified(etags)
+
+    def test_pack_purchase_changes_etags(self):
+        Team.objects.filter(id=self.team.id).update(coins=1000)
+        etags = self._etags()
+        response = self.client.post(
+            reverse("api:futsal_sim:team-buy-pack", kwargs={"team_id": self.team.id}), {"pack_type": "bronze"}
+        )
+        self.assertEqual(200, response.status_code)
+        self._assert_all_modified(etags)
+
+    def test_sell_changes_etags(self):
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(1)
+        etags = self._etags()
+        response = self.client.post(
+            reverse("api:futsal_sim:team-sell-players", kwargs={"team_id": self.team.id}),
+            {"players": [self.players[-1].id]},
+            format="json",
+        )
+        self.assertEqual(200, response.status_code)
+        self._assert_all_modified(etags)
+
+    def test_sheet_edit_changes_etags(self):
+        etags = self._etags()
+        TeamSheetCRUDService(team=self.team).teamsheet_update(
+            teamsheet_id=self.team_sheet.id,
+            name="Renamed",
+            right_attacker=self.players[4].id,
+            left_attacker=self.players[1].id,
+            right_defender=self.players[2].id,
+            left_defender=self.players[3].id,
+            goalkeeper=self.players[0].id,
+        )
+        self._assert_all_modified(etags)
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Cache FC")
+        self.players = list(self.team.players.order_by("id"))
+        self.client.force_login(self.user)
+
+        self.players_url = reverse("api:futsal_sim:team-players-list", kwargs={"team_pk": self.team.id})
+        cache.clear()
+
+    def test_repeated_reads_are_served_from_cache(self):
+        first = self.client.get(self.players_url)
+        # Savepoints of the atomic request and the team, no players
+        with self.assertNumQueries(3):
+            second = self.client.get(self.players_url)
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual({"hits": 1, "misses": 1}, response_cache_stats())
+
+    def test_counting_hits_costs_one_cache_call(self):
+        self.client.get(self.players_url)
+        self.client.get(self.players_url)
+
+        with patch.object(cache, "add", wraps=cache.add) as add, patch.object(cache, "incr", wraps=cache.incr) as incr:
+            self.client.get(self.players_url)
+
+        add.assert_not_called()
+        incr.assert_called_once()
+        self.assertEqual({"hits": 2, "misses": 1}, response_cache_stats())
+
+    def test_filters_are_cached_separately(self):
+        self.client.get(self.players_url)
+        response = self.client.get(self.players_url, {"name": self.players[0].name})
+
+        self.assertEqual([self.players[0].id], [player["id"] for player in response.data["players"]])
+        self.assertEqual({"hits": 0, "misses": 2}, response_cache_stats())
+
+    def test_changes_are_never_served_stale(self):
+        self.client.get(self.players_url)
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(1)
+        response = self.client.post(
+            reverse("api:futsal_sim:team-sell-players", kwargs={"team_id": self.team.id}),
+            {"players": [self.players[0].id]},
+            format="json",
+        )
+        self.assertEqual(200, response.status_code)
+
+        response = self.client.get(self.players_url)
+
+        self.assertNotIn(self.players[0].id, [player["id"] for player in response.data["players"]])
+        self.assertEqual({"hits": 0, "misses": 2}, response_cache_stats())
@@ -0,0 +1,55 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.models import RankingMetric, Team
+from src.futsal_sim.services.ranking_service import rebuild_rankings
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.users.selectors import user_get_cached
+from src.users.services import user_create
+
+
+class LeaderboardApiTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        service = TeamCRUDService(user=self.user)
+        self.teams = [service.team_create(name=f"Rank FC {i}") for i in range(5)]
+        for wins, team in enumerate(self.teams):
+            Team.objects.filter(id=team.id).update(wins=wins)
+        rebuild_rankings()
+        self.client.force_login(self.user)
+        # Cached by the first request of a session, like the session itself
+        user_get_cached(user_id=self.user.id)
+
+    def test_pages_follow_rank(self):
+        listed_team_ids = []
+        url = f"{reverse('api:futsal_sim:leaderboard')}?metric=wins&limit=2"
+        while url:
+            # Savepoints of the atomic request and the page of rankings with their teams
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            listed_team_ids += [ranking["team"]["id"] for ranking in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual([team.id for team in reversed(self.teams)], listed_team_ids)
+
+    def test_team_rank(self):
+        url = reverse("api:futsal_sim:team-rank", kwargs={"team_id": self.teams[1].id})
+
+        # Savepoints of the atomic request, team and its rankings
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"rank": 4, "value": 1.0}, response.data[RankingMetric.WINS])
+        self.assertEqual(set(RankingMetric.values), set(response.data))
+
+    def test_team_created_after_rebuild_is_not_ranked(self):
+        team = TeamCRUDService(user=self.user).team_create(name="New FC")
+
+        response = self.client.get(reverse("api:futsal_sim:team-rank", kwargs={"team_id": team.id}))
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(all(ranking is None for ranking in response.data.values()))
@@ -0,0 +1,212 @@
+from math import ceil
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.constants import MAX_BATCH_MATCH_AMOUNT, MAX_GOAL_AMOUNT
+from src.futsal_sim.models import MatchGoal, MatchResult, Player
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class MatchApiTests(APITestCase):
+    # Auth, input validation, lineup creation, opponent lookup, the bulk writes of the outcome,
+    # the team and player stats and the response
+    MAX_CREATE_QUERIES = 26
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Query FC")
+        players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        self.client.force_login(self.user)
+
+        self.match_results_url = reverse("api:futsal_sim:match-results-list", kwargs={"team_pk": self.team.id})
+        self.data = {"team_sheet": self.team_sheet.id, "difficulty_rating": 5}
+
+        # First match generates the CPU opponent, which isn't part of what's measured here
+        self.client.post(self.match_results_url, self.data)
+
+    def _count_create_queries(self, *, goal_amount: int) -> int:
+        with patch("src.futsal_sim.services.match_engine.generate_goal_amount", return_value=goal_amount):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(self.match_results_url, self.data)
+
+        self.assertEqual(201, response.status_code)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_depend_on_goal_amount(self):
+        queries_with_one_goal = self._count_create_queries(goal_amount=1)
+        queries_with_max_goals = self._count_create_queries(goal_amount=MAX_GOAL_AMOUNT)
+
+        self.assertEqual(queries_with_one_goal, queries_with_max_goals)
+        self.assertLessEqual(queries_with_max_goals, self.MAX_CREATE_QUERIES)
+        last_match = MatchResult.objects.filter(player_team=self.team).latest("id")
+        self.assertEqual(MAX_GOAL_AMOUNT, MatchGoal.objects.filter(match=last_match).count())
+
+    def test_query_count_does_not_depend_on_squad_size(self):
+        queries_small_squad = self._count_create_queries(goal_amount=MAX_GOAL_AMOUNT)
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(20)
+        # Team skill might have changed, so the opponent for the new skill is generated first
+        self.client.post(self.match_results_url, self.data)
+        queries_big_squad = self._count_create_queries(goal_amount=MAX_GOAL_AMOUNT)
+
+        self.assertEqual(queries_small_squad, queries_big_squad)
+
+    def test_retrieve_query_count_does_not_depend_on_goal_amount(self):
+        with patch("src.futsal_sim.services.match_engine.generate_goal_amount", return_value=MAX_GOAL_AMOUNT):
+            match_id = self.client.post(self.match_results_url, self.data).data["id"]
+        url = reverse("api:futsal_sim:match-results-detail", kwargs={"team_pk": self.team.id, "pk": match_id})
+
+        # Savepoints of the atomic request, team, the match with its graph and its goal moments
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(MAX_GOAL_AMOUNT, len(response.data["goal_moments"]))
+        self.assertTrue(all(player["sell_price"] for player in response.data["cpu_lineup"].values()))
+
+    def test_match_updates_players_of_player_team_only(self):
+        lineup_player = self.team_sheet.right_attacker
+        lineup_player.refresh_from_db()
+        cpu_counters = {
+            player["id"]: (player["goals_scored"], player["assists_made"])
+            for player in Player.objects.filter(team__cputeam__isnull=False).values(
+                "id", "goals_scored", "assists_made"
+            )
+        }
+
+        with patch("src.futsal_sim.services.match_engine.generate_goal_amount", return_value=MAX_GOAL_AMOUNT):
+            response = self.client.post(self.match_results_url, self.data)
+
+        updated_at_before = lineup_player.updated_at
+        lineup_player.refresh_from_db()
+        self.assertGreater(lineup_player.updated_at, updated_at_before)
+        # Pooled cpu players are shared by every user, their counters are deliberately left as generated
+        for player in response.data["cpu_lineup"].values():
+            self.assertEqual(cpu_counters[player["id"]], (player["goals_scored"], player["assists_made"]))
+
+    def test_retrieve_looks_up_the_match_without_union(self):
+        url = self._retrieve_url()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(200, self.client.get(url).status_code)
+
+        self.assertFalse(any("UNION" in query["sql"] for query in ctx.captured_queries))
+        other_user = user_create(email="other@futsal.io", password="123456", is_admin=False)
+        other_team = TeamCRUDService(user=other_user).team_create(name="Other FC")
+        self.client.force_login(other_user)
+        other_url = reverse(
+            "api:futsal_sim:match-results-detail", kwargs={"team_pk": other_team.id, "pk": resolve(url).kwargs["pk"]}
+        )
+        self.assertEqual(404, self.client.get(other_url).status_code)
+
+    def _retrieve_url(self) -> str:
+        with patch("src.futsal_sim.services.match_engine.generate_goal_amount", return_value=MAX_GOAL_AMOUNT):
+            match_id = self.client.post(self.match_results_url, self.data).data["id"]
+        return reverse("api:futsal_sim:match-results-detail", kwargs={"team_pk": self.team.id, "pk": match_id})
+
+    def test_retrieve_serializes_each_player_once(self):
+        response = self.client.get(self._retrieve_url())
+
+        lineup_players = {player["id"]: player for player in response.data["player_lineup"].values()}
+        for goal in response.data["goal_moments"]:
+            if goal["goal_scorer"]["id"] in lineup_players:
+                self.assertIs(lineup_players[goal["goal_scorer"]["id"]], goal["goal_scorer"])
+        self.assertIs(response.data["player_team"], response.data["player_lineup"]["goalkeeper"]["team"])
+
+    def test_normalized_retrieve_lists_entities_once(self):
+        url = self._retrieve_url()
+        nested = self.client.get(url)
+        with self.assertNumQueries(5):
+            normalized = self.client.get(url, {"normalized": True})
+
+        self.assertEqual(200, normalized.status_code)
+        self.assertEqual(
+            {self.team.id, nested.data["cpu_team"]["id"]}, {team["id"] for team in normalized.data["teams"]}
+        )
+        player_ids = [player["id"] for player in normalized.data["players"]]
+        self.assertEqual(len(player_ids), len(set(player_ids)))
+        self.assertEqual(
+            nested.data["player_lineup"]["goalkeeper"]["id"], normalized.data["player_lineup"]["goalkeeper"]
+        )
+        for goal in normalized.data["goal_moments"]:
+            self.assertIn(goal["goal_scorer"], player_ids)
+        self.assertLess(len(normalized.content), len(nested.content))
+
+    def test_list_is_paginated_newest_first(self):
+        for _ in range(4):
+            self.client.post(self.match_results_url, self.data)
+        expected_ids = list(
+            MatchResult.objects.filter(player_team=self.team).order_by("-date", "-id").values_list("id", flat=True)
+        )
+
+        listed_ids = []
+        url = f"{self.match_results_url}?limit=2"
+        while url:
+            # Savepoints of the atomic request, team and a page of matches with both teams from either side
+            with self.assertNumQueries(5):
+                response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            listed_ids += [match["id"] for match in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(expected_ids, listed_ids)
+
+    def _play_batch(self, match_amount: int) -> tuple[dict, int]:
+        url = reverse("api:futsal_sim:match-results-batch", kwargs={"team_pk": self.team.id})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {**self.data, "match_amount": match_amount})
+
+        self.assertEqual(201, response.status_code)
+        return response.data, len(ctx.captured_queries)
+
+    def test_batch_query_count_is_bounded(self):
+        _, queries_for_max = self._play_batch(MAX_BATCH_MATCH_AMOUNT)
+
+        # Every table is written once, apart from goal inserts split by backends limiting the parameters of a query
+        max_goals = MAX_BATCH_MATCH_AMOUNT * MAX_GOAL_AMOUNT
+        goal_fields = [field for field in MatchGoal._meta.fields if not field.primary_key]
+        goal_inserts = ceil(max_goals / connection.ops.bulk_batch_size(goal_fields, [None] * max_goals))
+        self.assertLessEqual(queries_for_max, self.MAX_CREATE_QUERIES + goal_inserts - 1)
+
+    def test_batch_summary_matches_stored_results(self):
+        self.team.refresh_from_db()
+        coins_before, wins_before = self.team.coins, self.team.wins
+        lineup_player = self.team_sheet.right_attacker
+        lineup_player.refresh_from_db()
+
+        summary, _ = self._play_batch(5)
+
+        matches = MatchResult.objects.filter(id__in=summary["match_ids"])
+        self.assertEqual(5, matches.count())
+        self.assertEqual(1, len({match.player_lineup_id for match in matches}))
+        self.assertEqual(sum(match.player_goals for match in matches), summary["goals_for"])
+        self.assertEqual(5, summary["wins"] + summary["draws"] + summary["loses"])
+        self.team.refresh_from_db()
+        self.assertEqual(coins_before + summary["coins_earned"], self.team.coins)
+        self.assertEqual(wins_before + summary["wins"], self.team.wins)
+        matches_played_before = lineup_player.matches_played
+        lineup_player.refresh_from_db()
+        self.assertEqual(matches_played_before + 5, lineup_player.matches_played)
+
+    def test_batch_match_amount_is_bounded(self):
+        url = reverse("api:futsal_sim:match-results-batch", kwargs={"team_pk": self.team.id})
+        response = self.client.post(url, {**self.data, "match_amount": MAX_BATCH_MATCH_AMOUNT + 1})
+
+        self.assertEqual(400, response.status_code)
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.constants import MATCH_JOB_RUNNING_TIMEOUT
+from src.futsal_sim.models import MatchJob, MatchJobStatus, MatchResult
+from src.futsal_sim.services.match_job_service import (
+    MATCH_JOB_ERROR,
+    MATCH_JOB_TIMEOUT_ERROR,
+    match_job_fail_stale,
+    match_job_run,
+)
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class MatchJobApiTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Async FC")
+        players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        self.client.force_login(self.user)
+
+        self.match_results_url = reverse("api:futsal_sim:match-results-list", kwargs={"team_pk": self.team.id})
+        self.data = {"team_sheet": self.team_sheet.id, "difficulty_rating": 5, "run_async": True}
+
+    def _job_url(self, job_id: int) -> str:
+        return reverse("api:futsal_sim:team-match-jobs-detail", kwargs={"team_id": self.team.id, "job_id": job_id})
+
+    def test_async_match_is_played_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.match_results_url, self.data)
+
+        self.assertEqual(202, response.status_code)
+        self.assertEqual(MatchJobStatus.PENDING, response.data["status"])
+        self.assertFalse(MatchResult.objects.filter(player_team=self.team).exists())
+
+        # Celery runs eagerly in tests, the task runs when the callback enqueues it
+        for callback in callbacks:
+            callback()
+
+        job_response = self.client.get(self._job_url(response.data["id"]))
+        self.assertEqual(200, job_response.status_code)
+        self.assertEqual(MatchJobStatus.DONE, job_response.data["status"])
+        match_result = MatchResult.objects.get(id=job_response.data["match_result"])
+        self.assertEqual(self.team.id, match_result.player_team_id)
+
+    def test_job_is_played_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job_id = self.client.post(self.match_results_url, self.data).data["id"]
+
+        match_job_run(job_id=job_id)
+
+        self.assertEqual(1, MatchResult.objects.filter(player_team=self.team).count())
+
+    def test_job_fails_when_sheet_was_deleted(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job_id = self.client.post(self.match_results_url, self.data).data["id"]
+        self.team_sheet.delete()
+        for callback in callbacks:
+            callback()
+
+        job = MatchJob.objects.get(id=job_id)
+        self.assertEqual(MatchJobStatus.FAILED, job.status)
+        self.assertTrue(job.error)
+
+    def test_job_fails_on_unexpected_errors(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job_id = self.client.post(self.match_results_url, self.data).data["id"]
+        with patch(
+            "src.futsal_sim.services.match_job_service.play_match_against_cpu", side_effect=RuntimeError("boom")
+        ), self.assertLogs("src.futsal_sim.services.match_job_service", level="ERROR"):
+            for callback in callbacks:
+                callback()
+
+        job = MatchJob.objects.get(id=job_id)
+        self.assertEqual(MatchJobStatus.FAILED, job.status)
+        self.assertEqual(MATCH_JOB_ERROR, job.error)
+        self.assertNotIn("boom", self.client.get(self._job_url(job_id)).data["error"])
+
+    def test_stale_running_jobs_are_failed(self):
+        stale_job = MatchJob.objects.create(team=self.team, difficulty_rating=5, status=MatchJobStatus.RUNNING)
+        running_job = MatchJob.objects.create(team=self.team, difficulty_rating=5, status=MatchJobStatus.RUNNING)
+        MatchJob.objects.filter(id=stale_job.id).update(
+            updated_at=timezone.now() - timedelta(seconds=MATCH_JOB_RUNNING_TIMEOUT + 1)
+        )
+
+        self.assertEqual(1, match_job_fail_stale())
+
+        stale_job.refresh_from_db()
+        running_job.refresh_from_db()
+        self.assertEqual((MatchJobStatus.FAILED, MATCH_JOB_TIMEOUT_ERROR), (stale_job.status, stale_job.error))
+        self.assertEqual(MatchJobStatus.RUNNING, running_job.status)
+
+    def test_jobs_of_other_teams_are_not_found(self):
+        other_user = user_create(email="other@futsal.io", password="123456", is_admin=False)
+        other_team = TeamCRUDService(user=other_user).team_create(name="Other FC")
+        job = MatchJob.objects.create(team=other_team, difficulty_rating=5)
+
+        response = self.client.get(self._job_url(job.id))
+
+        self.assertEqual(404, response.status_code)
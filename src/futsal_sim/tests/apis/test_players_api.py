@@ -0,0 +1,31 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.users.selectors import user_get_cached
+from src.users.services import user_create
+
+
+class PlayerListApiQueryCountTests(APITestCase):
+    # Savepoints of the atomic request, team and the players with their team
+    LIST_QUERIES = 4
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Query FC")
+        PlayerFactory(team=self.team, lower_b=10, upper_b=30).create_players(43)
+        self.client.force_login(self.user)
+        # Cached by the first request of a session, like the session itself
+        user_get_cached(user_id=self.user.id)
+
+        self.players_url = reverse("api:futsal_sim:team-players-list", kwargs={"team_pk": self.team.id})
+
+    def test_list_query_count_is_independent_of_squad_size(self):
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.players_url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(50, len(response.data["players"]))
@@ -0,0 +1,50 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.constants import TOP_SCORERS_AMOUNT
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class TeamStatsApiTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Stats FC")
+        players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        self.client.force_login(self.user)
+
+        self.stats_url = reverse("api:futsal_sim:team-stats", kwargs={"team_id": self.team.id})
+
+    def test_team_without_matches_has_empty_stats(self):
+        response = self.client.get(self.stats_url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(0, response.data["matches_played"])
+        self.assertEqual("", response.data["form"])
+        self.assertEqual([], response.data["top_scorers"])
+
+    def test_query_count_does_not_depend_on_match_amount(self):
+        match_results_url = reverse("api:futsal_sim:match-results-list", kwargs={"team_pk": self.team.id})
+        for _ in range(5):
+            self.client.post(match_results_url, {"team_sheet": self.team_sheet.id, "difficulty_rating": 1})
+
+        # Savepoints of the atomic request, team, its stats and the top scorers with their players
+        with self.assertNumQueries(5):
+            response = self.client.get(self.stats_url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, response.data["matches_played"])
+        self.assertLessEqual(len(response.data["top_scorers"]), TOP_SCORERS_AMOUNT)
+        goals = [scorer["goals"] for scorer in response.data["top_scorers"]]
+        self.assertEqual(sorted(goals, reverse=True), goals)
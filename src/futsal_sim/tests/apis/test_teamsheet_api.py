@@ -0,0 +1,50 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.selectors import user_get_cached
+from src.users.services import user_create
+
+
+class TeamSheetApiQueryCountTests(APITestCase):
+    # Savepoints of the atomic request, team and the sheets with their players and teams
+    QUERIES = 4
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Query FC")
+        players = list(self.team.players.order_by("id"))
+        for i in range(10):
+            TeamSheetCRUDService(team=self.team).teamsheet_create(
+                name=f"Sheet {i}",
+                right_attacker=players[0].id,
+                left_attacker=players[1].id,
+                right_defender=players[2].id,
+                left_defender=players[3].id,
+                goalkeeper=players[4].id,
+            )
+        self.client.force_login(self.user)
+        # Cached by the first request of a session, like the session itself
+        user_get_cached(user_id=self.user.id)
+
+        self.team_sheets_url = reverse("api:futsal_sim:team-sheets-list", kwargs={"team_pk": self.team.id})
+
+    def test_list_query_count_is_independent_of_sheet_amount(self):
+        with self.assertNumQueries(self.QUERIES):
+            response = self.client.get(self.team_sheets_url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(10, len(response.data))
+        self.assertTrue(all(sheet["goalkeeper"]["sell_price"] for sheet in response.data))
+
+    def test_retrieve_query_count(self):
+        team_sheet = self.team.teamsheet_set.first()
+        url = reverse("api:futsal_sim:team-sheets-detail", kwargs={"team_pk": self.team.id, "pk": team_sheet.id})
+
+        with self.assertNumQueries(self.QUERIES):
+            response = self.client.get(url)
+
+        self.assertEqual(200, response.status_code)
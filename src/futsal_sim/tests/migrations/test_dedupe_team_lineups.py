@@ -0,0 +1,107 @@
+from importlib import import_module
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+dedupe_migration = import_module("src.futsal_sim.migrations.0014_dedupe_team_lineups")
+
+
+class DedupeTeamLineupsMigrationTests(TransactionTestCase):
+    migrate_from = [("futsal_sim", "0013_match_job")]
+    migrate_to = [("futsal_sim", "0014_dedupe_team_lineups")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.latest = executor.loader.graph.leaf_nodes()
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+
+        Team = apps.get_model("futsal_sim", "Team")
+        Player = apps.get_model("futsal_sim", "Player")
+        TeamLineup = apps.get_model("futsal_sim", "TeamLineup")
+        MatchResult = apps.get_model("futsal_sim", "MatchResult")
+
+        self.team = Team.objects.create(name="Player FC")
+        self.cpu_team = Team.objects.create(name="CPU FC")
+        team_players = self._create_players(Player, self.team)
+        cpu_players = self._create_players(Player, self.cpu_team)
+
+        # Three lineups with the same players and one with another goalkeeper, for each team
+        self.player_lineups = [self._create_lineup(TeamLineup, self.team, team_players) for _ in range(3)]
+        self.other_player_lineup = self._create_lineup(TeamLineup, self.team, team_players[:4] + team_players[5:])
+        self.cpu_lineups = [self._create_lineup(TeamLineup, self.cpu_team, cpu_players) for _ in range(3)]
+        self.other_cpu_lineup = self._create_lineup(TeamLineup, self.cpu_team, cpu_players[:4] + cpu_players[5:])
+
+        self.match_ids = [
+            MatchResult.objects.create(
+                player_team=self.team,
+                cpu_team=self.cpu_team,
+                player_lineup=player_lineup,
+                cpu_lineup=cpu_lineup,
+                player_goals=1,
+                cpu_goals=0,
+                coins_reward=10,
+            ).id
+            for player_lineup, cpu_lineup in zip(
+                [*self.player_lineups, self.other_player_lineup], [*self.cpu_lineups, self.other_cpu_lineup]
+            )
+        ]
+
+    def tearDown(self):
+        MigrationExecutor(connection).migrate(self.latest)
+
+    @staticmethod
+    def _create_players(Player, team) -> list:
+        return [
+            Player.objects.create(team=team, name=f"Player {i}", preferred_position="attacker", skill=50)
+            for i in range(6)
+        ]
+
+    @staticmethod
+    def _create_lineup(TeamLineup, team, players):
+        return TeamLineup.objects.create(
+            team=team,
+            right_attacker=players[0],
+            left_attacker=players[1],
+            right_defender=players[2],
+            left_defender=players[3],
+            goalkeeper=players[4],
+        )
+
+    def _migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+        return executor.loader.project_state(self.migrate_to).apps
+
+    def _assert_merged(self, apps):
+        TeamLineup = apps.get_model("futsal_sim", "TeamLineup")
+        MatchResult = apps.get_model("futsal_sim", "MatchResult")
+
+        self.assertEqual(
+            {self.player_lineups[0].id, self.other_player_lineup.id, self.cpu_lineups[0].id, self.other_cpu_lineup.id},
+            set(TeamLineup.objects.values_list("id", flat=True)),
+        )
+        matches = MatchResult.objects.filter(id__in=self.match_ids).order_by("id")
+        self.assertEqual(
+            [self.player_lineups[0].id] * 3 + [self.other_player_lineup.id],
+            [match.player_lineup_id for match in matches],
+        )
+        self.assertEqual(
+            [self.cpu_lineups[0].id] * 3 + [self.other_cpu_lineup.id], [match.cpu_lineup_id for match in matches]
+        )
+
+    def test_duplicates_are_merged_into_the_oldest_lineup(self):
+        self._assert_merged(self._migrate())
+
+    def test_duplicates_of_a_team_are_merged_in_batches(self):
+        with patch.object(dedupe_migration, "BATCH_SIZE", 1), patch.object(
+            dedupe_migration, "_merge_duplicates", wraps=dedupe_migration._merge_duplicates
+        ) as merge_duplicates:
+            apps = self._migrate()
+
+        # Two duplicates of each team, each one flushed on its own
+        self.assertEqual(4, merge_duplicates.call_count)
+        self._assert_merged(apps)
@@ -0,0 +1,97 @@
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from src.futsal_sim.models import MatchResult, Player, TeamSheet
+from src.futsal_sim.row_serializers import (
+    match_result_short_representation,
+    match_result_short_values,
+    player_list_rows,
+    teamsheet_list_rows,
+)
+from src.futsal_sim.serializers import (
+    MatchResultShortOutputSerializer,
+    PlayerOutputSerializer,
+    TeamSheetOutputSerializer,
+    team_skills_context,
+)
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.match_service import play_match_against_cpu
+from src.futsal_sim.services.team_service import TeamCRUDService, team_sell_players
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class RowSerializersContractTests(TestCase):
+    """
+    The row serializers replace the serializers drf-spectacular documents,
+    so their output has to be the same, byte by byte.
+    """
+
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Rows FC")
+        PlayerFactory(team=self.team, lower_b=10, upper_b=30).create_players(3)
+        players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Full",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Half empty",
+            right_attacker=players[5].id,
+            left_attacker=None,
+            right_defender=players[6].id,
+            left_defender=None,
+            goalkeeper=players[7].id,
+        )
+        play_match_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5)
+        play_match_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5)
+        team_sell_players(team=self.team, player_ids=[players[6].id], user=self.user)
+        self.team.refresh_from_db()
+
+    def assertSameJson(self, expected, actual):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(expected), renderer.render(actual))
+
+    def test_player_list_rows(self):
+        queryset = Player.objects.filter(team=self.team).select_related("team").order_by("id")
+
+        expected = PlayerOutputSerializer(queryset, many=True, context=team_skills_context(self.team)).data
+        self.assertSameJson(expected, player_list_rows(queryset))
+
+    def test_teamsheet_list_rows(self):
+        queryset = TeamSheetCRUDService(team=self.team).teamsheet_list().order_by("id")
+
+        expected = TeamSheetOutputSerializer(queryset, many=True, context=team_skills_context(self.team)).data
+        rows = teamsheet_list_rows(queryset)
+        self.assertSameJson(expected, rows)
+        self.assertEqual(
+            [None, None, None], [rows[1][slot] for slot in ("left_attacker", "right_defender", "left_defender")]
+        )
+
+    def test_match_result_short_rows(self):
+        queryset = MatchResult.objects.filter(player_team=self.team).select_related("player_team", "cpu_team")
+
+        expected = MatchResultShortOutputSerializer(queryset.order_by("id"), many=True).data
+        rows = [match_result_short_representation(row) for row in match_result_short_values(queryset.order_by("id"))]
+        self.assertSameJson(expected, rows)
+        self.assertIsNone(rows[0]["cpu_team"]["owner"])
+
+    def test_row_fields_follow_serializer_fields(self):
+        # A field added to a serializer has to be added to its row serializer as well
+        player = Player.objects.filter(team=self.team).first()
+        self.assertEqual(
+            list(PlayerOutputSerializer().fields), list(player_list_rows(Player.objects.filter(id=player.id))[0])
+        )
+        self.assertEqual(
+            list(TeamSheetOutputSerializer().fields),
+            list(teamsheet_list_rows(TeamSheet.objects.filter(id=self.team_sheet.id))[0]),
+        )
+        self.assertEqual(
+            list(MatchResultShortOutputSerializer().fields),
+            list(match_result_short_representation(match_result_short_values(MatchResult.objects.all())[0])),
+        )
@@ -0,0 +1,54 @@
+import itertools
+import random
+from io import StringIO
+
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from src.futsal_sim.constants import (
+    ATTACKER_GOAL_PERC,
+    DEFENDER_GOAL_PERC,
+    GK_GOAL_PERC,
+)
+from src.futsal_sim.services.balance_simulation import calc_coins_reward_vectorized
+from src.futsal_sim.services.factories import PositionFactory
+from src.futsal_sim.services.match_engine import calc_coins_reward
+
+
+class BalanceSimulationParityTests(SimpleTestCase):
+    def test_vectorized_coins_reward_matches_match_engine(self):
+        grid = np.array(list(itertools.product(range(10, 40, 3), range(10, 40, 3), range(0, 8), range(0, 8))))
+        player_skill, cpu_skill, player_goals, cpu_goals = grid.T
+
+        vectorized = calc_coins_reward_vectorized(
+            player_skill=player_skill, cpu_skill=cpu_skill, player_goals=player_goals, cpu_goals=cpu_goals
+        )
+        expected = [
+            calc_coins_reward(player_skill=int(p), cpu_skill=int(c), player_goals=int(pg), cpu_goals=int(cg))
+            for p, c, pg, cg in grid
+        ]
+
+        self.assertEqual(expected, vectorized.tolist())
+
+    def test_position_probabilities_match_generated_positions(self):
+        rng = random.Random(0)
+        draws = 200_000
+        counts = {position: 0 for position in PositionFactory.positions}
+        for _ in range(draws):
+            position = PositionFactory.generate_goal_scorer_position(rng=rng)
+            counts[position] += 1
+
+        probabilities = PositionFactory.position_probabilities(
+            attacker_perc=ATTACKER_GOAL_PERC, defender_perc=DEFENDER_GOAL_PERC, goalkeeper_perc=GK_GOAL_PERC
+        )
+        for position, probability in zip(PositionFactory.positions, probabilities):
+            self.assertAlmostEqual(probability, counts[position] / draws, delta=0.005)
+
+    def test_command_reports_every_difficulty(self):
+        out = StringIO()
+
+        call_command("simulate_match_balance", samples=10_000, seed=1, stdout=out)
+
+        # Header, ten difficulty ratings, empty line and summary
+        self.assertEqual(13, len(out.getvalue().strip().splitlines()))
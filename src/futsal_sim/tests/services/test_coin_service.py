@@ -0,0 +1,111 @@
+import threading
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+
+from src.futsal_sim.constants import BRONZE_PRICE
+from src.futsal_sim.models import CoinTransaction, CoinTransactionReason, Team
+from src.futsal_sim.services.coin_service import spend_coins
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.match_service import play_matches_against_cpu
+from src.futsal_sim.services.pack_service import buy_pack
+from src.futsal_sim.services.team_service import TeamCRUDService, team_sell_players
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class CoinServiceTests(TestCase):
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Coin FC")
+        Team.objects.filter(id=self.team.id).update(coins=1000)
+        self.team.refresh_from_db()
+
+    def _ledger_total(self) -> int:
+        return CoinTransaction.objects.filter(team=self.team).aggregate(total=Sum("amount"))["total"] or 0
+
+    def test_spending_more_than_balance_changes_nothing(self):
+        with self.assertRaises(ValidationError):
+            spend_coins(team=self.team, amount=1001, reason=CoinTransactionReason.PACK_PURCHASE)
+
+        self.team.refresh_from_db()
+        self.assertEqual(1000, self.team.coins)
+        self.assertFalse(CoinTransaction.objects.filter(team=self.team).exists())
+
+    def test_stale_instance_does_not_overwrite_coins(self):
+        stale_team = Team.objects.get(id=self.team.id)
+        spend_coins(team=self.team, amount=300, reason=CoinTransactionReason.PACK_PURCHASE)
+
+        buy_pack(team=stale_team, pack_type="bronze")
+
+        self.team.refresh_from_db()
+        self.assertEqual(1000 - 300 - BRONZE_PRICE, self.team.coins)
+
+    def test_ledger_follows_coin_changes(self):
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(3)
+        buy_pack(team=self.team, pack_type="gold")
+        team_sell_players(team=self.team, player_ids=[self.team.players.first().id], user=self.user)
+        players = list(self.team.players.order_by("id"))
+        team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        play_matches_against_cpu(player_team_sheet=team_sheet, difficulty_rating=5, match_amount=3)
+
+        self.team.refresh_from_db()
+        self.assertEqual(1000 + self._ledger_total(), self.team.coins)
+        reasons = set(CoinTransaction.objects.filter(team=self.team).values_list("reason", flat=True))
+        self.assertEqual(set(CoinTransactionReason.values), reasons)
+
+    def test_player_can_not_be_sold_twice(self):
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(3)
+        player_id = self.team.players.first().id
+        team_sell_players(team=self.team, player_ids=[player_id], user=self.user)
+
+        with self.assertRaises(ValidationError):
+            team_sell_players(team=self.team, player_ids=[player_id], user=self.user)
+
+        self.assertEqual(1, CoinTransaction.objects.filter(reason=CoinTransactionReason.PLAYER_SALE).count())
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentSpendingTests(TransactionTestCase):
+    """
+    Needs a database with row level locking, SQLite fails concurrent writers instead of making them wait.
+    """
+
+    THREAD_AMOUNT = 10
+
+    def test_concurrent_purchases_never_overspend(self):
+        user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        team = TeamCRUDService(user=user).team_create(name="Coin FC")
+        Team.objects.filter(id=team.id).update(coins=500)
+
+        barrier = threading.Barrier(self.THREAD_AMOUNT)
+        failures = []
+
+        def purchase():
+            try:
+                barrier.wait()
+                spend_coins(team=Team.objects.get(id=team.id), amount=100, reason=CoinTransactionReason.PACK_PURCHASE)
+            except ValidationError:
+                failures.append(1)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=purchase) for _ in range(self.THREAD_AMOUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        team.refresh_from_db()
+        self.assertEqual(0, team.coins)
+        self.assertEqual(self.THREAD_AMOUNT - 5, len(failures))
+        self.assertEqual(5, CoinTransaction.objects.filter(team=team).count())
@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from src.futsal_sim.models import CPUTeam, TeamLineup
+from src.futsal_sim.services.cpu_pool_service import (
+    cpu_pool_index,
+    get_cpu_opponent,
+    refill_cpu_pool,
+)
+from src.futsal_sim.services.factories import TeamOpponentFactory
+
+
+class CPUPoolServiceTests(TestCase):
+    def setUp(self):
+        cpu_pool_index.invalidate()
+
+    def test_refill_fills_skills_below_threshold(self):
+        stats = refill_cpu_pool(skills=range(20, 23), teams_per_skill=2, refill_threshold=1)
+
+        self.assertEqual(6, stats.total_teams)
+        self.assertEqual(3, stats.skills_covered)
+        self.assertEqual([], stats.skills_below_threshold)
+        self.assertEqual(6, TeamLineup.objects.filter(team__cputeam__skill__in=[20, 21, 22]).count())
+
+        refill_cpu_pool(skills=range(20, 23), teams_per_skill=2, refill_threshold=1)
+        self.assertEqual(6, CPUTeam.objects.count())
+
+    def test_pooled_opponent_is_not_generated(self):
+        cpu_skill = TeamOpponentFactory.calc_cpu_skill(player_skill=20, difficulty_rating=5)
+        refill_cpu_pool(skills=range(cpu_skill, cpu_skill + 1), teams_per_skill=2, refill_threshold=1)
+        cpu_pool_index.lineup_ids(cpu_skill)
+
+        # Picked lineup with its team and players
+        with self.assertNumQueries(1):
+            team, lineup = get_cpu_opponent(player_skill=20, difficulty_rating=5)
+            self.assertEqual(5, len(lineup.players))
+
+        self.assertEqual(cpu_skill, team.cputeam.skill)
+        self.assertEqual(2, CPUTeam.objects.count())
+
+    def test_empty_pool_generates_opponent(self):
+        team, lineup = get_cpu_opponent(player_skill=20, difficulty_rating=5)
+
+        self.assertEqual(team, lineup.team)
+        self.assertEqual([lineup.id], cpu_pool_index.lineup_ids(team.skill))
+
+        hits = cpu_pool_index.hits
+        self.assertEqual(
+            (team.id, lineup.id), tuple(obj.id for obj in get_cpu_opponent(player_skill=20, difficulty_rating=5))
+        )
+        self.assertEqual(hits + 1, cpu_pool_index.hits)
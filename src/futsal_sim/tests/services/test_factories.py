@@ -0,0 +1,62 @@
+import random
+from collections import Counter
+
+from django.test import SimpleTestCase
+
+from src.futsal_sim.constants import (
+    ASSIST_PERC,
+    ATTACKER_ASSIST_PERC,
+    DEFENDER_ASSIST_PERC,
+    GK_ASSIST_PERC,
+)
+from src.futsal_sim.services.factories import PositionFactory, TeamOpponentFactory
+
+
+class GenerateAssistMakerPositionTests(SimpleTestCase):
+    def test_assister_distribution_matches_rerolling_until_not_scorer(self):
+        samples = 100_000
+        assist_probs = PositionFactory.position_probabilities(
+            attacker_perc=ATTACKER_ASSIST_PERC, defender_perc=DEFENDER_ASSIST_PERC, goalkeeper_perc=GK_ASSIST_PERC
+        )
+        rng = random.Random(0)
+        for scorer_index, scorer_pos in enumerate(PositionFactory.positions):
+            counts = Counter(
+                PositionFactory.generate_assist_maker_position(scorer_pos, rng=rng) for _ in range(samples)
+            )
+
+            self.assertEqual(0, counts[scorer_pos])
+            self.assertAlmostEqual(1 - ASSIST_PERC / 100, counts[None] / samples, delta=0.01)
+            not_scorer_prob = 1 - assist_probs[scorer_index]
+            for pos, prob in zip(PositionFactory.positions, assist_probs):
+                if pos != scorer_pos:
+                    expected = ASSIST_PERC / 100 * prob / not_scorer_prob
+                    self.assertAlmostEqual(expected, counts[pos] / samples, delta=0.01)
+
+
+class PositionTablesTests(SimpleTestCase):
+    def test_batch_generation_returns_position_for_each_scorer(self):
+        rng = random.Random(0)
+        scorer_positions = PositionFactory.generate_goal_scorer_positions(40, rng=rng)
+        assister_positions = PositionFactory.generate_assist_maker_positions(scorer_positions, rng=rng)
+
+        self.assertEqual(40, len(scorer_positions))
+        self.assertEqual(40, len(assister_positions))
+        self.assertTrue(all(scorer != assister for scorer, assister in zip(scorer_positions, assister_positions)))
+
+    def test_percentages_must_add_up_to_100(self):
+        with self.assertRaises(ValueError):
+            PositionFactory.position_probabilities(attacker_perc=50, defender_perc=30, goalkeeper_perc=10)
+
+
+class TeamOpponentFactoryTests(SimpleTestCase):
+    def test_cpu_team_skill_follows_player_skill_by_default(self):
+        factory = TeamOpponentFactory(player_skill=40, difficulty_rating=5)
+
+        self.assertEqual(
+            TeamOpponentFactory.calc_cpu_skill(player_skill=40, difficulty_rating=5), factory.cpu_team_skill
+        )
+
+    def test_for_cpu_skill(self):
+        factory = TeamOpponentFactory.for_cpu_skill(cpu_team_skill=40, difficulty_rating=5)
+
+        self.assertEqual(40, factory.cpu_team_skill)
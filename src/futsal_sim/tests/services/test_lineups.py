@@ -0,0 +1,53 @@
+from django.test import TestCase
+
+from src.futsal_sim.models import TeamLineup
+from src.futsal_sim.services.match_service import play_match_against_cpu
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import (
+    TeamSheetCRUDService,
+    create_lineup_from_sheet,
+)
+from src.users.services import user_create
+
+
+class CreateLineupFromSheetTests(TestCase):
+    def setUp(self):
+        user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=user).team_create(name="Lineup FC")
+        self.players = list(self.team.players.order_by("id"))
+        self.sheet_service = TeamSheetCRUDService(team=self.team)
+        self.team_sheet = self.sheet_service.teamsheet_create(
+            name="Sheet",
+            right_attacker=self.players[0].id,
+            left_attacker=self.players[1].id,
+            right_defender=self.players[2].id,
+            left_defender=self.players[3].id,
+            goalkeeper=self.players[4].id,
+        )
+
+    def test_matches_with_same_players_share_lineup(self):
+        matches = [play_match_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5) for _ in range(3)]
+
+        self.assertEqual(1, len({match.player_lineup_id for match in matches}))
+        self.assertEqual(1, TeamLineup.objects.filter(team=self.team).count())
+
+    def test_changed_sheet_gets_new_lineup(self):
+        first_lineup = create_lineup_from_sheet(self.team_sheet)
+        self.team_sheet.goalkeeper = self.players[5]
+        self.team_sheet.save()
+
+        second_lineup = create_lineup_from_sheet(self.team_sheet)
+
+        self.assertNotEqual(first_lineup.id, second_lineup.id)
+        self.assertEqual(self.players[5].id, second_lineup.goalkeeper_id)
+
+    def test_lineup_uses_sheet_players(self):
+        create_lineup_from_sheet(self.team_sheet)
+
+        # Only the lookup of the existing lineup
+        with self.assertNumQueries(1):
+            lineup = create_lineup_from_sheet(self.team_sheet)
+            players = lineup.players
+
+        self.assertEqual(self.team_sheet.players, players)
+        self.assertIs(self.team_sheet.goalkeeper, lineup.goalkeeper)
@@ -0,0 +1,46 @@
+import random
+
+from django.test import SimpleTestCase
+
+from src.futsal_sim.constants import MATCH_MAX_MINUTE, MAX_GOAL_AMOUNT
+from src.futsal_sim.services.match_engine import (
+    GOALKEEPER_SLOT,
+    calc_coins_reward,
+    simulate_match,
+)
+
+
+class SimulateMatchTests(SimpleTestCase):
+    def test_same_seed_reproduces_match(self):
+        first = simulate_match(player_skill=20, cpu_skill=18, bench_size=3, rng=random.Random(42))
+        second = simulate_match(player_skill=20, cpu_skill=18, bench_size=3, rng=random.Random(42))
+
+        self.assertEqual(first, second)
+
+    def test_simulated_match_is_consistent(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            match = simulate_match(player_skill=25, cpu_skill=22, bench_size=4, rng=rng)
+
+            self.assertLessEqual(match.player_goals + match.cpu_goals, MAX_GOAL_AMOUNT)
+            self.assertEqual(match.player_goals, sum(goal.by_player_team for goal in match.goals))
+            self.assertEqual(match.cpu_goals, sum(not goal.by_player_team for goal in match.goals))
+
+            minutes = [goal.minute for goal in match.goals]
+            self.assertEqual(len(minutes), len(set(minutes)))
+            self.assertTrue(all(1 <= minute <= MATCH_MAX_MINUTE for minute in minutes))
+            self.assertTrue(all(goal.scorer_slot != goal.assister_slot for goal in match.goals))
+
+            self.assertEqual(4, len(match.bench_stamina_regen))
+            self.assertEqual(5, len(match.lineup_stamina_drain))
+            self.assertLessEqual(match.lineup_stamina_drain[GOALKEEPER_SLOT], 10)
+
+
+class CalcCoinsRewardTests(SimpleTestCase):
+    def test_win_draw_and_loss_rewards(self):
+        self.assertEqual(210, calc_coins_reward(player_skill=20, cpu_skill=20, player_goals=3, cpu_goals=1))
+        self.assertEqual(120, calc_coins_reward(player_skill=20, cpu_skill=20, player_goals=2, cpu_goals=2))
+        self.assertEqual(60, calc_coins_reward(player_skill=20, cpu_skill=20, player_goals=1, cpu_goals=3))
+
+    def test_reward_is_never_negative(self):
+        self.assertEqual(0, calc_coins_reward(player_skill=80, cpu_skill=20, player_goals=0, cpu_goals=9))
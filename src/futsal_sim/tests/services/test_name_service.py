@@ -0,0 +1,38 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from src.futsal_sim.services.name_service import (
+    TEAM_NAME_ABBREVIATIONS,
+    _faker,
+    generate_player_names,
+    generate_team_names,
+)
+
+
+class NameServiceTests(SimpleTestCase):
+    def test_same_seed_reproduces_names(self):
+        self.assertEqual(
+            generate_player_names(20, rng=random.Random(1)), generate_player_names(20, rng=random.Random(1))
+        )
+        self.assertEqual(generate_team_names(5, rng=random.Random(1)), generate_team_names(5, rng=random.Random(1)))
+
+    def test_threads_have_their_own_faker(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_faker = executor.submit(_faker).result()
+
+        self.assertIs(_faker(), _faker())
+        self.assertIsNot(other_thread_faker, _faker())
+
+    def test_first_names_follow_corpus_frequency(self):
+        samples = 50_000
+        first_names = [name.split()[0] for name in generate_player_names(samples, rng=random.Random(0))]
+
+        # James has a frequency of 3.318 percent, out of the 90 percent which names samples from
+        self.assertAlmostEqual(3.318 / 90, first_names.count("James") / samples, delta=0.005)
+
+    def test_team_names_contain_abbreviation(self):
+        for team_name in generate_team_names(50, rng=random.Random(0)):
+            self.assertTrue(set(team_name.split()) & set(TEAM_NAME_ABBREVIATIONS))
+            self.assertLessEqual(len(team_name), 32)
@@ -0,0 +1,50 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from src.futsal_sim.constants import (
+    BASE_COIN_AMOUNT,
+    CREATE_TEAM_PLAYER_AMOUNT_ABOVE_MIN,
+    PLAYER_AMOUNT_IN_PACK,
+    PLAYER_AMOUNT_TEAM_SHEET,
+)
+from src.futsal_sim.models import Player
+from src.futsal_sim.services.factories import TeamOpponentFactory
+from src.futsal_sim.services.pack_service import buy_pack
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.users.services import user_create
+
+
+def _player_inserts(context: CaptureQueriesContext) -> int:
+    table = Player._meta.db_table
+    return sum(1 for query in context.captured_queries if query["sql"].startswith(f'INSERT INTO "{table}"'))
+
+
+class PlayerFactoryBatchInsertTests(TestCase):
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+
+    def test_team_create_inserts_players_once(self):
+        with CaptureQueriesContext(connection) as context:
+            team = TeamCRUDService(user=self.user).team_create(name="Batch FC")
+
+        self.assertEqual(1, _player_inserts(context))
+        self.assertEqual(PLAYER_AMOUNT_TEAM_SHEET + CREATE_TEAM_PLAYER_AMOUNT_ABOVE_MIN, team.players.count())
+
+    def test_buy_pack_inserts_players_once(self):
+        team = TeamCRUDService(user=self.user).team_create(name="Batch FC")
+        team.coins = BASE_COIN_AMOUNT
+
+        with CaptureQueriesContext(connection) as context:
+            players = buy_pack(team=team, pack_type="gold")
+
+        self.assertEqual(1, _player_inserts(context))
+        self.assertEqual(PLAYER_AMOUNT_IN_PACK, len(players))
+        self.assertTrue(all(player.id for player in players))
+
+    def test_cpu_team_generation_inserts_players_once(self):
+        with CaptureQueriesContext(connection) as context:
+            _, lineup = TeamOpponentFactory(player_skill=20, difficulty_rating=5).create_cpu_team()
+
+        self.assertEqual(1, _player_inserts(context))
+        self.assertEqual(PLAYER_AMOUNT_TEAM_SHEET, len([player for player in lineup.players if player.id]))
@@ -0,0 +1,41 @@
+from django.test import TestCase
+
+from src.futsal_sim.models import RankingMetric, Team, TeamRanking
+from src.futsal_sim.services.factories import TeamOpponentFactory
+from src.futsal_sim.services.ranking_service import rebuild_rankings
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.users.services import user_create
+
+
+class RebuildRankingsTests(TestCase):
+    def setUp(self):
+        user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        service = TeamCRUDService(user=user)
+        self.teams = [service.team_create(name=f"Rank FC {i}") for i in range(4)]
+        for team, (wins, draws, loses, coins) in zip(
+            self.teams, [(10, 0, 10, 50), (3, 0, 0, 400), (10, 5, 5, 50), (0, 0, 0, 0)]
+        ):
+            Team.objects.filter(id=team.id).update(wins=wins, draws=draws, loses=loses, coins=coins)
+        TeamOpponentFactory(player_skill=30, difficulty_rating=5).create_cpu_team()
+
+    def _ranked_team_ids(self, metric: RankingMetric) -> list[int]:
+        return list(TeamRanking.objects.filter(metric=metric).order_by("rank").values_list("team_id", flat=True))
+
+    def test_ranks_player_teams_by_each_metric(self):
+        self.assertEqual(4, rebuild_rankings())
+
+        team_ids = [team.id for team in self.teams]
+        # Ties are broken by team id
+        self.assertEqual([team_ids[0], team_ids[2], team_ids[1], team_ids[3]], self._ranked_team_ids("wins"))
+        self.assertEqual([team_ids[1], team_ids[0], team_ids[2], team_ids[3]], self._ranked_team_ids("win_rate"))
+        self.assertEqual([team_ids[1], team_ids[0], team_ids[2], team_ids[3]], self._ranked_team_ids("coins"))
+        self.assertEqual(4 * len(RankingMetric), TeamRanking.objects.count())
+
+    def test_rebuild_replaces_previous_rankings(self):
+        rebuild_rankings()
+        Team.objects.filter(id=self.teams[3].id).update(wins=100)
+
+        rebuild_rankings()
+
+        self.assertEqual(self.teams[3].id, self._ranked_team_ids("wins")[0])
+        self.assertEqual(4 * len(RankingMetric), TeamRanking.objects.count())
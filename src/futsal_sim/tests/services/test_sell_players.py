@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from src.futsal_sim.models import TeamSheet
+from src.futsal_sim.services.business_models import TeamSheetPosition
+from src.futsal_sim.services.factories import PlayerFactory
+from src.futsal_sim.services.team_service import TeamCRUDService, team_sell_players
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class SellPlayersSheetsTests(TestCase):
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Sell FC")
+        PlayerFactory(team=self.team, lower_b=10, upper_b=20).create_players(5)
+        self.players = list(self.team.players.order_by("id"))
+
+    def _create_sheets(self, amount: int) -> list[TeamSheet]:
+        return [
+            TeamSheetCRUDService(team=self.team).teamsheet_create(
+                name=f"Sheet {i}",
+                right_attacker=self.players[0].id,
+                left_attacker=self.players[1].id,
+                right_defender=self.players[2].id,
+                left_defender=self.players[3].id,
+                goalkeeper=self.players[4].id,
+            )
+            for i in range(amount)
+        ]
+
+    def test_all_slots_of_sold_players_are_emptied(self):
+        sheets = self._create_sheets(3)
+
+        team_sell_players(
+            team=self.team, player_ids=[self.players[0].id, self.players[3].id, self.players[4].id], user=self.user
+        )
+
+        for sheet in sheets:
+            sheet.refresh_from_db()
+            self.assertEqual(
+                [None, self.players[1], self.players[2], None, None],
+                sheet.players,
+            )
+
+    @staticmethod
+    def _count_sheet_queries(ctx: CaptureQueriesContext) -> int:
+        # Only the sheet queries, the team is saved only when its skills changed
+        return sum(1 for query in ctx.captured_queries if '"futsal_sim_teamsheet"' in query["sql"])
+
+    def test_query_count_does_not_depend_on_sheet_amount(self):
+        self._create_sheets(1)
+        with CaptureQueriesContext(connection) as ctx:
+            team_sell_players(team=self.team, player_ids=[self.players[0].id], user=self.user)
+        self.assertEqual(len(TeamSheetPosition), self._count_sheet_queries(ctx))
+
+        self._create_sheets(10)
+        with CaptureQueriesContext(connection) as ctx:
+            team_sell_players(team=self.team, player_ids=[self.players[1].id, self.players[2].id], user=self.user)
+        self.assertEqual(len(TeamSheetPosition), self._count_sheet_queries(ctx))
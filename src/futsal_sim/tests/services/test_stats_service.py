@@ -0,0 +1,111 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from src.futsal_sim.constants import TEAM_FORM_MATCH_AMOUNT
+from src.futsal_sim.models import MatchGoal, Player, PlayerSeasonStats, Team, TeamStats
+from src.futsal_sim.services.match_service import (
+    play_match_against_cpu,
+    play_matches_against_cpu,
+)
+from src.futsal_sim.services.team_service import TeamCRUDService
+from src.futsal_sim.services.teamsheet_service import TeamSheetCRUDService
+from src.users.services import user_create
+
+
+class StatsServiceTests(TestCase):
+    MATCH_AMOUNT = 8
+
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Stats FC")
+        players = list(self.team.players.order_by("id"))
+        self.team_sheet = TeamSheetCRUDService(team=self.team).teamsheet_create(
+            name="Sheet",
+            right_attacker=players[0].id,
+            left_attacker=players[1].id,
+            right_defender=players[2].id,
+            left_defender=players[3].id,
+            goalkeeper=players[4].id,
+        )
+        self.match_results = [
+            play_match_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5)
+            for _ in range(self.MATCH_AMOUNT)
+        ]
+
+    @staticmethod
+    def _stats_snapshot() -> tuple[list, list]:
+        team_stats = TeamStats.objects.order_by("team_id").values_list(
+            "team_id",
+            "matches_played",
+            "wins",
+            "draws",
+            "loses",
+            "goals_for",
+            "goals_against",
+            "clean_sheets",
+            "coins_earned",
+            "form",
+        )
+        player_stats = PlayerSeasonStats.objects.order_by("team_id", "player_id").values_list(
+            "team_id", "player_id", "matches_played", "goals", "assists"
+        )
+        return list(team_stats), list(player_stats)
+
+    def test_team_stats_follow_match_results(self):
+        self.team.refresh_from_db()
+        stats = self.team.stats
+
+        self.assertEqual(self.MATCH_AMOUNT, stats.matches_played)
+        self.assertEqual((self.team.wins, self.team.draws, self.team.loses), (stats.wins, stats.draws, stats.loses))
+        self.assertEqual(sum(match.player_goals for match in self.match_results), stats.goals_for)
+        self.assertEqual(sum(match.cpu_goals for match in self.match_results), stats.goals_against)
+        self.assertEqual(sum(match.coins_reward for match in self.match_results), stats.coins_earned)
+
+        newest_first = reversed(self.match_results[-TEAM_FORM_MATCH_AMOUNT:])
+        expected_form = "".join(
+            "W" if match.player_goals > match.cpu_goals else "D" if match.player_goals == match.cpu_goals else "L"
+            for match in newest_first
+        )
+        self.assertEqual(expected_form, stats.form)
+
+    def test_player_stats_follow_goal_moments(self):
+        player_stats = PlayerSeasonStats.objects.filter(team=self.team)
+
+        self.assertEqual(5, player_stats.count())
+        self.assertTrue(all(stats.matches_played == self.MATCH_AMOUNT for stats in player_stats))
+        self.assertEqual(MatchGoal.objects.filter(team=self.team).count(), sum(stats.goals for stats in player_stats))
+
+    def test_rebuild_matches_incremental_stats(self):
+        incremental_stats = self._stats_snapshot()
+        TeamStats.objects.all().delete()
+
+        call_command("rebuild_team_stats", "--chunk-size", "3", stdout=StringIO())
+
+        self.assertEqual(incremental_stats, self._stats_snapshot())
+
+    def test_rebuild_matches_stats_of_batch_matches(self):
+        play_matches_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5, match_amount=6)
+        incremental_stats = self._stats_snapshot()
+
+        call_command("rebuild_team_stats", stdout=StringIO())
+
+        self.assertEqual(incremental_stats, self._stats_snapshot())
+        self.assertEqual(self.MATCH_AMOUNT + 6, TeamStats.objects.get(team=self.team).matches_played)
+
+    def test_pooled_cpu_teams_are_not_written(self):
+        cpu_teams = Team.objects.filter(cputeam__isnull=False).order_by("id")
+        cpu_players = Player.objects.filter(team__cputeam__isnull=False).order_by("id")
+        teams_before = list(cpu_teams.values_list("wins", "draws", "loses", "version"))
+        players_before = list(cpu_players.values_list("matches_played", "goals_scored", "assists_made"))
+
+        match_results = play_matches_against_cpu(player_team_sheet=self.team_sheet, difficulty_rating=5, match_amount=6)
+
+        self.assertEqual(teams_before, list(cpu_teams.values_list("wins", "draws", "loses", "version")))
+        self.assertEqual(
+            players_before, list(cpu_players.values_list("matches_played", "goals_scored", "assists_made"))
+        )
+        cpu_team_ids = {match.cpu_team_id for match in self.match_results + match_results}
+        self.assertFalse(TeamStats.objects.filter(team_id__in=cpu_team_ids).exists())
+        self.assertFalse(PlayerSeasonStats.objects.filter(team_id__in=cpu_team_ids).exists())
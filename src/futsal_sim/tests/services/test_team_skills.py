@@ -0,0 +1,57 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from src.futsal_sim.models import Player, Team
+from src.futsal_sim.services.factories import TeamOpponentFactory
+from src.futsal_sim.services.pack_service import buy_pack
+from src.futsal_sim.services.team_service import (
+    TeamCRUDService,
+    calc_average_skill,
+    calc_team_skill,
+    team_sell_players,
+)
+from src.users.services import user_create
+
+
+class TeamSkillColumnsTests(TestCase):
+    def setUp(self):
+        self.user = user_create(email="testuser@futsal.io", password="123456", is_admin=False)
+        self.team = TeamCRUDService(user=self.user).team_create(name="Skill FC")
+
+    def assertSkillsUpToDate(self, team: Team):
+        team.refresh_from_db()
+        self.assertEqual(calc_team_skill(team), team.team_skill)
+        self.assertEqual(calc_average_skill(team), team.average_skill)
+
+    def test_created_teams_have_skills(self):
+        self.assertSkillsUpToDate(self.team)
+
+        cpu_team, _ = TeamOpponentFactory(player_skill=30, difficulty_rating=5).create_cpu_team()
+        self.assertSkillsUpToDate(cpu_team)
+
+    def test_buy_pack_updates_skills(self):
+        Team.objects.filter(id=self.team.id).update(coins=10_000)
+        for _ in range(5):
+            buy_pack(team=self.team, pack_type="gold")
+
+        self.assertSkillsUpToDate(self.team)
+
+    def test_sell_updates_skills(self):
+        best_player = self.team.players.order_by("-skill").first()
+        team_sell_players(team=self.team, player_ids=[best_player.id], user=self.user)
+
+        self.assertSkillsUpToDate(self.team)
+
+    def test_check_command_reports_and_fixes_stale_skills(self):
+        Player.objects.filter(team=self.team).update(skill=90)
+
+        out = StringIO()
+        call_command("check_team_skills", stdout=out)
+        self.assertIn(f"Team {self.team.id}: team_skill", out.getvalue())
+        self.team.refresh_from_db()
+        self.assertNotEqual(90, self.team.team_skill)
+
+        call_command("check_team_skills", "--fix", stdout=StringIO())
+        self.assertSkillsUpToDate(self.team)
@@ -1,15 +1,21 @@
 from django.urls import path
 from rest_framework_nested import routers
 
-from src.futsal_sim.apis.matches_api import MatchApi
+from src.futsal_sim.apis.leaderboard_api import LeaderboardApi, TeamRankApi
+from src.futsal_sim.apis.matches_api import MatchApi, MatchJobApi
 from src.futsal_sim.apis.packs_api import TeamBuyPackApi
 from src.futsal_sim.apis.players_api import PlayerListApi
+from src.futsal_sim.apis.team_stats_api import TeamStatsApi
 from src.futsal_sim.apis.teams_api import SellPlayersApi, TeamApi
 from src.futsal_sim.apis.teamsheet_api import TeamSheetCRUDApi
 
 urlpatterns = [
+    path("leaderboard/", LeaderboardApi.as_view(), name="leaderboard"),
     path("teams/<int:team_id>/buy-pack/", TeamBuyPackApi.as_view(), name="team-buy-pack"),
     path("teams/<int:team_id>/sell-players/", SellPlayersApi.as_view(), name="team-sell-players"),
+    path("teams/<int:team_id>/stats/", TeamStatsApi.as_view(), name="team-stats"),
+    path("teams/<int:team_id>/match-jobs/<int:job_id>/", MatchJobApi.as_view(), name="team-match-jobs-detail"),
+    path("teams/<int:team_id>/rank/", TeamRankApi.as_view(), name="team-rank"),
 ]
 
 router = routers.SimpleRouter()
@@ -3,6 +3,8 @@ from django.db import transaction
 from django.utils.timezone import get_default_timezone_name
 from django_celery_beat.models import CrontabSchedule, IntervalSchedule, PeriodicTask
 
+from src.tasks.tasks import fail_stale_match_jobs, refill_cpu_pool, refresh_leaderboard
+
 
 class Command(BaseCommand):
     help = """
@@ -10,7 +12,9 @@ class Command(BaseCommand):
 
     Following tasks will be created:
 
-        - ....
+        - refill_cpu_pool, keeps the cpu opponent pool filled
+        - refresh_leaderboard, rebuilds the team rankings
+        - fail_stale_match_jobs, fails match jobs whose worker died
     """
 
     @transaction.atomic
@@ -38,7 +42,47 @@ class Command(BaseCommand):
             'enabled': True
         },
         """
-        periodic_tasks_data = []
+        periodic_tasks_data = [
+            {
+                "task": refill_cpu_pool,
+                "name": "Refill cpu opponent pool",
+                # Every 30 minutes
+                "cron": {
+                    "minute": "*/30",
+                    "hour": "*",
+                    "day_of_week": "*",
+                    "day_of_month": "*",
+                    "month_of_year": "*",
+                },
+                "enabled": True,
+            },
+            {
+                "task": refresh_leaderboard,
+                "name": "Refresh team leaderboard",
+                # Every 10 minutes
+                "cron": {
+                    "minute": "*/10",
+                    "hour": "*",
+                    "day_of_week": "*",
+                    "day_of_month": "*",
+                    "month_of_year": "*",
+                },
+                "enabled": True,
+            },
+            {
+                "task": fail_stale_match_jobs,
+                "name": "Fail stale match jobs",
+                # Every 5 minutes
+                "cron": {
+                    "minute": "*/5",
+                    "hour": "*",
+                    "day_of_week": "*",
+                    "day_of_month": "*",
+                    "month_of_year": "*",
+                },
+                "enabled": True,
+            },
+        ]
 
         timezone = get_default_timezone_name()
 
@@ -1,6 +1,32 @@
+from dataclasses import asdict
+
 from celery import shared_task
 
+from src.futsal_sim.services import cpu_pool_service, match_job_service, ranking_service
+
 
 @shared_task
 def debug_task(self):
     print("Request: {0!r}".format(self.request))
+
+
+@shared_task
+def refill_cpu_pool():
+    stats = cpu_pool_service.refill_cpu_pool()
+    return asdict(stats)
+
+
+@shared_task
+def refresh_leaderboard():
+    return ranking_service.rebuild_rankings()
+
+
+@shared_task
+def play_match_job(job_id: int):
+    job = match_job_service.match_job_run(job_id=job_id)
+    return job.status
+
+
+@shared_task
+def fail_stale_match_jobs():
+    return match_job_service.match_job_fail_stale()
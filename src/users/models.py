@@ -3,7 +3,8 @@ import uuid
 from django.contrib.auth.models import AbstractBaseUser
 from django.contrib.auth.models import BaseUserManager as BUM
 from django.contrib.auth.models import PermissionsMixin
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 
 from src.common.models import BaseModel
 
@@ -75,5 +76,28 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email
 
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        """
+        Key of the user in the cache authentication reads users from, see user_get_cached.
+        """
+        return f"user:{user_id}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        user_id = self.pk
+        result = super().delete(*args, **kwargs)
+        cache.delete(User.cache_key(user_id))
+        return result
+
+    def _invalidate_cache(self):
+        key = User.cache_key(self.pk)
+        cache.delete(key)
+        # Once more after the commit, a concurrent request could have cached the old row meanwhile
+        transaction.on_commit(lambda: cache.delete(key))
+
     def is_staff(self):
         return self.is_admin
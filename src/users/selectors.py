@@ -1,3 +1,7 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models.query import QuerySet
 
 from src.users.filters import BaseUserFilter
@@ -10,3 +14,20 @@ def user_list(*, filters=None) -> QuerySet[User]:
     qs = User.objects.all()
 
     return BaseUserFilter(filters, qs).qs
+
+
+def user_get_cached(*, user_id: int) -> Optional[User]:
+    """
+    User of authenticated requests, cached for AUTH_USER_CACHE_TIMEOUT seconds, read from the database when it's 0.
+    Every save of the user deletes it from the cache, e.g. when auth_logout rotates the jwt_key.
+    """
+    if settings.AUTH_USER_CACHE_TIMEOUT <= 0:
+        return User.objects.filter(id=user_id).first()
+
+    key = User.cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = User.objects.filter(id=user_id).first()
+        if user is not None:
+            cache.set(key, user, timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+    return user